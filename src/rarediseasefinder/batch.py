@@ -0,0 +1,91 @@
+"""
+Ejecución de un workflow para una lista de genes desde la línea de comandos.
+
+Guarda un informe JSON por gen y un resumen (summary.json) en la carpeta de salida. Los genes se
+procesan en paralelo y las peticiones compartidas entre genes se hacen una sola vez (ver BatchRunner).
+
+Uso:
+    python -m rarediseasefinder.batch --genes FANCA TTR KCNA2
+    python -m rarediseasefinder.batch --workflow NoPharosWorkflow --genes-file panel.txt --output-dir informes --workers 8
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .core.constants import BATCH_MAX_WORKERS
+from .orchestrator.BatchRunner import BatchRunner
+
+WORKFLOWS = ("FullWorkflow", "NoPharosWorkflow", "NoPantherWorkflow")
+
+
+def create_workflow(workflow_name: str):
+    """
+    Crea el workflow indicado con sus filtros por defecto.
+
+    Args:
+        workflow_name (str): Nombre del workflow (uno de WORKFLOWS).
+
+    Returns:
+        IWorkflow: Workflow en stage_1.
+    """
+    if workflow_name == "NoPharosWorkflow":
+        from .orchestrator.Workflows.NoPharosWorkflow import NoPharosWorkflow
+        return NoPharosWorkflow()
+    if workflow_name == "NoPantherWorkflow":
+        from .orchestrator.Workflows.NoPantherWorkflow import NoPantherWorkflow
+        return NoPantherWorkflow()
+    from .orchestrator.Workflows.FullWorkflow import FullWorkflow
+    return FullWorkflow()
+
+
+def read_genes(genes: Optional[List[str]], genes_file: Optional[str]) -> List[str]:
+    """
+    Reúne los genes de la línea de comandos y del fichero (uno por línea o separados por comas;
+    las líneas que empiezan por # se ignoran).
+
+    Args:
+        genes (List[str], optional): Genes indicados con --genes.
+        genes_file (str, optional): Ruta del fichero indicado con --genes-file.
+
+    Returns:
+        List[str]: Lista de genes.
+    """
+    result = list(genes or [])
+    if genes_file:
+        with open(genes_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    result.extend(gene.strip() for gene in line.split(","))
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Ejecuta un workflow para una lista de genes")
+    parser.add_argument("--workflow", choices=WORKFLOWS, default="FullWorkflow", help="Workflow a ejecutar")
+    parser.add_argument("--genes", nargs="+", help="Símbolos de los genes")
+    parser.add_argument("--genes-file", help="Fichero con los símbolos de los genes")
+    parser.add_argument("--output-dir", default=None,
+                        help="Carpeta de los informes y del resumen (por defecto tests/batch_<workflow>_<fecha>)")
+    parser.add_argument("--workers", type=int, default=BATCH_MAX_WORKERS, help="Genes procesados a la vez")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ejecutar todos los genes aunque haya un informe reciente de la misma búsqueda")
+    args = parser.parse_args(argv)
+
+    try:
+        genes = BatchRunner.normalize_genes(read_genes(args.genes, args.genes_file))
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    def print_progress(gene: str, status: str, elapsed: Optional[float]) -> None:
+        if status not in ("queued", "running"):
+            print(f"\033[94m[{status}] {gene}" + (f" ({elapsed} s)" if elapsed is not None else "") + "\033[0m")
+
+    runner = BatchRunner(create_workflow(args.workflow), max_workers=args.workers, use_report_cache=not args.refresh)
+    summary = runner.run(genes, output_dir=args.output_dir, progress_callback=print_progress)
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,5 @@
 from typing import Dict, Any, List
 import pandas as pd
-from bs4 import BeautifulSoup
 
 from ...core.BaseParser import BaseParser
 from ...core.constants import NOT_FOUND_MESSAGE, DRUG_CENTRAL_BASE_URL
@@ -70,6 +69,8 @@ class DrugCentralParser(BaseParser):
         Returns:
             List[Dict[str, str]]: Lista de medicamentos con sus datos
         """
+        from bs4 import BeautifulSoup  # Se importa al parsear el primer HTML
+
         resultados = []
         soup = BeautifulSoup(html, 'html.parser')
         
@@ -10,6 +10,8 @@ class DrugCentralProcessor(BaseProcessor):
     Processor para coordinar la obtención y transformación de datos de DrugCentral.
     """
     
+    RETRIEVER_CLASS = DrugCentralScraper
+
     def __init__(self):
         """
         Inicializa el processor de DrugCentral con el scraper y el parser apropiados.
@@ -18,7 +20,8 @@ class DrugCentralProcessor(BaseProcessor):
         parser = DrugCentralParser()
         super().__init__(scraper, parser)
     
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Obtiene un diccionario que mapea claves de filtros a nombres de métodos del parser.
 
@@ -2,10 +2,7 @@
 Módulo para gestionar la extracción de datos de DrugCentral mediante web scraping.
 """
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ...core.BaseScraper import BaseScraper
 
@@ -21,9 +18,31 @@ class DrugCentralScraper(BaseScraper):
         """
         super().__init__("https://drugcentral.org")
     
+    def _fetch_static_html(self, url: str, *markers: str) -> Optional[str]:
+        """
+        Descarga una página de DrugCentral por HTTP (sesión del SessionPool), sin navegador.
+        DrugCentral renderiza las tablas de resultados en el servidor, por lo que no hace falta Chrome.
+        
+        Args:
+            url (str): URL de la página
+            *markers (str): Fragmentos de los que al menos uno debe aparecer en el HTML para considerarlo completo
+        
+        Returns:
+            Optional[str]: HTML de la página o None si no contiene ninguno de los fragmentos esperados
+        """
+        try:
+            response = self._http_response(url)
+        except Exception as e:
+            print(f"⚠️ Error al descargar {url} sin navegador: {str(e)}")
+            return None
+        if response.status_code != 200 or not any(marker in response.text for marker in markers):
+            return None
+        return response.text
+
     def fetch(self, id: str) -> Dict[str, Any]:
         """
         Busca un término en DrugCentral y devuelve el HTML de los resultados.
+        Primero se descarga la página por HTTP; Chrome solo se usa si no contiene la tabla de resultados.
         
         Args:
             id (str): Identificador para la búsqueda (proteína, gen, etc.)
@@ -31,27 +50,46 @@ class DrugCentralScraper(BaseScraper):
         Returns:
             Dict[str, Any]: HTML de resultados o mensaje de error
         """
+        search_url = f"{self.BASE_URL}/?q={id}"
+        html = self._fetch_static_html(search_url, "<table", "No results found")
+        if html is not None:
+            return {"html": html, "search_term": id}
+
         if not self.ok():
             return {"error": "Error al inicializar Chrome driver"}
+
+        # Selenium solo se importa si hace falta recurrir al navegador
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
             
         try:
-            search_url = f"{self.BASE_URL}/?q={id}"
-            self.driver.get(search_url)
-            
-            # Esperar a que cargue la tabla de resultados o un mensaje de no resultados
-            WebDriverWait(self.driver, 3).until(
-                lambda d: d.find_element(By.TAG_NAME, "table") or 
-                          d.find_element(By.XPATH, "//div[contains(text(), 'No results found')]")
-            )
-            
-            html = self.driver.page_source
+            with self.lease_driver() as driver:
+                driver.get(search_url)
+                
+                # Esperar a que cargue la tabla de resultados o un mensaje de no resultados
+                WebDriverWait(driver, 3).until(
+                    lambda d: d.find_element(By.TAG_NAME, "table") or 
+                              d.find_element(By.XPATH, "//div[contains(text(), 'No results found')]")
+                )
+                
+                html = driver.page_source
             return {"html": html, "search_term": id}
                 
         except Exception as e:
+            # El navegador usado se descarta al salir del bloque con la excepción
             print(f"❌ Error al buscar en DrugCentral: {str(e)}")
-            self.reset_driver()
             return {"error": str(e)}
     
+    def _ping_logic(self) -> int:
+        """
+        Verifica la disponibilidad de DrugCentral. Las búsquedas se hacen por HTTP,
+        por lo que no se requiere que Chrome esté disponible.
+        
+        Returns:
+            int: Código de estado HTTP si la conexión es exitosa, 999 si falla.
+        """
+        return self._ping_url(self.BASE_URL)
+    
     def fetch_drug_details(self, drug_id: str, search_term: str) -> Dict[str, Any]:
         """
         Obtiene detalles adicionales de un medicamento específico.
@@ -63,22 +101,31 @@ class DrugCentralScraper(BaseScraper):
         Returns:
             Dict[str, Any]: HTML con detalles del medicamento
         """
+        detail_url = f"{self.BASE_URL}/drugcard/{drug_id}?q={search_term}"
+        html = self._fetch_static_html(detail_url, "card-title")
+        if html is not None:
+            return {"html": html, "drug_id": drug_id}
+
         if not self.ok():
             return {"error": "Error al inicializar Chrome driver"}
+
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
             
         try:
-            detail_url = f"{self.BASE_URL}/drugcard/{drug_id}?q={search_term}"
-            self.driver.get(detail_url)
-            
-            # Esperar a que cargue la información del medicamento
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "card-title"))
-            )
-            
-            html = self.driver.page_source
+            with self.lease_driver() as driver:
+                driver.get(detail_url)
+                
+                # Esperar a que cargue la información del medicamento
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "card-title"))
+                )
+                
+                html = driver.page_source
             return {"html": html, "drug_id": drug_id}
                 
         except Exception as e:
+            # El navegador usado se descarta al salir del bloque con la excepción
             print(f"❌ Error al obtener detalles del medicamento: {str(e)}")
-            self.reset_driver()
             return {"error": str(e)}
\ No newline at end of file
@@ -2,18 +2,23 @@
 Módulo de cliente para la API de Ensembl.
 Proporciona clases y métodos para consultar datos de genes vía REST.
 """
+from typing import Dict, Iterable
 
 from ...core.BaseClient import BaseClient
+from ...core.ResponseCache import ResponseCache
+from ...core.constants import ENSEMBL_BATCH_SIZE
+from ...core.errors import BaseHTTPError, BaseParsingError
 
 
 class EnsemblClient(BaseClient):
     """
     Cliente para interactuar con la API REST de Ensembl.
-    Permite construir URLs de consulta y obtener datos de genes por su nombre.
+    Permite construir URLs de consulta y obtener datos de genes por su nombre, uno a uno o por lotes.
     """
     #url example https://grch37.rest.ensembl.org/lookup/symbol/homo_sapiens/FANCA?content-type=application/json;expand=1
     path_url = "https://grch37.rest.ensembl.org/lookup/symbol/homo_sapiens/"
     query_url = "?content-type=application/json;expand=1"
+    query_url_no_expand = "?content-type=application/json"
 
     def __init__(self):
         """
@@ -21,26 +26,65 @@ class EnsemblClient(BaseClient):
         """
         pass
 
-    def _create_url_string(self, gen_term: str) -> str:
+    def _create_url_string(self, gen_term: str, expand: bool = True) -> str:
         """
         Construye la URL para consultar un gen en Ensembl.
         Args:
             gen_term (str): Nombre del gen a consultar.
+            expand (bool): Si se piden también los tránscritos y exones del gen.
         Returns:
             str: URL completa para la consulta.
         """
-        return str(self.path_url + gen_term + self.query_url)
+        return str(self.path_url + gen_term + (self.query_url if expand else self.query_url_no_expand))
 
-    def fetch(self, id: str) -> dict:
+    def fetch(self, id: str, expand: bool = True) -> dict:
         """
         Obtiene los datos de un gen desde Ensembl usando su nombre.
         Args:
-            gen_term (str): Nombre del gen a consultar.
+            id (str): Nombre del gen a consultar.
+            expand (bool): Si se piden también los tránscritos y exones del gen.
         Returns:
             dict: Datos obtenidos de la API de Ensembl.
         """
-        url = self._create_url_string(id)
+        url = self._create_url_string(id, expand)
         return self._get_data(url)
+
+    def fetch_batch(self, ids: Iterable[str], expand: bool = False) -> Dict[str, dict]:
+        """
+        Obtiene los datos de varios genes con el endpoint POST lookup/symbol, en lotes de
+        ENSEMBL_BATCH_SIZE símbolos. Cada resultado se guarda también en la caché de respuestas
+        como respuesta de su consulta individual, de modo que un fetch posterior del mismo gen
+        no vuelve a llamar a Ensembl.
+        Args:
+            ids (Iterable[str]): Nombres de los genes a consultar.
+            expand (bool): Si se piden también los tránscritos y exones de los genes.
+        Returns:
+            Dict[str, dict]: Datos de cada gen encontrado, indexados por su nombre.
+        Raises:
+            BaseHTTPError: Si Ensembl devuelve un código de error.
+            BaseParsingError: Si la respuesta no es un JSON válido.
+        """
+        symbols = list(dict.fromkeys(ids))
+        url = self.path_url.rstrip("/") + (self.query_url if expand else self.query_url_no_expand)
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        cache = ResponseCache.get_instance()
+
+        results = {}
+        for start in range(0, len(symbols), ENSEMBL_BATCH_SIZE):
+            batch = symbols[start:start + ENSEMBL_BATCH_SIZE]
+            response = self._post_data(url, json={"symbols": batch}, headers=headers)
+            if response.status_code != 200:
+                raise BaseHTTPError(f"HTTP error: {response.status_code} en la consulta por lotes a Ensembl")
+            try:
+                batch_data = response.json()
+            except ValueError as e:
+                raise BaseParsingError(f"JSON inválido: {e}")
+
+            for symbol, data in batch_data.items():
+                if data:
+                    results[symbol] = data
+                    cache.store_json("GET", self._create_url_string(symbol, expand), data)
+        return results
     
     def _ping_logic(self) -> int:
         """
@@ -52,11 +96,7 @@ class EnsemblClient(BaseClient):
         server = "https://grch37.rest.ensembl.org"
         ext = "/info/ping?"
         url = server+ext
-        if self._try_connection(url):
-            response = EnsemblClient._http_response(url)
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(url)
 
     def check_data(self):
         """
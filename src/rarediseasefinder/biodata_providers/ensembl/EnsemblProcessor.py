@@ -4,7 +4,7 @@ EnsemblProcessor.py
 Módulo para procesar datos de Ensembl usando EnsemblClient y EnsemblParser.
 """
 
-from typing import Dict
+from typing import Any, Dict, Hashable, Iterable
 
 from .EnsemblClient import EnsemblClient
 from .EnsemblParser import EnsemblParser
@@ -16,6 +16,12 @@ class EnsemblProcessor(BaseProcessor):
     Clase para procesar datos de Ensembl utilizando EnsemblClient y EnsemblParser.
     Permite obtener el identificador Ensembl de un gen dado su nombre.
     """
+    # Métodos del parser que necesitan los tránscritos y exones del gen (expand=1).
+    # Los actuales solo usan el identificador del gen.
+    EXPAND_METHODS = set()
+
+    RETRIEVER_CLASS = EnsemblClient
+
     def __init__(self):
         """
         Inicializa el procesador con cliente y parser de Ensembl.
@@ -24,7 +30,8 @@ class EnsemblProcessor(BaseProcessor):
         self.parser = EnsemblParser()
         super().__init__(self.client,self.parser)
 
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Retorna un mapeo de métodos de parser a las claves de datos.
 
@@ -34,4 +41,55 @@ class EnsemblProcessor(BaseProcessor):
         return {
             "ensembl_id": "parse_id",
             "external_links": "parse_external_links",
-        }
\ No newline at end of file
+        }
+
+    def needs_expand(self, filters: list) -> bool:
+        """
+        Indica si alguno de los métodos seleccionados necesita los tránscritos y exones del gen.
+
+        Args:
+            filters (list): Filtros del procesador.
+
+        Returns:
+            bool: True si hay que consultar Ensembl con expand=1.
+        """
+        return any(method_name in self.EXPAND_METHODS for method_name in self.get_selected_methods(filters))
+
+    def get_retrieve_key(self, filters: list) -> Hashable:
+        """
+        Devuelve si retrieve pide los tránscritos, para compartir solo las búsquedas que piden lo mismo.
+
+        Args:
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Hashable: Valor de expand.
+        """
+        return self.needs_expand(filters)
+
+    def retrieve(self, search_id: Any, filters: list) -> Dict[str, Any]:
+        """
+        Consulta el gen en Ensembl pidiendo los tránscritos solo si los usan los métodos seleccionados.
+
+        Args:
+            search_id (Any): Nombre del gen.
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Dict[str, Any]: Datos del gen.
+        """
+        return self.client.fetch(search_id, expand=self.needs_expand(filters))
+
+    def prefetch(self, gene_names: Iterable[str], filters: list) -> Dict[str, Any]:
+        """
+        Consulta varios genes en una sola petición por lotes y deja cada resultado en la caché de
+        respuestas para las búsquedas individuales posteriores.
+
+        Args:
+            gene_names (Iterable[str]): Nombres de los genes.
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Dict[str, Any]: Datos de cada gen encontrado, indexados por su nombre.
+        """
+        return self.client.fetch_batch(gene_names, expand=self.needs_expand(filters))
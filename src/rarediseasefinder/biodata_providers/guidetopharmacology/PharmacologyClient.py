@@ -1,14 +1,31 @@
-from typing import Dict, Any
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 
 from ...core.BaseClient import BaseClient
+from ...core.ResponseCache import ResponseCache
+from ...core.constants import GTOP_TARGET_INDEX_TTL
 
 
 class PharmacologyClient(BaseClient):
     """
     Cliente para comunicarse con la API de Guide to Pharmacology.
+
+    Los targetId se buscan en un índice local (abreviatura del target → targetId) que se construye
+    a partir de la lista completa de targets, se guarda en la caché persistente (ResponseCache) y se
+    reconstruye cuando tiene más de GTOP_TARGET_INDEX_TTL segundos. El índice se comparte entre
+    todas las instancias del proceso.
     """
     
     BASE_URL = "https://www.guidetopharmacology.org/services"
+    INDEX_NAMESPACE = "guidetopharmacology-index"
+
+    _index: Optional[Dict[str, Dict[str, int]]] = None
+    _index_built_at: float = 0.0
+    _index_lock = threading.Lock()
     
     def __init__(self):
         """
@@ -23,11 +40,7 @@ class PharmacologyClient(BaseClient):
         Returns:
             int: Código de estado HTTP si la conexión es exitosa, 999 si falla.
         """
-        if self._try_connection(f"{self.BASE_URL}/targets"):
-            response = self._http_response(f"{self.BASE_URL}/targets")
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(f"{self.BASE_URL}/targets")
     
     def _create_url_string(self, endpoint: str) -> str:
         """
@@ -40,6 +53,100 @@ class PharmacologyClient(BaseClient):
             str: URL completa para la consulta a Guide to Pharmacology.
         """
         return f"{self.BASE_URL}/{endpoint}"
+
+    @staticmethod
+    def normalize(symbol: str) -> str:
+        """
+        Normaliza un símbolo para buscarlo en el índice (sin etiquetas HTML ni espacios, en minúsculas).
+        
+        Args:
+            symbol (str): Símbolo o abreviatura del target.
+            
+        Returns:
+            str: Símbolo normalizado.
+        """
+        return re.sub(r"<[^>]+>|\s+", "", symbol or "").casefold()
+
+    def _build_index(self) -> Dict[str, Dict[str, int]]:
+        """
+        Descarga la lista de targets y construye el índice por abreviatura.
+        
+        Returns:
+            Dict[str, Dict[str, int]]: targetId por abreviatura exacta ("exact") y normalizada ("normalized").
+                En ambos casos se conserva el primer target de la lista.
+        """
+        targets_data = self._get_data(self._create_url_string("targets"), use_cache=False)
+        index = {"exact": {}, "normalized": {}}
+        for target in targets_data:
+            abbreviation = target.get("abbreviation")
+            target_id = target.get("targetId")
+            if not abbreviation or target_id is None:
+                continue
+            index["exact"].setdefault(abbreviation, target_id)
+            index["normalized"].setdefault(self.normalize(abbreviation), target_id)
+        return index
+
+    def _get_index(self) -> Dict[str, Dict[str, int]]:
+        """
+        Devuelve el índice de targets, cargándolo de la caché persistente o reconstruyéndolo si ha caducado.
+        
+        Returns:
+            Dict[str, Dict[str, int]]: Índice de targets (ver _build_index).
+        """
+        cls = type(self)
+        if cls._index is not None and time.time() - cls._index_built_at <= GTOP_TARGET_INDEX_TTL:
+            return cls._index
+        with cls._index_lock:
+            if cls._index is not None and time.time() - cls._index_built_at <= GTOP_TARGET_INDEX_TTL:
+                return cls._index
+            cache = ResponseCache.get_instance()
+            key = cache.make_key("targets")
+            entry = cache.get(self.INDEX_NAMESPACE, key, ttl=GTOP_TARGET_INDEX_TTL)
+            if entry is not None:
+                payload, meta = entry
+                index, built_at = json.loads(payload), meta.get("built_at", time.time())
+            else:
+                index, built_at = self._build_index(), time.time()
+                cache.put(self.INDEX_NAMESPACE, key, json.dumps(index).encode("utf-8"), {"built_at": built_at})
+            cls._index, cls._index_built_at = index, built_at
+        return cls._index
+
+    def _search_gene_symbol(self, symbol: str) -> Optional[int]:
+        """
+        Busca en Guide to Pharmacology el target humano de un símbolo HGNC.
+        
+        Args:
+            symbol (str): Símbolo HGNC del gen.
+            
+        Returns:
+            Optional[int]: targetId del primer resultado o None si no hay resultados.
+        """
+        try:
+            targets_data = self._get_data(self._create_url_string(f"targets?geneSymbol={symbol}&species=Human"))
+        except Exception:
+            return None
+        if isinstance(targets_data, list) and targets_data:
+            return targets_data[0].get("targetId")
+        return None
+
+    def get_target_id(self, symbol: str) -> Optional[int]:
+        """
+        Obtiene el targetId de un símbolo de gen: por abreviatura exacta, por abreviatura normalizada
+        y, si no aparece en el índice, por símbolo HGNC en la API.
+        
+        Args:
+            symbol (str): Símbolo del gen.
+            
+        Returns:
+            Optional[int]: targetId o None si no se encuentra.
+        """
+        index = self._get_index()
+        target_id = index["exact"].get(symbol)
+        if target_id is None:
+            target_id = index["normalized"].get(self.normalize(symbol))
+        if target_id is None:
+            target_id = self._search_gene_symbol(symbol)
+        return target_id
     
     def fetch(self, id: str) -> Dict[str, Any]:
         """
@@ -52,29 +159,23 @@ class PharmacologyClient(BaseClient):
             Dict[str, Any]: Datos obtenidos de Guide to Pharmacology
         """
         # 1. Primero obtener el targetId a partir del símbolo
-        url_targets = self._create_url_string("targets")
-        targets_data = self._get_data(url_targets)
-            
-        target_id = None
-        for target in targets_data:
-            if target.get("abbreviation") == id:
-                target_id = target.get("targetId")
-                break
+        target_id = self.get_target_id(id)
             
         if not target_id:
             return {
                 "error": f"No se encontró el símbolo de gen '{id}' en Guide to Pharmacology."
             }
             
-        # 2. Obtener los comentarios para el targetId
+        # 2. Obtener a la vez los comentarios y las interacciones y referencias para el targetId
         url_comments = self._create_url_string(f"targets/{target_id}/comments")
-        comments_data = self._get_data(url_comments)
-            
-        # 3. Obtener las interacciones y referencias para el targetId
         url_interactions = self._create_url_string(f"targets/{target_id}/interactions")
-        interactions_data = self._get_data(url_interactions)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            comments_future = pool.submit(self._get_data, url_comments)
+            interactions_future = pool.submit(self._get_data, url_interactions)
+            comments_data = comments_future.result()
+            interactions_data = interactions_future.result()
             
-        # 4. Devolver todos los datos obtenidos
+        # 3. Devolver todos los datos obtenidos
         return {
             "target_id": target_id,
             "comments": comments_data,
@@ -86,4 +187,4 @@ class PharmacologyClient(BaseClient):
         """
         Placeholder para lógica de validación de los datos obtenidos.
         """
-        pass
\ No newline at end of file
+        pass
@@ -10,6 +10,8 @@ class PharmacologyProcessor(BaseProcessor):
     Processor para coordinar la obtención y transformación de datos de Guide to Pharmacology.
     """
     
+    RETRIEVER_CLASS = PharmacologyClient
+
     def __init__(self):
         """
         Inicializa el processor de Guide to Pharmacology con el client y el parser apropiados.
@@ -18,7 +20,8 @@ class PharmacologyProcessor(BaseProcessor):
         parser = PharmacologyParser()
         super().__init__(client, parser)
     
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Obtiene un diccionario que mapea claves de filtros a nombres de métodos del parser.
 
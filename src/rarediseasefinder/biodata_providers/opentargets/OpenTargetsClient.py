@@ -2,11 +2,13 @@
 Módulo de cliente para la API GraphQL de OpenTargets.
 Proporciona métodos para consultar información de genes y dianas terapéuticas.
 """
-from typing import Dict
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 import requests
 
 from ...core.BaseClient import BaseClient
+from ...core.constants import OPENTARGETS_PAGE_SIZE, OPENTARGETS_MAX_ROWS
 from ...core.errors import BaseParsingError
 
 
@@ -17,31 +19,38 @@ class OpenTargetsClient(BaseClient):
     """
     
     GRAPHQL_URL = "https://api.platform.opentargets.org/api/v4/graphql"
-    
-    def _get_gene_query(self, ensembl_id: str) -> Dict[str, str]:
-        """
-        Construye la consulta GraphQL para obtener información de un gen por su ID de Ensembl.
-        
-        Args:
-            ensembl_id (str): ID de Ensembl del gen a consultar.
-            
-        Returns:
-            Dict[str, str]: Consulta GraphQL y variables.
-        """
-        query = """
-        query GetGeneInfo($ensemblId: String!) {
-            target(ensemblId: $ensemblId) {
-                id
-                approvedSymbol
-                approvedName
+
+    # Bloques de la consulta GraphQL del target. Cada método del parser solo necesita algunos
+    # (ver OpenTargetsProcessor.METHOD_QUERY_FIELDS); el resto no se piden a OpenTargets.
+    QUERY_FIELDS = {
+        "function_descriptions": """
                 functionDescriptions
+        """,
+        "pathways": """
                 pathways {
                     pathwayId
                     pathway
                     topLevelTerm
                 }
-                knownDrugs {
-                    rows {
+        """,
+        "mouse_phenotypes": """
+                mousePhenotypes {
+                    modelPhenotypeLabel
+                    biologicalModels {
+                        literature
+                    }
+                }
+        """,
+    }
+
+    # Bloques paginados: se piden por páginas de OPENTARGETS_PAGE_SIZE filas hasta
+    # OPENTARGETS_MAX_ROWS filas. knownDrugs se pagina por cursor y el resto por índice de página.
+    PAGINATED_QUERY_FIELDS = {
+        "known_drugs": {
+            "connection": "knownDrugs",
+            "pagination": "cursor",
+            "arguments": "",
+            "rows": """
                         drugId
                         prefName
                         mechanismOfAction
@@ -50,40 +59,109 @@ class OpenTargetsClient(BaseClient):
                             name
                             id
                         }
-                    }
-                }
-                associatedDiseases {
-                    rows {
+            """,
+        },
+        "associated_diseases": {
+            "connection": "associatedDiseases",
+            "pagination": "page",
+            "arguments": "",
+            "rows": """
                         disease {
                             id
                             name
                             description
                         }
                         score
-                    }
-                }
-                interactions(scoreThreshold: 0.8) {
-                    count
-                    rows {
+            """,
+        },
+        "interactions": {
+            "connection": "interactions",
+            "pagination": "page",
+            "arguments": "scoreThreshold: 0.8",
+            "rows": """
                         intA
                         intB
                         score
-                    }
-                }
-                mousePhenotypes {
-                    modelPhenotypeLabel
-                    biologicalModels {
-                        literature
-                    }
-                }
+            """,
+        },
+    }
+
+    def _get_connection_block(self, field: str, page_index: int = 0, cursor: Optional[str] = None) -> str:
+        """
+        Construye el bloque GraphQL de una página de un campo paginado.
+        
+        Args:
+            field (str): Clave de PAGINATED_QUERY_FIELDS.
+            page_index (int): Índice de la página (campos paginados por página).
+            cursor (str, optional): Cursor devuelto por la página anterior (campos paginados por cursor).
+            
+        Returns:
+            str: Bloque GraphQL del campo.
+        """
+        spec = self.PAGINATED_QUERY_FIELDS[field]
+        arguments = [spec["arguments"]] if spec["arguments"] else []
+        if spec["pagination"] == "cursor":
+            arguments += [f"size: {OPENTARGETS_PAGE_SIZE}", f"cursor: {json.dumps(cursor)}"]
+            page_fields = "count\n                    cursor"
+        else:
+            arguments.append(f"page: {{ index: {page_index}, size: {OPENTARGETS_PAGE_SIZE} }}")
+            page_fields = "count"
+        return f"""
+                {spec["connection"]}({", ".join(arguments)}) {{
+                    {page_fields}
+                    rows {{{spec["rows"]}}}
+                }}
+        """
+
+    def _build_query(self, ensembl_id: str, blocks: str) -> Dict[str, str]:
+        """
+        Envuelve los bloques indicados en la consulta del target.
+        
+        Args:
+            ensembl_id (str): ID de Ensembl del gen a consultar.
+            blocks (str): Bloques GraphQL a pedir además de los datos básicos.
+            
+        Returns:
+            Dict[str, str]: Consulta GraphQL y variables.
+        """
+        query = """
+        query GetGeneInfo($ensemblId: String!) {
+            target(ensemblId: $ensemblId) {
+                id
+                approvedSymbol
+                approvedName
+""" + blocks + """
             }
         }
         """
         variables = {"ensemblId": ensembl_id}
-        
+
         return {"query": query, "variables": variables}
+
+    def _get_gene_query(self, ensembl_id: str, fields: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Construye la consulta GraphQL para obtener información de un gen por su ID de Ensembl.
+        De los campos paginados solo se pide la primera página.
+        
+        Args:
+            ensembl_id (str): ID de Ensembl del gen a consultar.
+            fields (Iterable[str], optional): Bloques de QUERY_FIELDS y PAGINATED_QUERY_FIELDS a pedir.
+                Si no se indica se piden todos.
+            
+        Returns:
+            Dict[str, str]: Consulta GraphQL y variables.
+        """
+        if fields is None:
+            fields = list(self.QUERY_FIELDS) + list(self.PAGINATED_QUERY_FIELDS)
+        fields = set(fields)
+
+        blocks = "".join(block for name, block in self.QUERY_FIELDS.items() if name in fields)
+        blocks += "".join(
+            self._get_connection_block(name) for name in self.PAGINATED_QUERY_FIELDS if name in fields
+        )
+        return self._build_query(ensembl_id, blocks)
     
-    def _query_graphql(self, query_data: Dict) -> requests.Response:
+    def _query_graphql(self, query_data: Dict, use_cache: bool = True) -> requests.Response:
         """
         Ejecuta una consulta GraphQL en la API de Pharos.
         
@@ -91,6 +169,7 @@ class OpenTargetsClient(BaseClient):
             Dict: Datos de la consulta GraphQL.
                 Query: Consulta GraphQL.
                 Variables: Variables para la consulta.
+            use_cache (bool): Si se debe usar la caché de respuestas (por defecto es True).
                    
         Returns:
             Dict[str, Any]: Datos JSON de la respuesta.
@@ -98,22 +177,22 @@ class OpenTargetsClient(BaseClient):
         Raises:
             BaseHTTPError: Si hay problemas en la comunicación HTTP.
         """
-        return self._post_data(self.GRAPHQL_URL, json=query_data)
-    
-    def fetch(self, id: str) -> dict:
+        return self._post_data(self.GRAPHQL_URL, json=query_data, use_cache=use_cache)
+
+    def _get_target(self, query_data: Dict, id: str) -> Dict[str, Any]:
         """
-        Obtiene datos de un gen específico de OpenTargets.
+        Ejecuta una consulta del target y devuelve sus datos.
         
         Args:
-            id (str): ID de Ensembl del gen a consultar.
+            query_data (Dict): Consulta GraphQL y variables.
+            id (str): ID de Ensembl del gen consultado.
             
         Returns:
-            dict: Datos del gen desde OpenTargets.
+            Dict[str, Any]: Datos del target.
             
         Raises:
             BaseParsingError: Si la respuesta no contiene los datos esperados.
         """
-        query_data = self._get_gene_query(id)
         response = self._query_graphql(query_data)
         
         try:
@@ -125,10 +204,86 @@ class OpenTargetsClient(BaseClient):
             return response_data["data"]["target"]
         else:
             raise BaseParsingError(f"No se encontraron datos para el gen con ID Ensembl: {id}")
+
+    def iter_rows(self, id: str, field: str, first_page: Optional[Dict[str, Any]] = None,
+                  max_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre las filas de un campo paginado, pidiendo la siguiente página solo cuando se
+        han consumido las anteriores.
+        
+        Args:
+            id (str): ID de Ensembl del gen.
+            field (str): Clave de PAGINATED_QUERY_FIELDS.
+            first_page (Dict[str, Any], optional): Primera página ya obtenida (por ejemplo en la
+                consulta de fetch). Si no se indica se pide.
+            max_rows (int, optional): Número máximo de filas. Por defecto OPENTARGETS_MAX_ROWS[field].
+            
+        Yields:
+            Dict[str, Any]: Filas del campo.
+        """
+        spec = self.PAGINATED_QUERY_FIELDS[field]
+        if max_rows is None:
+            max_rows = OPENTARGETS_MAX_ROWS[field]
+
+        page_index = 0
+        cursor = None
+        page = first_page
+        returned = 0
+        while True:
+            if page is None:
+                query_data = self._build_query(id, self._get_connection_block(field, page_index, cursor))
+                page = self._get_target(query_data, id) or {}
+                page = page.get(spec["connection"]) or {}
+
+            rows = page.get("rows") or []
+            for row in rows:
+                if returned >= max_rows:
+                    return
+                yield row
+                returned += 1
+
+            cursor = page.get("cursor")
+            if not rows or returned >= min(page.get("count") or 0, max_rows):
+                return
+            if spec["pagination"] == "cursor" and not cursor:
+                return
+            page_index += 1
+            page = None
+
+    def fetch(self, id: str, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        Obtiene datos de un gen específico de OpenTargets. Los campos paginados se completan
+        página a página hasta OPENTARGETS_MAX_ROWS filas.
+        
+        Args:
+            id (str): ID de Ensembl del gen a consultar.
+            fields (Iterable[str], optional): Bloques de la consulta a pedir (ver _get_gene_query).
+                Si no se indica se piden todos.
+            
+        Returns:
+            dict: Datos del gen desde OpenTargets.
+            
+        Raises:
+            BaseParsingError: Si la respuesta no contiene los datos esperados.
+        """
+        target = self._get_target(self._get_gene_query(id, fields), id)
+        if not target:
+            return target
+
+        for field, spec in self.PAGINATED_QUERY_FIELDS.items():
+            first_page = target.get(spec["connection"])
+            if first_page is None:
+                continue
+            target[spec["connection"]] = {
+                "count": first_page.get("count"),
+                "rows": list(self.iter_rows(id, field, first_page=first_page)),
+            }
+        return target
     
     def _ping_logic(self) -> int:
         """
-        Comprueba la versión de la base de datos de Pharos para verificar conectividad.
+        Comprueba la versión de la base de datos de OpenTargets para verificar conectividad y guarda
+        la versión de los datos (year.month.iteration, ver get_data_version).
         Returns:
             int: Código de estado HTTP de la respuesta o 999 si falla la conexión.
         """
@@ -145,12 +300,19 @@ class OpenTargetsClient(BaseClient):
             """
         }   
 
-        
-        if self._try_connection(self.GRAPHQL_URL):
-            response = self._query_graphql(test_query)
-            return response.status_code
-        else:
+        response = self._ping_request(self.GRAPHQL_URL, method="POST", json=test_query)
+        if response is None:
             return 999
+        if response.status_code == 200:
+            try:
+                data_version = response.json()["data"]["meta"]["dataVersion"]
+                self._set_data_version(self.GRAPHQL_URL, ".".join(
+                    str(data_version[part]) for part in ("year", "month", "iteration")
+                    if data_version.get(part) not in (None, "")
+                ))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                pass
+        return response.status_code
     
     def check_data(self):
         """
@@ -1,7 +1,7 @@
 """
 Módulo para procesar datos de OpenTargets combinando cliente y parser.
 """
-from typing import Dict
+from typing import Any, Dict, Hashable, List
 
 from .OpenTargetsClient import OpenTargetsClient
 from .OpenTargetsParser import OpenTargetsParser
@@ -13,7 +13,19 @@ class OpenTargetsProcessor(BaseProcessor):
     Procesa datos de OpenTargets mediante OpenTargetsClient y OpenTargetsParser.
     Obtiene datos de genes y los convierte en DataFrames según filtros proporcionados.
     """
+    # Bloques de la consulta de OpenTargetsClient que necesita cada método del parser
+    # (id, approvedSymbol y approvedName se piden siempre)
+    METHOD_QUERY_FIELDS = {
+        "basic_info": [],
+        "pathways": ["pathways"],
+        "known_drugs": ["known_drugs"],
+        "associated_diseases": ["associated_diseases"],
+        "interactions": ["interactions"],
+        "mouse_phenotypes": ["mouse_phenotypes"],
+    }
     
+    RETRIEVER_CLASS = OpenTargetsClient
+
     def __init__(self):
         """
         Inicializa el procesador de OpenTargets.
@@ -23,7 +35,8 @@ class OpenTargetsProcessor(BaseProcessor):
         self.parser = OpenTargetsParser()
         super().__init__(self.client, self.parser)
     
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Obtiene un diccionario que mapea claves de filtros a nombres de métodos del parser.
         
@@ -37,4 +50,46 @@ class OpenTargetsProcessor(BaseProcessor):
             "associated_diseases": "create_associated_diseases_df",
             "interactions": "create_interactions_df",
             "mouse_phenotypes": "create_mouse_phenotypes_df"
-        }
\ No newline at end of file
+        }
+
+    def get_query_fields(self, filters: list) -> List[str]:
+        """
+        Calcula los bloques de la consulta GraphQL necesarios para los métodos seleccionados.
+        
+        Args:
+            filters (list): Filtros del procesador.
+            
+        Returns:
+            List[str]: Bloques de OpenTargetsClient a pedir.
+        """
+        fields = []
+        for method_name in self.get_selected_methods(filters):
+            for field in self.METHOD_QUERY_FIELDS.get(method_name, []):
+                if field not in fields:
+                    fields.append(field)
+        return fields
+
+    def get_retrieve_key(self, filters: list) -> Hashable:
+        """
+        Devuelve los campos pedidos por retrieve, para compartir solo las búsquedas que piden lo mismo.
+
+        Args:
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Hashable: Campos de la consulta.
+        """
+        return tuple(self.get_query_fields(filters))
+
+    def retrieve(self, search_id: Any, filters: list) -> Dict[str, Any]:
+        """
+        Consulta en OpenTargets solo los campos que usan los métodos seleccionados.
+        
+        Args:
+            search_id (Any): ID de Ensembl del gen.
+            filters (list): Filtros del procesador.
+            
+        Returns:
+            Dict[str, Any]: Datos del gen.
+        """
+        return self.client.fetch(search_id, fields=self.get_query_fields(filters))
@@ -1,6 +1,7 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Tuple
 
 from ...core.BaseClient import BaseClient
+from ...core.constants import PANTHER_BATCH_SIZE
 
 class PantherClient(BaseClient):
     """
@@ -43,6 +44,25 @@ class PantherClient(BaseClient):
         url = self._create_url_string(id)
         return self._get_data(url)
 
+    def fetch_batch(self, ids: Iterable[str]) -> List[Tuple[List[str], Dict[str, Any]]]:
+        """
+        Obtiene datos de PantherDB para varios términos genéticos, enviando hasta PANTHER_BATCH_SIZE
+        términos separados por comas en cada petición.
+        
+        Args:
+            ids: Términos genéticos (symbols o UniprotIDs) para la consulta.
+            
+        Returns:
+            List[Tuple[List[str], Dict[str, Any]]]: Términos de cada petición y datos obtenidos de PantherDB.
+                Para separar los datos por gen ver PantherParser.split_genes.
+        """
+        terms = list(dict.fromkeys(ids))
+        batches = []
+        for start in range(0, len(terms), PANTHER_BATCH_SIZE):
+            chunk = terms[start:start + PANTHER_BATCH_SIZE]
+            batches.append((chunk, self._get_data(self._create_url_string(",".join(chunk)))))
+        return batches
+
     def _ping_logic(self) -> int:
         """
         Verifica si el servicio de PantherDB está funcionando.
@@ -52,11 +72,7 @@ class PantherClient(BaseClient):
         """
         # Usar un URL básico para verificar la conectividad
         url = self.PHANTER_DOMAIN_URL + "/services/oai/pantherdb/supportedgenomes"
-        if self._try_connection(url):
-            response = self._http_response(url)
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(url)
 
     def check_data(self):
         """
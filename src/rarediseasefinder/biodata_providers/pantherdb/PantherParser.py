@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 
 from ...core.BaseParser import BaseParser
 from ...core.constants import (NOT_FOUND_MESSAGE, 
@@ -31,6 +31,49 @@ class PantherParser(BaseParser):
         """
         super().__init__()
 
+    @staticmethod
+    def _get_gene_keys(gene: Dict[str, Any]) -> set:
+        """
+        Devuelve los identificadores con los que se puede haber consultado un gen: su símbolo y los
+        identificadores de su accession (por ejemplo "HUMAN|HGNC=11998|UniProtKB=P04637").
+        """
+        keys = {str(gene.get("gene_symbol", "")).upper()}
+        for part in str(gene.get("accession", "")).split("|"):
+            keys.add(part.split("=", 1)[-1].upper())
+        keys.discard("")
+        return keys
+
+    def split_genes(self, data: Dict[str, Any], gene_terms: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Separa la respuesta de una consulta de varios genes en una respuesta por gen, con la misma
+        estructura que la de una consulta de un solo gen, para poder usar el resto de métodos del parser.
+        
+        Args:
+            data (Dict[str, Any]): JSON crudo de PANTHER de una consulta con varios genes.
+            gene_terms (Iterable[str]): Términos genéticos enviados en la consulta.
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Datos de cada término. Los términos que PantherDB no ha
+                encontrado tienen una respuesta sin genes ("unmapped_list").
+        """
+        genes = data.get("search", {}).get("mapped_genes", {}).get("gene", [])
+        if isinstance(genes, dict):
+            genes = [genes]
+
+        genes_by_key = {}
+        for gene in genes:
+            for key in self._get_gene_keys(gene):
+                genes_by_key.setdefault(key, gene)
+
+        split = {}
+        for term in gene_terms:
+            gene = genes_by_key.get(term.upper())
+            if gene is not None:
+                split[term] = {"search": {"mapped_genes": {"gene": gene}}}
+            else:
+                split[term] = {"search": {"unmapped_list": {"unmapped": term}}}
+        return split
+
     def get_annotation_name(self, data: Dict[str, Any]) -> pd.DataFrame:
         """
         Extrae el nombre de la anotación de los datos proporcionados por PantherDB.
@@ -1,8 +1,9 @@
-from typing import Dict
+from typing import Any, Dict, Iterable
 
 from .PantherClient import PantherClient
 from .PantherParser import PantherParser
 from ...core.BaseProcessor import BaseProcessor
+from ...core.ResponseCache import ResponseCache
 
 
 class PantherProcessor(BaseProcessor):
@@ -11,15 +12,18 @@ class PantherProcessor(BaseProcessor):
     Esta clase gestiona el procesamiento de consultas y respuestas del servicio PantherDB.
     """
     
+    RETRIEVER_CLASS = PantherClient
+
     def __init__(self):
         """
         Inicializa el procesador con el cliente y el parser correspondiente.
         """
-        client = PantherClient()
-        parser = PantherParser()
-        super().__init__(client, parser)
+        self.client = PantherClient()
+        self.parser = PantherParser()
+        super().__init__(self.client, self.parser)
 
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Proporciona un mapeo entre operaciones y métodos del parser.
         
@@ -30,4 +34,26 @@ class PantherProcessor(BaseProcessor):
             "annotation_name": "get_annotation_name",
             "annotations": "parse_annotations",
             "pathways": "parse_pathways"
-        }
\ No newline at end of file
+        }
+
+    def prefetch(self, gene_terms: Iterable[str], filters: list = None) -> Dict[str, Any]:
+        """
+        Consulta varios genes con una petición por lote y separa la respuesta por gen. Cada respuesta
+        individual se guarda en la caché de respuestas, de modo que un fetch posterior del mismo gen
+        no vuelve a llamar a PantherDB.
+
+        Args:
+            gene_terms (Iterable[str]): Términos genéticos (symbols o UniprotIDs).
+            filters (list, optional): Filtros del procesador (no modifican la consulta).
+
+        Returns:
+            Dict[str, Any]: Datos de PantherDB de cada término, con la estructura de una consulta individual.
+        """
+        cache = ResponseCache.get_instance()
+        results = {}
+        for chunk, data in self.client.fetch_batch(gene_terms):
+            for term, gene_data in self.parser.split_genes(data, chunk).items():
+                results[term] = gene_data
+                if "mapped_genes" in gene_data["search"]:
+                    cache.store_json("GET", self.client._create_url_string(term), gene_data)
+        return results
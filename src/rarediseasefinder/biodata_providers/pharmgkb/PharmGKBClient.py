@@ -23,11 +23,7 @@ class PharmGKBClient(BaseClient):
             int: Código de estado HTTP si la conexión es exitosa, 999 si falla.
         """
         url = f"{self.BASE_URL}/PA166350602"  # Un ejemplo de endpoint para verificar la conexión
-        if self._try_connection(url):
-            response = self._http_response(url)
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(url)
     
     def _create_url_string(self, gene_symbol: str) -> str:
         """
@@ -10,6 +10,8 @@ class PharmGKBProcessor(BaseProcessor):
     Processor para coordinar la obtención y transformación de datos de PharmGKB.
     """
     
+    RETRIEVER_CLASS = PharmGKBClient
+
     def __init__(self):
         """
         Inicializa el processor de PharmGKB con el client y el parser apropiados.
@@ -18,7 +20,8 @@ class PharmGKBProcessor(BaseProcessor):
         parser = PharmGKBParser()
         super().__init__(client, parser)
     
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Obtiene un diccionario que mapea claves de filtros a nombres de métodos del parser.
 
@@ -2,7 +2,7 @@
 Módulo de cliente para la API GraphQL de Pharos.
 Proporciona clases y métodos para construir y ejecutar consultas GraphQL y obtener datos de targets.
 """
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
 import requests
 
@@ -18,61 +18,89 @@ class PharosClient(BaseClient):
     
     GRAPHQL_URL = "https://pharos-api.ncats.io/graphql"
 
-    def _get_pharos_query(self, target: str) -> Dict[str, str]:
-        """
-        Construye la consulta GraphQL para obtener información de un target por su símbolo.
-        
-        Args:
-            target (str): Símbolo del target a consultar.
-            
-        Returns:
-            Dict[str, str]: Consulta GraphQL y variables.
-        """
-        query = """
-            query GetGeneInfo($target: String!) {
-                target(q: { sym: $target }) {
-                    nombre: name
-                    uniprot_ID: uniprot
+    # Bloques de la consulta GraphQL del target. Cada método del parser solo necesita algunos
+    # (ver PharosProcessor.METHOD_QUERY_FIELDS); el resto no se piden a Pharos.
+    QUERY_FIELDS = {
+        "info": """
                     descripcion: description
                     claseDiana: tdl
+        """,
+        "sequence": """
                     secuencia: seq
-
+        """,
+        "omim": """
                     referenciaOMIM: mim {
                         OMIM_ID: mimid
                         nombre: term
                     }
-
+        """,
+        "ligands": """
                     ligandosConocidos: ligands {
                         nombre: name
                     }
-
+        """,
+        "drugs": """
                     deLosCualesSonFarmacosAprobados: ligands(isdrug: true) {
                         nombre: name
                     }
-
+        """,
+        "ppis": """
                     relacionProteinaProteina: ppis {
                         target {
                             nombre: name
                             proteina_ID: sym
-                            secuencia: seq
-                            claseDiana: tdl
+                            claseDiana: tdl{ppi_sequence}
                         }
                         propiedadesRelacion: props {
                             name
                             value
                         }
                     }
-
+        """,
+        "pathway_counts": """
                     numeroDeViasPorFuente: pathwayCounts {
                         fuente: name
                         numVias: value
                     }
-
+        """,
+        "pathways": """
                     vias: pathways {
                         nombre: name
                         fuente: type
                         url
                     }
+        """,
+    }
+
+    def _get_pharos_query(self, target: str, fields: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Construye la consulta GraphQL para obtener información de un target por su símbolo.
+        
+        Args:
+            target (str): Símbolo del target a consultar.
+            fields (Iterable[str], optional): Bloques de QUERY_FIELDS a pedir, más "ppi_sequence" para
+                incluir la secuencia de las proteínas de las relaciones proteína-proteína. Si no se
+                indica se piden todos los bloques, incluidas las secuencias.
+            
+        Returns:
+            Dict[str, str]: Consulta GraphQL y variables.
+        """
+        if fields is None:
+            fields = list(self.QUERY_FIELDS) + ["ppi_sequence"]
+        fields = set(fields)
+
+        blocks = "".join(
+            block for name, block in self.QUERY_FIELDS.items() if name in fields
+        )
+        ppi_sequence = "\n                            secuencia: seq" if "ppi_sequence" in fields else ""
+        blocks = blocks.replace("{ppi_sequence}", ppi_sequence)
+
+        query = """
+            query GetGeneInfo($target: String!) {
+                target(q: { sym: $target }) {
+                    nombre: name
+                    uniprot_ID: uniprot
+""" + blocks + """
                 }
             }
         """
@@ -80,7 +108,7 @@ class PharosClient(BaseClient):
         
         return {"query": query, "variables": variables}
     
-    def _query_graphql(self, query_data: Dict) -> requests.Response:
+    def _query_graphql(self, query_data: Dict, use_cache: bool = True) -> requests.Response:
         """
         Ejecuta una consulta GraphQL en la API de Pharos.
         
@@ -88,6 +116,7 @@ class PharosClient(BaseClient):
             Dict: Datos de la consulta GraphQL.
                 Query: Consulta GraphQL.
                 Variables: Variables para la consulta.
+            use_cache (bool): Si se debe usar la caché de respuestas (por defecto es True).
 
         Returns:
             Dict[str, Any]: Datos JSON de la respuesta.
@@ -95,14 +124,16 @@ class PharosClient(BaseClient):
         Raises:
             BaseHTTPError: Si hay problemas en la comunicación HTTP.
         """
-        return self._post_data(self.GRAPHQL_URL, json=query_data)
+        return self._post_data(self.GRAPHQL_URL, json=query_data, use_cache=use_cache)
 
-    def fetch(self, id: str) -> dict:
+    def fetch(self, id: str, fields: Optional[Iterable[str]] = None) -> dict:
         """
         Obtiene datos de un objetivo específico de Pharos.
         
         Args:
             id (str): Símbolo del objetivo a consultar.
+            fields (Iterable[str], optional): Bloques de la consulta a pedir (ver _get_pharos_query).
+                Si no se indica se piden todos.
             
         Returns:
             dict: Datos del objetivo desde Pharos.
@@ -111,7 +142,7 @@ class PharosClient(BaseClient):
             BaseParsingError: Si la respuesta no contiene los datos esperados.
         """
 
-        query_data = self._get_pharos_query(id)
+        query_data = self._get_pharos_query(id, fields)
         response = self._query_graphql(query_data)
         
         try:
@@ -126,7 +157,8 @@ class PharosClient(BaseClient):
         
     def _ping_logic(self) -> int:
         """
-        Comprueba la versión de la base de datos de Pharos para verificar conectividad.
+        Comprueba la versión de la base de datos de Pharos para verificar conectividad y la guarda
+        (ver get_data_version).
         Returns:
             int: Código de estado HTTP de la respuesta o 999 si falla la conexión.
         """
@@ -135,11 +167,15 @@ class PharosClient(BaseClient):
             "variables": {}
         }
 
-        if self._try_connection(self.GRAPHQL_URL):
-            response = self._query_graphql(query_data)
-            return response.status_code
-        else:
+        response = self._ping_request(self.GRAPHQL_URL, method="POST", json=query_data)
+        if response is None:
             return 999
+        if response.status_code == 200:
+            try:
+                self._set_data_version(self.GRAPHQL_URL, response.json()["data"]["dbVersion"])
+            except (ValueError, KeyError, TypeError):
+                pass
+        return response.status_code
         
     def check_data(self):
         """
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict, Hashable, List
 
 from .PharosClient import PharosClient
 from .PharosParser import PharosParser
@@ -10,6 +10,19 @@ class PharosProcessor(BaseProcessor):
     Procesa datos de Pharos mediante PharosClient y PharosParser.
     Obtiene datos de un objetivo y los convierte en DataFrames según filtros proporcionados.
     """
+    # Bloques de la consulta de PharosClient que necesita cada método del parser
+    METHOD_QUERY_FIELDS = {
+        "df_info": ["info"],
+        "df_omim": ["omim"],
+        "create_protein_protein_relations_df": ["ppis"],
+        "df_numero_vias_por_fuente": ["pathway_counts"],
+        "df_vias": ["pathways"],
+        "ligands": ["ligands"],
+        "drugs": ["drugs"],
+    }
+
+    RETRIEVER_CLASS = PharosClient
+
     def __init__(self):
         """
         Inicializa el procesador de Pharos.
@@ -19,7 +32,8 @@ class PharosProcessor(BaseProcessor):
         self.parser = PharosParser()
         super().__init__(self.client,self.parser)
 
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Obtiene un diccionario que mapea claves de filtros a nombres de métodos del parser.
 
@@ -35,3 +49,45 @@ class PharosProcessor(BaseProcessor):
             "ligands": "parse_ligands",
             "drugs": "parse_drugs"
         }
+
+    def get_query_fields(self, filters: list) -> List[str]:
+        """
+        Calcula los bloques de la consulta GraphQL necesarios para los métodos seleccionados.
+        
+        Args:
+            filters (list): Filtros del procesador.
+            
+        Returns:
+            List[str]: Bloques de PharosClient.QUERY_FIELDS a pedir.
+        """
+        fields = []
+        for method_name in self.get_selected_methods(filters):
+            for field in self.METHOD_QUERY_FIELDS.get(method_name, []):
+                if field not in fields:
+                    fields.append(field)
+        return fields
+
+    def get_retrieve_key(self, filters: list) -> Hashable:
+        """
+        Devuelve los campos pedidos por retrieve, para compartir solo las búsquedas que piden lo mismo.
+
+        Args:
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Hashable: Campos de la consulta.
+        """
+        return tuple(self.get_query_fields(filters))
+
+    def retrieve(self, search_id: Any, filters: list) -> Dict[str, Any]:
+        """
+        Consulta en Pharos solo los campos que usan los métodos seleccionados.
+        
+        Args:
+            search_id (Any): Símbolo del target.
+            filters (list): Filtros del procesador.
+            
+        Returns:
+            Dict[str, Any]: Datos del target.
+        """
+        return self.client.fetch(search_id, fields=self.get_query_fields(filters))
@@ -1,16 +1,26 @@
+import heapq
 import json
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ...core.BaseClient import BaseClient
+from ...core.ResponseCache import ResponseCache
+from ...core.errors import BaseError
+from ...core.constants import PPIATLAS_MIN_SCORE, PPIATLAS_MAX_INTERACTIONS, PPIATLAS_STREAM_SORTED
 
 
 class PPIAtlasClient(BaseClient):
     """
     Cliente para la API de PPIAtlas que permite obtener interacciones proteína-proteína.
+
+    Las puntuaciones se leen en streaming: cada línea se descarta en cuanto llega si no supera la
+    puntuación mínima y solo se conservan las ``max_interactions`` mejores en un montículo, de modo
+    que la memoria no crece con el número de interacciones de la proteína. El resultado ya filtrado
+    se guarda en la caché persistente (ResponseCache) en lugar de la respuesta completa.
     """
 
     BASE_URL = "https://www.ppiatlas.com/api"
+    CACHE_NAMESPACE = "ppiatlas-scores"
     
     def __init__(self):
         """
@@ -18,38 +28,108 @@ class PPIAtlasClient(BaseClient):
         """
         super().__init__()
 
-    def fetch(self, id: str) -> Dict[str, Any]:
+    @staticmethod
+    def get_score(record: Dict[str, Any]) -> float:
+        """
+        Devuelve la puntuación media de asociación de un registro (0.0 si no tiene).
+        
+        Args:
+            record (Dict[str, Any]): Registro de PPIAtlas.
+            
+        Returns:
+            float: Puntuación del registro.
+        """
+        score = record.get("avg_association_score")
+        return score if score is not None else 0.0
+
+    def _stream_records(self, url: str, min_score: float, max_interactions: Optional[int]) -> Dict[str, Any]:
+        """
+        Lee el stream de puntuaciones y devuelve los mejores registros por encima de la puntuación mínima.
+        Con PPIATLAS_STREAM_SORTED la lectura se corta en cuanto el orden descendente lo permite.
+        
+        Args:
+            url (str): URL del stream.
+            min_score (float): Puntuación mínima de los registros.
+            max_interactions (int, optional): Número máximo de registros (None para todos).
+            
+        Returns:
+            Dict[str, Any]: Registros ordenados por puntuación descendente ("records") y si se ha
+                descartado algún registro por no llegar a la puntuación mínima ("below_min_score").
+        """
+        response = self._get_data(url, stream=True, use_cache=False)
+        try:
+            response.raise_for_status()
+
+            # Montículo de mínimos (puntuación, orden de llegada, registro) con los mejores registros
+            heap = []
+            position = 0
+            previous_score = None
+            below_min_score = False
+            sorted_stream = PPIATLAS_STREAM_SORTED
+            for line in response.iter_lines():
+                if not line.startswith(b'data: '):
+                    continue
+                try:
+                    record = json.loads(line[len(b'data: '):])
+                except json.JSONDecodeError:
+                    continue  # Ignora líneas mal formateadas
+
+                score = self.get_score(record)
+                if previous_score is not None and score > previous_score:
+                    sorted_stream = False
+                previous_score = score
+
+                if score < min_score:
+                    below_min_score = True
+                    if sorted_stream:
+                        break  # El resto del stream tiene puntuaciones menores
+                    continue
+                position += 1
+                if max_interactions is None or len(heap) < max_interactions:
+                    heapq.heappush(heap, (score, -position, record))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, -position, record))
+                elif sorted_stream:
+                    break  # El montículo está lleno y no llegarán puntuaciones mayores
+        finally:
+            response.close()
+
+        return {
+            "records": [record for _, _, record in sorted(heap, reverse=True)],
+            "below_min_score": below_min_score,
+        }
+
+    def fetch(self, id: str, min_score: float = PPIATLAS_MIN_SCORE,
+              max_interactions: Optional[int] = PPIATLAS_MAX_INTERACTIONS) -> Dict[str, Any]:
         """
         Obtiene datos de interacciones proteína-proteína de PPIAtlas.
         
         Args:
             id (str): Identificador de la proteína.
+            min_score (float): Puntuación media de asociación mínima de las interacciones.
+            max_interactions (int, optional): Número máximo de interacciones, las de mayor puntuación
+                (None para todas).
             
         Returns:
-            Dict[str, Any]: Datos obtenidos de PPIAtlas.
+            Dict[str, Any]: Datos obtenidos de PPIAtlas, con los registros ordenados por puntuación descendente.
         """
         # Crear URL para la consulta
         url = f"{self.BASE_URL}/stream-scores/{id}?limit=99999999999"
+
+        cache = ResponseCache.get_instance()
+        key = cache.make_key(url, min_score, max_interactions)
+        entry = cache.get(self.CACHE_NAMESPACE, key, ttl=cache.get_ttl("www.ppiatlas.com"))
+        if entry is not None:
+            return json.loads(entry[0])
         
         try:
-            # Hacer petición HTTP con streaming
-            response = self._http_response(url, stream=True)
-            response.raise_for_status()
-            
-            # Procesar la respuesta de streaming
-            records = []
-            for line in response.iter_lines():
-                if line.startswith(b'data: '):
-                    json_str = line[len(b'data: '):]
-                    try:
-                        record = json.loads(json_str)
-                        records.append(record)
-                    except json.JSONDecodeError:
-                        continue  # Ignora líneas mal formateadas
-            return {"records": records}
-
-        except requests.exceptions.RequestException as e:
+            data = self._stream_records(url, min_score, max_interactions)
+        except (BaseError, requests.exceptions.RequestException) as e:
+            # BaseError: errores de la petición (BaseClient); RequestException: errores al leer el stream
             return {"error": str(e)}
+
+        cache.put(self.CACHE_NAMESPACE, key, json.dumps(data).encode("utf-8"))
+        return data
     
     def _ping_logic(self) -> int:
         """
@@ -59,14 +139,10 @@ class PPIAtlasClient(BaseClient):
             int: Código de estado de la respuesta HTTP o 999 si no hay conexión.
         """
         url = f"{self.BASE_URL}/stream-scores/TP53?limit=1"
-        if self._try_connection(url):
-            response = self._http_response(url)
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(url)
         
     def check_data(self):
         """
         Placeholder para lógica de validación de los datos obtenidos de PPIAtlas.
         """
-        pass
\ No newline at end of file
+        pass
@@ -3,7 +3,7 @@ import numpy as np
 from typing import Dict, Any
 
 from ...core.BaseParser import BaseParser
-from ...core.constants import NOT_FOUND_MESSAGE
+from ...core.constants import NOT_FOUND_MESSAGE, PPIATLAS_MIN_SCORE
 
 
 class PPIAtlasParser(BaseParser):
@@ -25,13 +25,16 @@ class PPIAtlasParser(BaseParser):
         """
         super().__init__()
     
-    def parse_ppi_table(self, data: Dict[str, Any]) -> pd.DataFrame:
+    def parse_ppi_table(self, data: Dict[str, Any], filters: Dict[str, Any] = None) -> pd.DataFrame:
         """
         Procesa los datos y crea una tabla con las interacciones proteína-proteína.
-        Filtra por score >= 0.8 y reemplaza valores None/NaN por "-".
+        Filtra por score >= SCORE_MINIMO (0.8 por defecto) y reemplaza valores None/NaN por "-".
+        El cliente ya entrega los registros filtrados, limitados y ordenados; se vuelve a comprobar
+        por si los datos vienen de otra fuente.
         
         Args:
             data (Dict[str, Any]): Datos pre-procesados del cliente.
+            filters (Dict[str, Any], optional): Filtros del método (SCORE_MINIMO, MAX_INTERACCIONES).
             
         Returns:
             pd.DataFrame: Tabla de interacciones con el formato requerido.
@@ -47,11 +50,13 @@ class PPIAtlasParser(BaseParser):
                 error_dict[tissue] = "-"
             return self.parse_to_dataframe([error_dict])
         
+        min_score = filters.get("SCORE_MINIMO", PPIATLAS_MIN_SCORE) if isinstance(filters, dict) else PPIATLAS_MIN_SCORE
+
         # Obtener registros y proteína consultada
         records = data.get("records", [])
         
         # Sin resultados
-        if not records:
+        if not records and not data.get("below_min_score"):
             empty_dict = {
                 "protein": NOT_FOUND_MESSAGE,
                 "avg_association_score": 0.0,
@@ -69,8 +74,8 @@ class PPIAtlasParser(BaseParser):
             if score is None:
                 score = 0.0
                 
-            # Filtrar por score >= 0.8 (requerimiento de las investigadoras)
-            if score >= 0.8:
+            # Filtrar por score >= SCORE_MINIMO (0.8, requerimiento de las investigadoras)
+            if score >= min_score:
                 # Crear diccionario base con los campos principales
                 interaction = {
                     "protein": record.get("protein2", NOT_FOUND_MESSAGE),
@@ -84,12 +89,12 @@ class PPIAtlasParser(BaseParser):
                 
                 interactions.append(interaction)
         
-        # Sin interacciones con score >= 0.8
+        # Sin interacciones con score >= SCORE_MINIMO
         if not interactions:
             no_interactions = {
                 "protein": NOT_FOUND_MESSAGE,
                 "avg_association_score": 0.0,
-                "Error": "No interactions with score >= 0.8 found"
+                "Error": f"No interactions with score >= {min_score} found"
             }
             for tissue in self.TISSUE_COLUMNS:
                 no_interactions[tissue] = "-"
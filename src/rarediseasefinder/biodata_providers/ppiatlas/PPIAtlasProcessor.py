@@ -1,6 +1,7 @@
-from typing import Dict
+from typing import Any, Dict, Hashable
 
 from ...core.BaseProcessor import BaseProcessor
+from ...core.constants import PPIATLAS_MIN_SCORE, PPIATLAS_MAX_INTERACTIONS
 from .PPIAtlasClient import PPIAtlasClient
 from .PPIAtlasParser import PPIAtlasParser
 
@@ -10,15 +11,18 @@ class PPIAtlasProcessor(BaseProcessor):
     Processor para coordinar la obtención y transformación de datos de PPIAtlas.
     """
     
+    RETRIEVER_CLASS = PPIAtlasClient
+
     def __init__(self):
         """
         Inicializa el processor de PPIAtlas con el cliente y parser apropiados.
         """
-        client = PPIAtlasClient()
-        parser = PPIAtlasParser()
-        super().__init__(client, parser)
+        self.client = PPIAtlasClient()
+        self.parser = PPIAtlasParser()
+        super().__init__(self.client, self.parser)
     
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Obtiene un diccionario que mapea claves de filtros a nombres de métodos del parser.
 
@@ -27,4 +31,50 @@ class PPIAtlasProcessor(BaseProcessor):
         """
         return {
             "ppi_table": "parse_ppi_table"
-        }
\ No newline at end of file
+        }
+
+    def get_stream_filters(self, filters: list) -> Dict[str, Any]:
+        """
+        Obtiene la puntuación mínima y el número máximo de interacciones de los filtros de "ppi_table".
+
+        Args:
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Dict[str, Any]: Argumentos min_score y max_interactions de PPIAtlasClient.fetch.
+        """
+        stream_filters = {"min_score": PPIATLAS_MIN_SCORE, "max_interactions": PPIATLAS_MAX_INTERACTIONS}
+        for processor in filters:
+            if processor.get("PROCESSOR") != self.__class__.__name__:
+                continue
+            for method_config in processor.get("METODOS_PARSER", []):
+                filter_params = method_config.get("FILTROS_METODO_PARSER") or {}
+                if method_config.get("NOMBRE_METODO") == "ppi_table" and isinstance(filter_params, dict):
+                    stream_filters["min_score"] = filter_params.get("SCORE_MINIMO", PPIATLAS_MIN_SCORE)
+                    stream_filters["max_interactions"] = filter_params.get("MAX_INTERACCIONES", PPIATLAS_MAX_INTERACTIONS)
+        return stream_filters
+
+    def get_retrieve_key(self, filters: list) -> Hashable:
+        """
+        Devuelve los límites de la lectura de PPIAtlas, para compartir solo las búsquedas que piden lo mismo.
+
+        Args:
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Hashable: Puntuación mínima y número máximo de interacciones.
+        """
+        return tuple(sorted(self.get_stream_filters(filters).items()))
+
+    def retrieve(self, search_id: Any, filters: list) -> Dict[str, Any]:
+        """
+        Lee de PPIAtlas solo las interacciones que va a mostrar "ppi_table".
+
+        Args:
+            search_id (Any): Identificador de la proteína.
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Dict[str, Any]: Registros de PPIAtlas ordenados por puntuación descendente.
+        """
+        return self.client.fetch(search_id, **self.get_stream_filters(filters))
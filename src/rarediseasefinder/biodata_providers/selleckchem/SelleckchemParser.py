@@ -1,7 +1,6 @@
 from typing import Dict, Any
 
 import pandas as pd
-from bs4 import BeautifulSoup
 
 from ...core.BaseParser import BaseParser
 from ...core.constants import (NO_DATA_MARKER, 
@@ -26,6 +25,8 @@ class SelleckchemParser(BaseParser):
         Returns:
             pd.DataFrame: DataFrame con los datos de los medicamentos extraídos.
         """
+        from bs4 import BeautifulSoup  # Se importa al parsear el primer HTML
+
         html = data.get('html')
         soup = BeautifulSoup(html, 'html.parser')
         medicamentos = []
@@ -9,6 +9,8 @@ class SelleckchemProcessor(BaseProcessor):
     Procesa datos de Selleckchem usando SelleckchemScrapper y SelleckchemParser.
     Obtiene enlaces de productos de un medicamento según filtros.
     """
+    RETRIEVER_CLASS = SelleckchemScraper.SelleckchemScraper
+
     def __init__(self):
         """
         Inicializa el procesador de Selleckchem.
@@ -18,7 +20,8 @@ class SelleckchemProcessor(BaseProcessor):
         self.parser = SelleckchemParser.SelleckchemParser()
         super().__init__(self.client,self.parser)
 
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Retorna un mapeo de filtros a nombres de métodos del parser.
 
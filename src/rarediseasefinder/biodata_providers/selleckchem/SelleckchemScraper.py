@@ -3,14 +3,11 @@ Módulo de scrapper para automatizar búsquedas en Selleckchem usando Selenium.
 Proporciona una clase para buscar medicamentos y obtener el HTML de resultados.
 """
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 from typing import Dict, Any
 import re
 
 from ...core.BaseScraper import BaseScraper
+from ...core.constants import SELLECKCHEM_RESULTS_TIMEOUT, SELLECKCHEM_NO_RESULTS_MARKERS
 
 
 class SelleckchemScraper(BaseScraper):
@@ -34,29 +31,65 @@ class SelleckchemScraper(BaseScraper):
             id (str): identificador del medicamento a buscar. Generalmente un nombre o ID de producto.
 
         Returns:
-            Dict[str, Any]: HTML de la página de resultados o mensaje de error.
+            Dict[str, Any]: HTML de la página de resultados o mensaje de error. Los errores
+                definitivos (nombre IUPAC o página de Selleckchem que indica que no hay productos)
+                incluyen "not_found": True para distinguirlos de los errores transitorios (navegador,
+                página que no termina de cargar), que no deben cachearse.
         """
+        if self._is_iupac_name(id):
+            return {"error": "No se permiten nombres IUPAC", "not_found": True}
         if not self.ok():
             return {"error": "Error al inicializar Chrome driver"}
-        if self._is_iupac_name(id):
-            return {"error": "No se permiten nombres IUPAC"}
+
+        # Selenium solo se importa cuando se usa el navegador
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
-            self.driver.get(self.BASE_URL)
-            search_box = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.NAME, "searchDTO.searchParam"))
-            )
-            search_box.clear()
-            search_box.send_keys(id + Keys.RETURN)
-            WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "tr[name='productList']"))
-            )
-            html = self.driver.page_source
+            with self.lease_driver() as driver:
+                driver.get(self.BASE_URL)
+                search_box = WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.NAME, "searchDTO.searchParam"))
+                )
+                search_box.clear()
+                search_box.send_keys(id + Keys.RETURN)
+                try:
+                    # Espera a la lista de productos o al aviso de búsqueda sin resultados
+                    WebDriverWait(driver, SELLECKCHEM_RESULTS_TIMEOUT).until(
+                        lambda d: d.find_elements(By.CSS_SELECTOR, "tr[name='productList']")
+                        or self._is_no_results_page(d)
+                    )
+                except TimeoutException:
+                    # La página no ha cargado a tiempo: error transitorio, el navegador sigue siendo válido
+                    return {"error": f"La búsqueda de {id} en Selleckchem no ha terminado a tiempo"}
+                if not driver.find_elements(By.CSS_SELECTOR, "tr[name='productList']"):
+                    return {"error": f"No se encontraron productos para {id}", "not_found": True}
+                html = driver.page_source
             return {"html": html, "search_term": id}
         except Exception as e:
+            # El navegador usado se descarta al salir del bloque con la excepción
             print(f"❌ Error al buscar en Selleckchem: {str(e)}")
-            self.reset_driver()
             return {"error": str(e)}
     
+    @staticmethod
+    def _is_no_results_page(driver) -> bool:
+        """
+        Indica si la página de resultados muestra el aviso de Selleckchem de búsqueda sin productos.
+
+        Args:
+            driver (webdriver.Chrome): Navegador con la página de resultados.
+
+        Returns:
+            bool: True si el texto de la página contiene alguno de SELLECKCHEM_NO_RESULTS_MARKERS.
+        """
+        from selenium.webdriver.common.by import By
+
+        text = driver.find_element(By.TAG_NAME, "body").text.lower()
+        return any(marker in text for marker in SELLECKCHEM_NO_RESULTS_MARKERS)
+
     def _is_iupac_name(self, product_name: str) -> bool:
         """
         Detecta si un nombre de producto parece nomenclatura IUPAC.
@@ -1,7 +1,15 @@
+import json
+from typing import List
+from urllib.parse import urlsplit
+
 from ...core.BaseClient import BaseClient
+from ...core.ResponseCache import ResponseCache
+from ...core.errors import BaseParsingError
 from ...core.constants import (
     STRINGDB_PING_URL,
     STRINGDB_BASE_URL,
+    STRINGDB_BATCH_URL,
+    STRINGDB_BATCH_SIZE,
 )
 
 class StringDbClient(BaseClient):
@@ -12,6 +20,8 @@ class StringDbClient(BaseClient):
     desde la base de datos STRING.
     """
 
+    IDS_CACHE_NAMESPACE = "stringdb-ids"
+
     def __init__(self):
         """Inicializa el cliente de la base de datos STRING."""
         pass
@@ -28,18 +38,88 @@ class StringDbClient(BaseClient):
         """
         return str(STRINGDB_BASE_URL.format(id))
 
-    def fetch(self,id: str) -> dict:
+    def fetch(self,id: str | list) -> dict:
         """
         Obtiene datos de la base de datos STRING para la proteína especificada.
+        Si se recibe una lista de identificadores se resuelven todos con fetch_batch.
         
         Args:
-            id (str): El identificador de la proteína.
+            id (str | list): El identificador de la proteína o una lista de identificadores.
             
         Returns:
             dict: Los datos recuperados de la base de datos STRING.
         """
+        if isinstance(id, (list, tuple)):
+            return self.fetch_batch(list(id))
         return self._get_data(self.create_url(id))
 
+    def fetch_batch(self, ids: List[str]) -> List[dict]:
+        """
+        Resuelve una lista de identificadores en STRING con peticiones POST a get_string_ids,
+        agrupando los identificadores en bloques de STRINGDB_BATCH_SIZE.
+        
+        Los registros de cada identificador se guardan por separado en la caché persistente
+        (ResponseCache), de modo que los identificadores ya resueltos en otra lista (por ejemplo,
+        interactores compartidos por varios genes) no se vuelven a pedir.
+        
+        Args:
+            ids (List[str]): Identificadores de las proteínas.
+            
+        Returns:
+            List[dict]: Registros de STRING ordenados por "queryIndex" (posición del identificador
+                en la lista de entrada). Los identificadores sin resultado se devuelven como un
+                registro que solo contiene "queryIndex" y "queryItem".
+            
+        Raises:
+            BaseParsingError: Si la respuesta no es un JSON válido.
+        """
+        cache = ResponseCache.get_instance()
+        ttl = cache.get_ttl(urlsplit(STRINGDB_BATCH_URL).netloc)
+
+        # Registros (sin queryIndex) de cada identificador distinto
+        records_by_id = {}
+        pending = []
+        for identifier in dict.fromkeys(ids):
+            entry = cache.get(self.IDS_CACHE_NAMESPACE, cache.make_key(identifier), ttl=ttl)
+            if entry is not None:
+                records_by_id[identifier] = json.loads(entry[0])
+            else:
+                pending.append(identifier)
+
+        for offset in range(0, len(pending), STRINGDB_BATCH_SIZE):
+            chunk = pending[offset:offset + STRINGDB_BATCH_SIZE]
+            response = self._post_data(
+                STRINGDB_BATCH_URL,
+                data={
+                    "identifiers": "\r".join(chunk),
+                    "species": 9606,
+                    "echo_query": 1,
+                },
+            )
+            try:
+                chunk_records = response.json()
+            except ValueError as e:
+                raise BaseParsingError(f"Error al decodificar JSON: {str(e)}")
+            if not isinstance(chunk_records, list):
+                raise BaseParsingError(f"Respuesta inesperada de STRING: {chunk_records}")
+
+            chunk_by_id = {identifier: [] for identifier in chunk}
+            for record in chunk_records:
+                query_index = record.pop("queryIndex", 0)
+                if 0 <= query_index < len(chunk):
+                    chunk_by_id[chunk[query_index]].append(record)
+            for identifier, identifier_records in chunk_by_id.items():
+                records_by_id[identifier] = identifier_records
+                cache.put(self.IDS_CACHE_NAMESPACE, cache.make_key(identifier),
+                          json.dumps(identifier_records).encode("utf-8"))
+
+        records = []
+        for index, identifier in enumerate(ids):
+            identifier_records = records_by_id.get(identifier) or [{"queryItem": identifier}]
+            for record in identifier_records:
+                records.append(dict(record, queryIndex=index))
+        return records
+
     def _ping_logic(self) -> int:
         """
         Comprueba la conectividad con la base de datos STRING.
@@ -47,11 +127,7 @@ class StringDbClient(BaseClient):
         Returns:
             int: Código de estado HTTP de la petición ping, o 999 si la conexión falló.
         """
-        if self._try_connection(STRINGDB_PING_URL):
-            response = self._http_response(STRINGDB_PING_URL)
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(STRINGDB_PING_URL)
 
     def check_data(self, data: str | dict) -> bool:
         """
@@ -15,6 +15,8 @@ class StringDbParser(BaseParser):
     def get_annotation(self, data: dict) -> pd.DataFrame:
         """
         Extrae y analiza datos de anotación de la respuesta de la base de datos STRING.
+        Si la respuesta contiene varias consultas (modo batch) se devuelve una fila por
+        identificador consultado, en el mismo orden de la lista de entrada.
         
         Args:
             data (dict): Datos sin procesar devueltos por la API de STRING.
@@ -23,7 +25,13 @@ class StringDbParser(BaseParser):
             pd.DataFrame: Un DataFrame que contiene el nombre preferido y la información
                         de anotación para la proteína consultada.
         """
-        name = data[0].get("preferredName", "")
-        description = data[0].get("annotation", "")
-        result = {"Prefered name" : name, "Annotation" : description}
-        return self.parse_to_dataframe(result)
\ No newline at end of file
+        # Primer resultado de cada identificador consultado
+        first_by_query = {}
+        for record in data:
+            first_by_query.setdefault(record.get("queryIndex", 0), record)
+
+        results = [
+            {"Prefered name": record.get("preferredName", ""), "Annotation": record.get("annotation", "")}
+            for _, record in sorted(first_by_query.items())
+        ]
+        return self.parse_to_dataframe(results)
\ No newline at end of file
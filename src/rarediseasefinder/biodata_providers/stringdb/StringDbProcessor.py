@@ -1,9 +1,8 @@
 from typing import Dict
-import json
 
-from src.rarediseasefinder.biodata_providers.stringdb.StringDbClient import StringDbClient
-from src.rarediseasefinder.biodata_providers.stringdb.StringDbParser import StringDbParser
-from src.rarediseasefinder.core.BaseProcessor import BaseProcessor
+from .StringDbClient import StringDbClient
+from .StringDbParser import StringDbParser
+from ...core.BaseProcessor import BaseProcessor
 
 
 class StringDbProcessor(BaseProcessor):
@@ -15,6 +14,8 @@ class StringDbProcessor(BaseProcessor):
     de la base de datos STRING.
     """
 
+    RETRIEVER_CLASS = StringDbClient
+
     def __init__(self):
         """
         Inicializa el procesador de la base de datos STRING.
@@ -26,7 +27,8 @@ class StringDbProcessor(BaseProcessor):
         self.parser = StringDbParser()
         super().__init__(self.client, self.parser)
 
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Proporciona un mapeo entre nombres de métodos y sus implementaciones.
         
@@ -1,3 +1,5 @@
+from typing import Iterable, Optional
+
 from ...core.BaseClient import BaseClient
 import re
 """Módulo para interactuar con la API de UniProt y proporcionar métodos para obtener y validar datos de proteínas."""
@@ -7,12 +9,36 @@ UNIPROT_BASE_URL = "https://rest.uniprot.org/uniprotkb"
 class UniProtClient(BaseClient):
     """Cliente para interactuar con la API de UniProt"""
 
-    def fetch(self, id: str) -> dict:
+    # Campos que se piden siempre en modo proyección (los usa UniProtParser._get_first_result)
+    BASE_FIELDS = ["accession"]
+
+    def _get_fields_param(self, fields: Optional[Iterable[str]]) -> str:
+        """
+        Construye el parámetro ``fields`` de la API REST de UniProt.
+        
+        Args:
+            fields (Iterable[str], optional): Campos de UniProtKB a pedir (por ejemplo "cc_function").
+            
+        Returns:
+            str: Parámetro ``&fields=...`` o cadena vacía si se pide la entrada completa.
+        """
+        if fields is None:
+            return ""
+        selected = list(self.BASE_FIELDS)
+        for field in fields:
+            if field not in selected:
+                selected.append(field)
+        return "&fields=" + ",".join(selected)
+
+    def fetch(self, id: str, fields: Optional[Iterable[str]] = None) -> dict:
         """
         Obtiene información de UniProt usando un ID de UniProt o un símbolo de gen.
+        Con un símbolo de gen solo se pide el primer resultado de la búsqueda.
         
         Args:
             id (str): UniProt ID o símbolo de gen.
+            fields (Iterable[str], optional): Campos de UniProtKB a pedir además de la accesión.
+                Si no se indica se descarga la entrada completa.
             
         Returns:
             dict: Datos obtenidos de la API.
@@ -25,11 +51,11 @@ class UniProtClient(BaseClient):
 
         if re.match(uniprot_id_pattern, id):
             # Es un UniProt ID
-            url = f"{UNIPROT_BASE_URL}/{id}"
+            url = f"{UNIPROT_BASE_URL}/{id}?format=json{self._get_fields_param(fields)}"
         else:
             # Es un símbolo de gen
             reviewed_param = "AND+reviewed:true"
-            url = f"{UNIPROT_BASE_URL}/search?query=gene:{id}+{reviewed_param}&format=json"
+            url = f"{UNIPROT_BASE_URL}/search?query=gene:{id}+{reviewed_param}&format=json&size=1{self._get_fields_param(fields)}"
             
         return self._get_data(url)
 
@@ -43,11 +69,7 @@ class UniProtClient(BaseClient):
         server = "https://rest.uniprot.org"
         ext = "/uniprotkb/P05067"
         url = server+ext
-        if self._try_connection(url):
-            response = UniProtClient._http_response(url)
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(url)
 
     def check_data(self):
         """Valida o comprueba los datos obtenidos de UniProt.
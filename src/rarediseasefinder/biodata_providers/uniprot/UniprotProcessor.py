@@ -1,6 +1,6 @@
 """Módulo para procesar datos de UniProt combinando cliente y parser."""
 
-from typing import Dict
+from typing import Any, Dict, Hashable, List
 
 from .UniProtClient import UniProtClient
 from .UniProtParser import UniProtParser
@@ -10,13 +10,28 @@ from ...core.BaseProcessor import BaseProcessor
 class UniprotProcessor(BaseProcessor):
     """Procesa datos de UniProt usando UniProtClient y UniProtParser."""
 
+    # Campos de UniProtKB (parámetro ``fields`` de la API REST) que necesita cada método del parser
+    METHOD_QUERY_FIELDS = {
+        "function": ["cc_function"],
+        "function_references": ["cc_function"],
+        "subcellular_location": ["cc_subcellular_location"],
+        "go_terms": ["go"],
+        "disease": ["cc_disease"],
+        "disease_publications": ["cc_disease"],
+        "interactions": ["cc_interaction"],
+        "external_links": [],
+    }
+
+    RETRIEVER_CLASS = UniProtClient
+
     def __init__(self):
         """Inicializa el cliente y el parser, y configura la clase base de procesamiento."""
         self.client = UniProtClient()
         self.parser = UniProtParser()
         super().__init__(self.client,self.parser)
 
-    def get_method_map(self) -> Dict[str, str]:
+    @classmethod
+    def get_method_map(cls) -> Dict[str, str]:
         """Devuelve el mapeo de filtros a nombres de métodos de parseo."""
         return {
             "function": "parse_function",
@@ -27,4 +42,29 @@ class UniprotProcessor(BaseProcessor):
             "disease_publications": "parse_disease_publications",
             "interactions": "parse_interactions",
             "external_links": "parse_external_links",
-        }
\ No newline at end of file
+        }
+
+    def get_query_fields(self, filters: list) -> List[str]:
+        """Calcula los campos de UniProtKB necesarios para los métodos seleccionados."""
+        fields = []
+        for method_name in self.get_selected_methods(filters):
+            for field in self.METHOD_QUERY_FIELDS.get(method_name, []):
+                if field not in fields:
+                    fields.append(field)
+        return fields
+
+    def get_retrieve_key(self, filters: list) -> Hashable:
+        """
+        Devuelve los campos pedidos por retrieve, para compartir solo las búsquedas que piden lo mismo.
+
+        Args:
+            filters (list): Filtros del procesador.
+
+        Returns:
+            Hashable: Campos de la consulta.
+        """
+        return tuple(self.get_query_fields(filters))
+
+    def retrieve(self, search_id: Any, filters: list) -> Dict[str, Any]:
+        """Consulta en UniProt solo los campos que usan los métodos seleccionados."""
+        return self.client.fetch(search_id, fields=self.get_query_fields(filters))
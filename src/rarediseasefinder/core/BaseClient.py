@@ -5,18 +5,28 @@ import requests
 
 from .errors import BaseHTTPError, BaseParsingError, BaseError
 from ..core.BaseRetriever import BaseRetriever
+from ..core.SessionPool import SessionPool
+from ..core.ResponseCache import ResponseCache
+from ..core.SingleFlight import SingleFlight
 
 
 class BaseClient(BaseRetriever, ABC):
     """Cliente base para interactuar con la API """
 
-    def _get_data(self, url: str, stream: bool = False) -> Any:
+    # Peticiones idénticas simultáneas (p. ej. de varios genes en un lote) comparten una sola llamada
+    _request_flights = SingleFlight()
+
+    def _get_data(self, url: str, stream: bool = False, use_cache: bool = True) -> Any:
         """
-        Método privado para devolver la respuesta en json o el objeto response completo
+        Método privado para devolver la respuesta en json o el objeto response completo.
+        Las respuestas correctas se guardan en la caché persistente (ResponseCache); las
+        respuestas en streaming se almacenan completas y se reproducen desde memoria. Las peticiones
+        idénticas que coinciden en el tiempo comparten una sola llamada al proveedor.
         
         Args:
             url (str): URL a consultar
             stream (bool): Si se debe transmitir la respuesta (por defecto es False)
+            use_cache (bool): Si se debe consultar y actualizar la caché de respuestas (por defecto es True)
             
         Returns:
             dict o Response: Datos JSON de la respuesta o el objeto Response completo si stream=True
@@ -27,34 +37,54 @@ class BaseClient(BaseRetriever, ABC):
             BaseError: Para cualquier otro error inesperado
         """
         try:
-            response = self._http_response(url, stream=stream)
+            cache = ResponseCache.get_instance()
+            cached_response = cache.get_response("GET", url) if use_cache else None
+            if cached_response is not None:
+                response = cached_response
+            elif stream:
+                response = self._http_response(url, stream=True)
+            else:
+                response = BaseClient._request_flights.do(
+                    ResponseCache.make_key("GET", url), lambda: self._http_response(url)
+                )
             
             # Si es streaming, devolver el objeto response directamente
             if stream:
+                if use_cache and cached_response is None:
+                    cache.store_response("GET", url, response)
                 return response
             
-            # Si no es streaming, procesar como JSON normalmente
-            return response.json()
+            # Si no es streaming, procesar como JSON normalmente (solo se cachean JSON válidos)
+            data = response.json()
+            if use_cache and cached_response is None:
+                cache.store_response("GET", url, response)
+            return data
         except ValueError as json_err:
             # Solo lanzar este error si no es streaming
             if not stream:
                 raise BaseParsingError(f"JSON inválido: {json_err}")
             return {"error": f"Error al decodificar JSON: {json_err}"}
+        except BaseError:
+            raise
         except Exception as err:
             raise BaseError(f"Error inesperado: {err}")
         
     @staticmethod
     def _post_data(url: str, json: Optional[Dict[str, Any]] = None,
                   data: Optional[Dict[str, Any]] = None,
-                  headers: Optional[Dict[str, str]] = None) -> requests.Response:
+                  headers: Optional[Dict[str, str]] = None,
+                  use_cache: bool = True) -> requests.Response:
         """
-        Método para realizar solicitudes HTTP POST
+        Método para realizar solicitudes HTTP POST a través de la sesión del host (SessionPool).
+        El cuerpo de la petición (p. ej. la consulta GraphQL) forma parte de la clave de la caché de respuestas
+        y de la agrupación de peticiones idénticas simultáneas.
         
         Args:
             url (str): URL a consultar
             json (dict, optional): Datos JSON para enviar en el cuerpo
             data (dict, optional): Datos de formulario para enviar en el cuerpo
             headers (dict, optional): Cabeceras HTTP
+            use_cache (bool): Si se debe consultar y actualizar la caché de respuestas (por defecto es True)
             
         Returns:
             dict: Datos JSON de la respuesta
@@ -65,7 +95,18 @@ class BaseClient(BaseRetriever, ABC):
             BaseError: Para cualquier otro error inesperado
         """
         try:
-            response = requests.post(url, json=json, data=data, headers=headers)
+            cache = ResponseCache.get_instance()
+            body = {"json": json, "data": data}
+            if use_cache:
+                cached_response = cache.get_response("POST", url, body)
+                if cached_response is not None:
+                    return cached_response
+            response = BaseClient._request_flights.do(
+                ResponseCache.make_key("POST", url, body),
+                lambda: SessionPool.get_instance().request("POST", url, json=json, data=data, headers=headers),
+            )
+            if use_cache:
+                cache.store_response("POST", url, response, body)
             return response
         except requests.exceptions.HTTPError as http_err:
             raise BaseHTTPError(f"HTTP error: {http_err}")
@@ -1,3 +1,4 @@
+import copy
 import json
 from typing import List, Dict, Any
 
@@ -26,6 +27,21 @@ class BaseFilter:
         self.add_processor_to_filter(processor_id)
         self.add_minium_methods()
 
+    @classmethod
+    def from_json(cls, json_filter: List[Dict[str, Any]]) -> "BaseFilter":
+        """
+        Rebuilds a filter from its JSON representation (the value of ``json_filter``).
+
+        Args:
+            json_filter (List[Dict[str, Any]]): A JSON filter, e.g. loaded from a workflow session.
+
+        Returns:
+            BaseFilter: A filter holding a copy of the given JSON filter.
+        """
+        base_filter = cls([], json_filter[0]["PROCESSOR"])
+        base_filter.json_filter = copy.deepcopy(json_filter)
+        return base_filter
+
     def create_base_tree(self) -> None:
         """Creates the basic structure of the JSON filter."""
         self.json_filter = [{
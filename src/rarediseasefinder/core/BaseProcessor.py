@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Hashable, Optional, Type
 
 import pandas as pd
 
 from .BaseRetriever import BaseRetriever
+from .HealthMonitor import HealthMonitor
 from .BaseParser import BaseParser
+from .SingleFlight import SingleFlight
 
 
 
@@ -14,6 +16,11 @@ class BaseProcessor(ABC):
     Proporciona una estructura común y métodos básicos que pueden ser utilizados
     o sobreescritos por las clases derivadas.
     """
+    # Búsquedas en curso, compartidas por todas las instancias (cada workflow y cada sesión tienen las suyas)
+    _fetch_flights = SingleFlight()
+    # Clase del cliente o scraper que crea el procesador. Permite consultar la disponibilidad del
+    # proveedor (HealthMonitor) sin crear el procesador.
+    RETRIEVER_CLASS: Type[BaseRetriever] = None
     
     def __init__(self, retriever : BaseRetriever, parser: BaseParser):
         """
@@ -24,8 +31,9 @@ class BaseProcessor(ABC):
         self.parser = parser
         self.method_map = self.get_method_map()
 
+    @classmethod
     @abstractmethod
-    def get_method_map(self) -> Dict[str, str]:
+    def get_method_map(cls) -> Dict[str, str]:
         """
         Devuelve un diccionario que mapea nombres de métodos a sus implementaciones.
         Las clases derivadas deben implementar este método para proporcionar su propio mapeo.
@@ -35,13 +43,23 @@ class BaseProcessor(ABC):
         """
         pass
 
-    def get_status_code(self) -> int:
-        status = self.retriever.get_connection_code()
-        return status
+    def get_status_code(self, wait: bool = False) -> int:
+        """
+        Devuelve el último código de estado del proveedor comprobado por el HealthMonitor.
+
+        Args:
+            wait (bool): Si es True y el proveedor aún no se ha comprobado, espera a la comprobación.
+
+        Returns:
+            int: Código de estado HTTP o código de error (HEALTH_PENDING_CODE si está pendiente).
+        """
+        return HealthMonitor.get_instance().get_status_code(self.retriever, wait=wait)
 
     def fetch(self, filters: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
         """
         Obtiene los datos del gen usando el cliente y los procesa con el parser según los filtros.
+        Si otra búsqueda del mismo procesador con el mismo identificador está en curso, espera a
+        ella y procesa sus mismos datos en lugar de repetir las peticiones.
         
         Args:
             filters (Dict[str, Any]): Filtros de búsqueda y métodos de parser.
@@ -57,9 +75,59 @@ class BaseProcessor(ABC):
             raise ValueError("No se encontró un identificador de la fuente en los parámetros de búsqueda para el procesador.")
         
         search_id = search_params['search_id']
-        data = self.retriever.fetch(search_id)
+        flight_key = (
+            self.__class__.__name__,
+            tuple(search_id) if isinstance(search_id, list) else search_id,
+            self.get_retrieve_key(filters),
+        )
+        data = BaseProcessor._fetch_flights.do(flight_key, lambda: self.retrieve(search_id, filters))
         return self.parse_filters(data, filters)
 
+    def get_retrieve_key(self, filters: list) -> Hashable:
+        """
+        Devuelve los parámetros de los filtros que cambian los datos que obtiene retrieve. Dos
+        búsquedas simultáneas comparten la petición solo si coinciden en identificador y en esta clave.
+        Los procesadores que sobrescriben retrieve lo sobrescriben también.
+        
+        Args:
+            filters (list): Filtros del procesador.
+            
+        Returns:
+            Hashable: Clave de los parámetros de la petición (None si retrieve no depende de los filtros).
+        """
+        return None
+
+    def retrieve(self, search_id: Any, filters: list) -> Dict[str, Any]:
+        """
+        Obtiene los datos del retriever para un identificador. Los procesadores cuyo cliente puede
+        pedir solo parte de los datos lo sobrescriben para ajustar la petición a los métodos seleccionados.
+        
+        Args:
+            search_id (Any): Identificador de la búsqueda.
+            filters (list): Filtros del procesador, con los métodos del parser seleccionados.
+            
+        Returns:
+            Dict[str, Any]: Datos obtenidos del retriever.
+        """
+        return self.retriever.fetch(search_id)
+
+    def get_selected_methods(self, filters: list) -> list[str]:
+        """
+        Devuelve los métodos del parser seleccionados para este procesador en los filtros.
+        
+        Args:
+            filters (list): Filtros con la estructura de BaseFilter.
+            
+        Returns:
+            list[str]: Nombres de los métodos (NOMBRE_METODO) seleccionados.
+        """
+        return [
+            method_config.get("NOMBRE_METODO", "")
+            for processor in filters
+            if processor.get("PROCESSOR") == self.__class__.__name__
+            for method_config in processor.get("METODOS_PARSER", [])
+        ]
+
     def parse_filters(self, data: Dict[str, Any], filters: list[str, Any]) -> Dict[str, pd.DataFrame]:
         """
         Procesa los datos según los filtros configurados.
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
 
+from ..core.constants import HEALTH_CHECK_TIMEOUT
 from ..core.errors import BaseError, BaseHTTPError
+from ..core.SessionPool import SessionPool
 
 
 class BaseRetriever(ABC):
@@ -13,6 +17,8 @@ class BaseRetriever(ABC):
     con un servicio o API. Las clases derivadas deben implementar la lógica
     específica de conexión.
     """
+    # Versión de los datos del proveedor vista en la última comprobación (ver _set_data_version)
+    _data_version: Optional[Tuple[str, str]] = None
 
     @abstractmethod
     def fetch(self,id: str) -> dict:
@@ -33,7 +39,11 @@ class BaseRetriever(ABC):
     @staticmethod
     def _http_response(url: str, stream: bool = False) -> requests.Response:
         """
-        Método privado para realizar solicitudes HTTP
+        Método privado para realizar solicitudes HTTP.
+        Utiliza la sesión keep-alive del host gestionada por SessionPool, que aplica el límite de
+        peticiones del proveedor. Las respuestas 429 (tras agotar los reintentos) y 5xx lanzan
+        BaseHTTPError; las 4xx se devuelven, porque algunos proveedores responden así cuando no hay
+        resultados (p. ej. 404 de PharmGKB, 400 de Ensembl) y sus parsers tratan el cuerpo.
         
         Args:
             url (str): URL a consultar
@@ -43,13 +53,13 @@ class BaseRetriever(ABC):
             requests.Response: Datos JSON de la respuesta
             
         Raises:
-            BaseHTTPError: Si hay un error en la comunicación con la API
-            BaseParsingError: Si la respuesta no es un JSON válido
+            BaseHTTPError: Si el proveedor limita las peticiones o falla (429 o 5xx)
             BaseError: Para cualquier otro error inesperado
         """
         try:
-            response = requests.get(url, stream=stream, timeout=30)
-            #response.raise_for_status() check the status code
+            response = SessionPool.get_instance().request("GET", url, stream=stream)
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as http_err:
             raise BaseHTTPError(f"HTTP error: {http_err}")
@@ -59,13 +69,70 @@ class BaseRetriever(ABC):
     @staticmethod
     def _try_connection(url:str) -> bool:
         try:
-            requests.get(url,timeout=30)
+            SessionPool.get_instance().request("GET", url)
             return True
         except requests.exceptions.ConnectionError:
             return False
         except Exception as err:
             raise BaseError(f"Error inesperado: {err}")
 
+    @staticmethod
+    def _ping_request(url: str, method: str = "GET", **kwargs) -> Optional[requests.Response]:
+        """
+        Hace la petición HTTP de comprobación de disponibilidad de un servicio.
+
+        Args:
+            url (str): URL a consultar
+            method (str): Método HTTP de la petición (por defecto "GET")
+            **kwargs: Argumentos adicionales de la petición (por ejemplo ``json`` en un POST)
+
+        Returns:
+            Optional[requests.Response]: Respuesta del servicio o None si falla la conexión.
+        """
+        try:
+            return SessionPool.get_instance().request(method, url, timeout=HEALTH_CHECK_TIMEOUT, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            return None
+        except Exception as err:
+            raise BaseError(f"Error inesperado: {err}")
+
+    @staticmethod
+    def _ping_url(url: str, method: str = "GET", **kwargs) -> int:
+        """
+        Comprueba la disponibilidad de un servicio con una única petición HTTP.
+
+        Args:
+            url (str): URL a consultar
+            method (str): Método HTTP de la petición (por defecto "GET")
+            **kwargs: Argumentos adicionales de la petición (por ejemplo ``json`` en un POST)
+
+        Returns:
+            int: Código de estado HTTP de la respuesta o 999 si falla la conexión.
+        """
+        response = BaseRetriever._ping_request(url, method, **kwargs)
+        return 999 if response is None else response.status_code
+
+    def _set_data_version(self, url: str, version: Optional[str]) -> None:
+        """
+        Guarda la versión de los datos (release) que publica el proveedor, leída al comprobar su disponibilidad.
+
+        Args:
+            url (str): URL del servicio; su host identifica las respuestas del proveedor en la caché.
+            version (str, optional): Versión de los datos, o None si no se ha podido leer.
+        """
+        if version:
+            self._data_version = (urlsplit(url).netloc.lower(), str(version))
+
+    def get_data_version(self) -> Optional[Tuple[str, str]]:
+        """
+        Devuelve la versión de los datos del proveedor vista en la última comprobación de disponibilidad.
+
+        Returns:
+            Optional[Tuple[str, str]]: Host del proveedor y versión de sus datos, o None si el
+                proveedor no publica su versión o aún no se ha comprobado.
+        """
+        return self._data_version
+
     @abstractmethod
     def _ping_logic(self) -> int:
         """
@@ -89,6 +156,7 @@ class BaseRetriever(ABC):
                 Los códigos de error son:
                 - 1001: Error del scrapper al iniciar el driver
                 - 999: Error de conexión
+                - 1002: Comprobación pendiente (solo a través de HealthMonitor)
         """
         response = self._ping_logic()
         return response
@@ -1,16 +1,20 @@
 from abc import ABC, abstractmethod
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from typing import Dict, Any
-import tempfile
-import chromedriver_autoinstaller
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Any, Iterator
 
 from ..core.BaseRetriever import BaseRetriever
+from ..core.WebDriverPool import WebDriverPool, get_chrome_options
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
 
 
 class BaseScraper(BaseRetriever, ABC):
     """
     Clase abstracta que extiende BaseRetriever y define la configuración básica de un scraper.
+    Los navegadores Chrome no pertenecen al scraper: se piden prestados al WebDriverPool
+    del proceso durante cada búsqueda.
     """
     def __init__(self, base_url: str):
         """
@@ -20,62 +24,37 @@ class BaseScraper(BaseRetriever, ABC):
             base_url (str): URL base del sitio a scrapear
         """
         self.BASE_URL = base_url
-        self._tmpdir = tempfile.TemporaryDirectory()
-        self.unique_dir = self._tmpdir.name
-        self.chrome_options = self.getOptionsChromeDriver()
-        self.chrome_options.add_argument(f"--user-data-dir={self.unique_dir}")
-        chromedriver_autoinstaller.install()
-        
-        try:
-            self.driver = webdriver.Chrome(options=self.chrome_options)
-        except Exception as e:
-            print(f"Error al inicializar Chrome: {e}")
-            self.driver = None
+        self.driver_pool = WebDriverPool.get_instance()
 
-    def __del__(self):
-        """
-        Destructor para cerrar el navegador y eliminar el directorio temporal al eliminar la instancia.
-        Maneja silenciosamente cualquier excepción para evitar errores al finalizar el intérprete.
-        """
-        try:
-            if hasattr(self, 'driver') and self.driver:
-                self.driver.quit()
-        except Exception:
-            pass
-        try:
-            if hasattr(self, '_tmpdir'):
-                self._tmpdir.cleanup()
-        except Exception:
-            pass
-
-    def getOptionsChromeDriver(self) -> Options:
+    def getOptionsChromeDriver(self) -> "Options":
         """
         Configura y devuelve las opciones para instanciar ChromeDriver con Selenium.
 
         Returns:
             Options: Configuración de opciones de ChromeDriver.
         """
-        # Configuración de Chrome
-        options = Options()
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--ignore-certificate-errors")
-        options.add_argument("--incognito")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36")
-        options.add_argument("--headless")
-        options.add_argument("--verbose")
+        return get_chrome_options()
 
-        return options
+    @contextmanager
+    def lease_driver(self) -> Iterator["webdriver.Chrome"]:
+        """
+        Presta un navegador del pool durante el bloque ``with``. Si el bloque lanza una
+        excepción el navegador se descarta en lugar de devolverse al pool.
+
+        Yields:
+            webdriver.Chrome: Navegador listo para usarse.
+        """
+        with self.driver_pool.lease() as driver:
+            yield driver
     
     def ok(self) -> bool:
         """
-        Indica si el scraper está listo para operar.
+        Indica si el scraper está listo para operar (el pool puede iniciar Chrome).
 
         Returns:
             bool: True si está listo, False en caso contrario.
         """
-        return hasattr(self, 'driver') and self.driver is not None
+        return self.driver_pool.ok()
     
     def _ping_logic(self) -> int:
         """
@@ -88,24 +67,14 @@ class BaseScraper(BaseRetriever, ABC):
         if not self.ok():
             return 1001
             
-        if self._try_connection(self.BASE_URL):
-            response = self._http_response(self.BASE_URL)
-            return response.status_code
-        else:
-            return 999
+        return self._ping_url(self.BASE_URL)
     
     def reset_driver(self):
         """
-        Reinicia el driver en caso de error.
+        Descarta los navegadores libres del pool; los siguientes préstamos iniciarán navegadores nuevos.
+        Los navegadores que fallan durante un préstamo ya se descartan automáticamente.
         """
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
-        
-        try:
-            self.driver = webdriver.Chrome(options=self.chrome_options)
-        except Exception as e:
-            print(f"Error al reiniciar Chrome: {e}")
-            self.driver = None
+        self.driver_pool.discard_idle()
     
     @abstractmethod
     def fetch(self, id: str) -> Dict[str, Any]:
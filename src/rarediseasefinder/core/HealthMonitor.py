@@ -0,0 +1,222 @@
+"""
+HealthMonitor.py
+
+Comprobación periódica, en segundo plano, de la disponibilidad de los proveedores.
+Cada proveedor se comprueba una sola vez por intervalo aunque aparezca en varios workflows,
+y los códigos de estado se sirven desde memoria sin bloquear a quien los consulta. La versión
+de los datos que publican algunos proveedores se registra en la caché de respuestas, que
+descarta las respuestas de versiones anteriores.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from .ResponseCache import ResponseCache
+from .constants import (
+    HEALTH_CHECK_ENABLED,
+    HEALTH_CHECK_INTERVAL,
+    HEALTH_CHECK_MAX_WORKERS,
+    HEALTH_PENDING_CODE,
+)
+
+
+class HealthMonitor:
+    """
+    Monitor de disponibilidad de los proveedores de datos.
+
+    Se usa como instancia única de proceso (``HealthMonitor.get_instance()``). Los recuperadores
+    se registran la primera vez que se consulta su estado y se agrupan por clase, de modo que
+    todas las instancias de un mismo proveedor comparten una única comprobación. Se pueden
+    registrar por clase: el monitor crea su propia instancia al comprobarlos por primera vez,
+    sin crear los procesadores que los usan. Un hilo en
+    segundo plano ejecuta ``get_connection_code`` de cada proveedor cada ``interval`` segundos;
+    mientras no hay resultado el código devuelto es HEALTH_PENDING_CODE. Con
+    RAREDISEASEFINDER_HEALTH_CHECKS=0 el hilo no arranca y solo se comprueba con ``wait=True``.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, interval: float = HEALTH_CHECK_INTERVAL, max_workers: int = HEALTH_CHECK_MAX_WORKERS):
+        """
+        Inicializa el monitor. El hilo de comprobación se arranca al registrar el primer proveedor.
+
+        Args:
+            interval (float): Segundos entre dos comprobaciones del mismo proveedor.
+            max_workers (int): Número máximo de proveedores comprobados a la vez.
+        """
+        self.interval = interval
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_instance(cls) -> "HealthMonitor":
+        """
+        Devuelve la instancia compartida del monitor, creándola si no existe.
+
+        Returns:
+            HealthMonitor: Monitor del proceso.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def get_key(retriever) -> str:
+        """
+        Devuelve la clave con la que se agrupan las comprobaciones de un recuperador.
+
+        Args:
+            retriever (BaseRetriever | Type[BaseRetriever]): Cliente o scraper del proveedor, o su clase.
+
+        Returns:
+            str: Nombre de la clase del recuperador.
+        """
+        return (retriever if isinstance(retriever, type) else type(retriever)).__name__
+
+    def register(self, retriever) -> str:
+        """
+        Registra un proveedor para su comprobación periódica. Si ya estaba registrado no hace nada.
+
+        Args:
+            retriever (BaseRetriever | Type[BaseRetriever]): Cliente o scraper del proveedor, o su clase.
+
+        Returns:
+            str: Clave del proveedor en el monitor.
+        """
+        key = self.get_key(retriever)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = {
+                    "retriever": retriever,
+                    "status_code": HEALTH_PENDING_CODE,
+                    "checked_at": None,
+                    "elapsed": None,
+                    "data_version": None,
+                    "checking": False,
+                }
+                self._wake.set()
+            self._start()
+        return key
+
+    def get_status_code(self, retriever, wait: bool = False) -> int:
+        """
+        Devuelve el último código de estado conocido de un proveedor.
+
+        Args:
+            retriever (BaseRetriever | Type[BaseRetriever]): Cliente o scraper del proveedor, o su clase.
+            wait (bool): Si es True y el proveedor aún no se ha comprobado, lo comprueba en el momento.
+
+        Returns:
+            int: Código de estado HTTP, código de error (999, 1001) o HEALTH_PENDING_CODE
+                si la primera comprobación no ha terminado.
+        """
+        key = self.register(retriever)
+        if wait:
+            while self._entries[key]["checked_at"] is None:
+                self._check(key)
+                if self._entries[key]["checked_at"] is None:
+                    # La comprobación está en curso en el hilo del monitor
+                    time.sleep(0.1)
+        return self._entries[key]["status_code"]
+
+    def refresh(self) -> None:
+        """Marca todos los proveedores para comprobarse en la siguiente vuelta del hilo."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry["checked_at"] = None
+        self._wake.set()
+
+    def _start(self) -> None:
+        if not HEALTH_CHECK_ENABLED:
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+            self._thread.start()
+
+    def _check(self, key: str) -> None:
+        """Comprueba un proveedor y guarda el resultado. Las comprobaciones simultáneas se descartan."""
+        with self._lock:
+            entry = self._entries[key]
+            if entry["checking"]:
+                return
+            entry["checking"] = True
+        start = time.monotonic()
+        data_version = None
+        try:
+            if isinstance(entry["retriever"], type):
+                # Registrado por clase: el monitor usa su propia instancia del recuperador
+                entry["retriever"] = entry["retriever"]()
+            status_code = entry["retriever"].get_connection_code()
+            data_version = entry["retriever"].get_data_version()
+        except Exception as e:
+            print(f"⚠️ Error al comprobar la disponibilidad de {key}: {str(e)}")
+            status_code = 999
+        if data_version is not None:
+            ResponseCache.get_instance().update_data_version(*data_version)
+        with self._lock:
+            entry["data_version"] = data_version[1] if data_version is not None else entry["data_version"]
+            entry["status_code"] = status_code
+            entry["checked_at"] = time.time()
+            entry["elapsed"] = round(time.monotonic() - start, 3)
+            entry["checking"] = False
+
+    def _due(self) -> tuple:
+        """Devuelve los proveedores pendientes de comprobar y los segundos hasta el siguiente."""
+        now = time.time()
+        due, next_in = [], self.interval
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry["checking"]:
+                    continue
+                if entry["checked_at"] is None:
+                    due.append(key)
+                    continue
+                remaining = entry["checked_at"] + self.interval - now
+                if remaining <= 0:
+                    due.append(key)
+                else:
+                    next_in = min(next_in, remaining)
+        return due, next_in
+
+    def _run(self) -> None:
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="health-check") as pool:
+            while not self._stopped.is_set():
+                self._wake.clear()
+                due, next_in = self._due()
+                if due:
+                    list(pool.map(self._check, due))
+                    continue
+                self._wake.wait(timeout=next_in)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Devuelve el estado de cada proveedor registrado.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Código de estado, fecha de la última comprobación (epoch),
+                duración de la comprobación y versión de los datos (si el proveedor la publica) por proveedor.
+        """
+        with self._lock:
+            return {
+                key: {
+                    "status_code": entry["status_code"],
+                    "checked_at": entry["checked_at"],
+                    "elapsed": entry["elapsed"],
+                    "data_version": entry["data_version"],
+                }
+                for key, entry in self._entries.items()
+            }
+
+    def stop(self) -> None:
+        """Detiene el hilo de comprobación tras la vuelta en curso."""
+        self._stopped.set()
+        self._wake.set()
@@ -0,0 +1,213 @@
+"""
+RateLimiter.py
+
+Límite de peticiones por proveedor para todas las peticiones HTTP (ver SessionPool.request).
+Cada host tiene un cubo de tokens (peticiones por segundo y ráfaga) y un número máximo de
+peticiones en curso a la vez, configurados en RATE_LIMIT_BY_HOST. Cuando un proveedor responde
+con Retry-After, las siguientes peticiones al host esperan el tiempo indicado.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
+
+from .constants import RATE_LIMIT_ENABLED, RATE_LIMIT_DEFAULTS, RATE_LIMIT_BY_HOST
+
+
+class HostRateLimiter:
+    """
+    Cubo de tokens y semáforo de peticiones en curso de un host.
+
+    Los tokens se reservan por orden de llegada: si no quedan, la petición espera hasta que se
+    repone el suyo, sin adelantar a las que ya esperaban.
+    """
+
+    def __init__(self, host: str, rate: Optional[float] = None, burst: int = 1,
+                 max_in_flight: Optional[int] = None):
+        """
+        Inicializa el límite de un host.
+
+        Args:
+            host (str): Host del proveedor.
+            rate (float, optional): Peticiones por segundo. None para no limitar el ritmo.
+            burst (int): Peticiones que se pueden hacer seguidas sin esperar.
+            max_in_flight (int, optional): Peticiones en curso a la vez. None para no limitarlas.
+        """
+        self.host = host
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.max_in_flight = max_in_flight
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._stats = {"requests": 0, "throttled": 0, "wait_time": 0.0, "retry_after": 0,
+                       "in_flight": 0, "max_in_flight_seen": 0}
+
+    def _reserve(self) -> float:
+        """Reserva un token y devuelve los segundos que hay que esperar para usarlo."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._blocked_until - now, 0.0)
+            if self.rate:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Espera a que el host admita una petición más y la cuenta como en curso hasta salir del bloque.
+
+        Yields:
+            None
+        """
+        start = time.monotonic()
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                time.sleep(wait)
+            waited = time.monotonic() - start
+            with self._lock:
+                self._stats["requests"] += 1
+                self._stats["wait_time"] += waited
+                if waited > 0.001:
+                    self._stats["throttled"] += 1
+                self._stats["in_flight"] += 1
+                self._stats["max_in_flight_seen"] = max(self._stats["max_in_flight_seen"], self._stats["in_flight"])
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._stats["in_flight"] -= 1
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def defer(self, seconds: float) -> None:
+        """
+        Retrasa todas las peticiones al host (respuesta 429/503 con Retry-After o sin él).
+
+        Args:
+            seconds (float): Segundos durante los que no se hacen peticiones al host.
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._stats["retry_after"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Devuelve la configuración y los contadores del host.
+
+        Returns:
+            Dict[str, Any]: Límites, peticiones, peticiones que han esperado, tiempo de espera
+                acumulado, esperas por Retry-After y peticiones en curso (actuales y máximo visto).
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["wait_time"] = round(stats["wait_time"], 6)
+        stats.update({"rate": self.rate, "burst": self.burst, "max_in_flight": self.max_in_flight})
+        return stats
+
+
+class RateLimiter:
+    """
+    Registro de los límites de peticiones por host.
+
+    Se usa como instancia única de proceso (``RateLimiter.get_instance()``). La configuración
+    se toma de RATE_LIMIT_DEFAULTS y RATE_LIMIT_BY_HOST; con RAREDISEASEFINDER_RATE_LIMITS=0
+    no se limita ningún host.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, enabled: bool = RATE_LIMIT_ENABLED):
+        """
+        Inicializa el registro.
+
+        Args:
+            enabled (bool): Si es False los hosts no tienen límite de ritmo ni de peticiones en curso.
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, HostRateLimiter] = {}
+
+    @classmethod
+    def get_instance(cls) -> "RateLimiter":
+        """
+        Devuelve la instancia compartida, creándola si no existe.
+
+        Returns:
+            RateLimiter: Límites de peticiones del proceso.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def get_limiter(self, host: str) -> HostRateLimiter:
+        """
+        Devuelve el límite de un host, creándolo con su configuración si no existe.
+
+        Args:
+            host (str): Host del proveedor (por ejemplo "grch37.rest.ensembl.org").
+
+        Returns:
+            HostRateLimiter: Límite del host.
+        """
+        limiter = self._limiters.get(host)
+        if limiter is not None:
+            return limiter
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                config = dict(RATE_LIMIT_DEFAULTS)
+                config.update(RATE_LIMIT_BY_HOST.get(host, {}))
+                if not self.enabled:
+                    config.update(rate=None, max_in_flight=None)
+                limiter = HostRateLimiter(host, **config)
+                self._limiters[host] = limiter
+        return limiter
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Convierte el valor de la cabecera Retry-After (segundos o fecha HTTP) en segundos de espera.
+
+        Args:
+            value (str, optional): Valor de la cabecera.
+
+        Returns:
+            Optional[float]: Segundos de espera, o None si la cabecera no existe o no es válida.
+        """
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Devuelve los contadores de todos los hosts usados.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Contadores por host (ver HostRateLimiter.get_stats).
+        """
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.host: limiter.get_stats() for limiter in limiters}
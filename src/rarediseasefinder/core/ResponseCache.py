@@ -0,0 +1,388 @@
+"""
+ResponseCache.py
+
+Caché persistente en disco (SQLite) para las respuestas de los proveedores de datos.
+Las entradas se direccionan por contenido (hash del método, la URL y el cuerpo de la
+petición, incluidas las consultas GraphQL), caducan según el TTL de cada proveedor y
+se expulsan por orden LRU cuando la caché supera su tamaño máximo. Las respuestas de los
+proveedores que publican la versión de sus datos se eliminan cuando cambia la versión.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .constants import (
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_DEFAULT_TTL,
+    RESPONSE_CACHE_ACCESS_FLUSH,
+    RESPONSE_CACHE_TTL_BY_HOST,
+)
+
+
+class ResponseCache:
+    """
+    Caché de respuestas HTTP compartida por todos los clientes (BaseClient).
+
+    Se usa como instancia única de proceso (``ResponseCache.get_instance()``). Varios procesos
+    pueden compartir el mismo fichero SQLite.
+
+    Los aciertos no escriben en la base de datos: su último acceso se guarda en memoria y se
+    escribe de una vez cada RESPONSE_CACHE_ACCESS_FLUSH aciertos o antes de expulsar entradas.
+    El tamaño ocupado también se lleva en memoria y solo se vuelve a sumar en la base de datos
+    cuando parece superar el máximo (puede haber cambiado por otro proceso).
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, cache_dir: str = RESPONSE_CACHE_DIR, max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+                 enabled: bool = RESPONSE_CACHE_ENABLED):
+        """
+        Inicializa la caché y crea la base de datos si no existe.
+
+        Args:
+            cache_dir (str): Directorio donde se guarda el fichero SQLite.
+            max_bytes (int): Tamaño máximo de las respuestas almacenadas.
+            enabled (bool): Si es False la caché no lee ni escribe entradas.
+        """
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.db_path = os.path.join(cache_dir, "responses.sqlite3")
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._pending_access: Dict[str, float] = {}
+        self._total_size = 0
+        self._conn = None
+        if self.enabled:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    meta TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS data_versions (
+                    namespace TEXT PRIMARY KEY,
+                    version TEXT NOT NULL,
+                    updated REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            self._total_size = self._read_total_size()
+
+    @classmethod
+    def get_instance(cls) -> "ResponseCache":
+        """
+        Devuelve la instancia compartida de la caché, creándola si no existe.
+
+        Returns:
+            ResponseCache: Caché de respuestas del proceso.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Calcula la clave de una entrada a partir de sus componentes (JSON canónico + SHA-256).
+
+        Args:
+            *parts: Componentes serializables a JSON que identifican la entrada.
+
+        Returns:
+            str: Clave hexadecimal.
+        """
+        canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_ttl(namespace: str) -> int:
+        """
+        Devuelve el TTL (segundos) configurado para un espacio de nombres (host del proveedor).
+
+        Args:
+            namespace (str): Host del proveedor u otro espacio de nombres.
+
+        Returns:
+            int: TTL en segundos.
+        """
+        return RESPONSE_CACHE_TTL_BY_HOST.get(namespace, RESPONSE_CACHE_DEFAULT_TTL)
+
+    def _count(self, namespace: str, counter: str) -> None:
+        stats = self._stats.setdefault(namespace, {"hits": 0, "misses": 0, "stores": 0, "evictions": 0})
+        stats[counter] += 1
+
+    def _read_total_size(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _flush_access(self) -> None:
+        """Escribe en la base de datos el último acceso de los aciertos pendientes (sin commit)."""
+        if self._pending_access:
+            self._conn.executemany("UPDATE entries SET last_access = ? WHERE key = ?",
+                                   [(last_access, key) for key, last_access in self._pending_access.items()])
+            self._pending_access.clear()
+
+    def get(self, namespace: str, key: str, ttl: Optional[int] = None) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """
+        Recupera una entrada si existe y no ha caducado.
+
+        Args:
+            namespace (str): Espacio de nombres de la entrada (host del proveedor).
+            key (str): Clave de la entrada.
+            ttl (int, optional): TTL en segundos. Por defecto el configurado para el espacio de nombres.
+
+        Returns:
+            Optional[Tuple[bytes, Dict[str, Any]]]: Contenido y metadatos, o None si no hay entrada válida.
+        """
+        if not self.enabled:
+            return None
+        ttl = self.get_ttl(namespace) if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, meta, size, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count(namespace, "misses")
+                return None
+            payload, meta, size, created = row
+            if now - created > ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._pending_access.pop(key, None)
+                self._conn.commit()
+                self._total_size -= size
+                self._count(namespace, "misses")
+                return None
+            self._pending_access[key] = now
+            if len(self._pending_access) >= RESPONSE_CACHE_ACCESS_FLUSH:
+                self._flush_access()
+                self._conn.commit()
+            self._count(namespace, "hits")
+        return bytes(payload), json.loads(meta)
+
+    def put(self, namespace: str, key: str, payload: bytes, meta: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Guarda una entrada y expulsa las menos usadas si se supera el tamaño máximo.
+
+        Args:
+            namespace (str): Espacio de nombres de la entrada (host del proveedor).
+            key (str): Clave de la entrada.
+            payload (bytes): Contenido a guardar.
+            meta (Dict[str, Any], optional): Metadatos serializables a JSON.
+        """
+        if not self.enabled or len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._pending_access.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, namespace, payload, meta, size, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, namespace, sqlite3.Binary(payload), json.dumps(meta or {}), len(payload), now, now),
+            )
+            self._total_size += len(payload) - (previous[0] if previous else 0)
+            self._count(namespace, "stores")
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Expulsa las entradas con acceso más antiguo hasta volver por debajo del tamaño máximo."""
+        if self._total_size <= self.max_bytes:
+            return
+        self._total_size = total = self._read_total_size()
+        if total <= self.max_bytes:
+            return
+        self._flush_access()
+        for key, namespace, size in self._conn.execute(
+            "SELECT key, namespace, size FROM entries ORDER BY last_access ASC"
+        ).fetchall():
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._count(namespace, "evictions")
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._total_size = total
+
+    def get_response(self, method: str, url: str, body: Any = None) -> Optional[requests.Response]:
+        """
+        Devuelve una respuesta HTTP almacenada para la petición indicada.
+
+        Args:
+            method (str): Método HTTP.
+            url (str): URL de la petición.
+            body (Any, optional): Cuerpo de la petición (JSON o datos de formulario, p. ej. consulta GraphQL).
+
+        Returns:
+            Optional[requests.Response]: Respuesta reconstruida o None si no está en caché.
+        """
+        namespace = urlsplit(url).netloc.lower()
+        entry = self.get(namespace, self.make_key(method.upper(), url, body))
+        if entry is None:
+            return None
+        payload, meta = entry
+        response = requests.Response()
+        response.status_code = meta.get("status_code", 200)
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = url
+        response._content = payload
+        response._content_consumed = True
+        return response
+
+    def store_response(self, method: str, url: str, response: requests.Response, body: Any = None) -> None:
+        """
+        Guarda una respuesta HTTP si es cacheable: código 200 y, si es JSON, sin lista de errores
+        (las APIs GraphQL responden 200 con "errors" cuando la consulta falla). Lee el cuerpo
+        completo de la respuesta.
+
+        Args:
+            method (str): Método HTTP.
+            url (str): URL de la petición.
+            response (requests.Response): Respuesta a guardar.
+            body (Any, optional): Cuerpo de la petición usado para calcular la clave.
+        """
+        if not self.enabled or response.status_code != 200:
+            return
+        if self._has_errors(response):
+            return
+        namespace = urlsplit(url).netloc.lower()
+        meta = {
+            "status_code": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() == "content-type"},
+        }
+        self.put(namespace, self.make_key(method.upper(), url, body), response.content, meta)
+
+    @staticmethod
+    def _has_errors(response: requests.Response) -> bool:
+        """Indica si una respuesta JSON trae una lista de errores no vacía (respuesta GraphQL fallida)."""
+        if "json" not in response.headers.get("Content-Type", "").lower() or b'"errors"' not in response.content:
+            return False
+        try:
+            data = response.json()
+        except ValueError:
+            return False
+        return isinstance(data, dict) and bool(data.get("errors"))
+
+    def store_json(self, method: str, url: str, data: Any, body: Any = None) -> None:
+        """
+        Guarda como respuesta de una petición unos datos JSON obtenidos por otra vía (por ejemplo,
+        la parte de una respuesta por lotes que corresponde a la petición individual).
+
+        Args:
+            method (str): Método HTTP de la petición individual.
+            url (str): URL de la petición individual.
+            data (Any): Datos serializables a JSON.
+            body (Any, optional): Cuerpo de la petición individual usado para calcular la clave.
+        """
+        if not self.enabled:
+            return
+        namespace = urlsplit(url).netloc.lower()
+        meta = {"status_code": 200, "headers": {"Content-Type": "application/json"}}
+        self.put(namespace, self.make_key(method.upper(), url, body), json.dumps(data).encode("utf-8"), meta)
+
+    def update_data_version(self, namespace: str, version: str) -> bool:
+        """
+        Registra la versión de los datos de un proveedor. Si es distinta de la registrada, elimina
+        todas las respuestas guardadas del proveedor, que pertenecen a la versión anterior.
+
+        Args:
+            namespace (str): Host del proveedor.
+            version (str): Versión de los datos publicada por el proveedor.
+
+        Returns:
+            bool: True si la versión ha cambiado y se han eliminado las respuestas del proveedor.
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM data_versions WHERE namespace = ?", (namespace,)
+            ).fetchone()
+            if row is not None and row[0] == version:
+                return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO data_versions (namespace, version, updated) VALUES (?, ?, ?)",
+                (namespace, version, time.time()),
+            )
+            if row is not None:
+                self._flush_access()
+                self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+                self._total_size = self._read_total_size()
+            self._conn.commit()
+        if row is not None:
+            print(f"\033[33mNueva versión de los datos de {namespace} ({row[0]} -> {version}): "
+                  f"se eliminan sus respuestas de la caché\033[0m")
+        return row is not None
+
+    def get_data_versions(self) -> Dict[str, str]:
+        """
+        Devuelve la última versión registrada de los datos de cada proveedor que la publica.
+
+        Returns:
+            Dict[str, str]: Versión de los datos por host.
+        """
+        if not self.enabled:
+            return {}
+        with self._lock:
+            return dict(self._conn.execute("SELECT namespace, version FROM data_versions").fetchall())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Devuelve los contadores de la caché por espacio de nombres y el tamaño ocupado.
+
+        Returns:
+            Dict[str, Any]: Aciertos, fallos, escrituras y expulsiones por host, número de entradas y bytes.
+        """
+        stats: Dict[str, Any] = {"enabled": self.enabled, "namespaces": {k: dict(v) for k, v in self._stats.items()}}
+        if self.enabled:
+            with self._lock:
+                entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            stats.update({"entries": entries, "size_bytes": size})
+        return stats
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Elimina todas las entradas o solo las de un espacio de nombres.
+
+        Args:
+            namespace (str, optional): Host del proveedor cuyas entradas se eliminan.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._flush_access()
+            if namespace is None:
+                self._conn.execute("DELETE FROM entries")
+            else:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            self._total_size = self._read_total_size()
+            self._conn.commit()
@@ -0,0 +1,301 @@
+"""
+SessionPool.py
+
+Pool de sesiones HTTP compartido por todos los recuperadores (clientes y scrapers).
+Mantiene una sesión ``requests.Session`` con conexiones keep-alive por cada host,
+configurable por proveedor, y registra estadísticas de uso del pool. Todas las peticiones
+respetan el límite de peticiones del host (ver RateLimiter).
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .RateLimiter import RateLimiter
+from .constants import (
+    HTTP_POOL_DEFAULTS,
+    HTTP_POOL_CONFIG_BY_HOST,
+    RATE_LIMIT_RETRY_STATUS,
+    RATE_LIMIT_MAX_RETRIES,
+    RATE_LIMIT_BACKOFF,
+    RATE_LIMIT_MAX_RETRY_AFTER,
+)
+
+
+class PoolStats:
+    """
+    Contadores de uso del pool de conexiones de un host.
+
+    Attributes:
+        requests (int): Número total de peticiones realizadas.
+        new_connections (int): Número de conexiones TCP/TLS abiertas.
+        wait_time (float): Tiempo acumulado (segundos) esperando una conexión libre.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.wait_time = 0.0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_time += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Devuelve los contadores como diccionario.
+
+        Returns:
+            Dict[str, Any]: Peticiones, aciertos (conexiones reutilizadas),
+                conexiones nuevas y tiempo de espera acumulado.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hits": max(self.requests - self.new_connections, 0),
+                "new_connections": self.new_connections,
+                "wait_time": round(self.wait_time, 6),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Mixin para los pools de urllib3 que registra conexiones abiertas y tiempos de espera."""
+
+    pool_stats: Optional[PoolStats] = None
+
+    def _get_conn(self, timeout=None):
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout=timeout)
+        if self.pool_stats:
+            self.pool_stats.record_wait(time.perf_counter() - start)
+            # Una conexión sin socket (nueva o cerrada por el servidor) obliga a un nuevo handshake
+            if getattr(conn, "sock", None) is None:
+                self.pool_stats.record_new_connection()
+        return conn
+
+
+class _InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _InstrumentedPoolManager(PoolManager):
+    """PoolManager que crea pools instrumentados asociados a un objeto PoolStats."""
+
+    def __init__(self, *args, pool_stats: PoolStats = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_stats = pool_stats
+        self.pool_classes_by_scheme = {
+            "http": _InstrumentedHTTPConnectionPool,
+            "https": _InstrumentedHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool.pool_stats = self.pool_stats
+        return pool
+
+
+class _InstrumentedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter que utiliza un PoolManager instrumentado."""
+
+    def __init__(self, pool_stats: PoolStats, **kwargs):
+        self.pool_stats = pool_stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _InstrumentedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            pool_stats=self.pool_stats,
+            **pool_kwargs,
+        )
+
+
+class SessionPool:
+    """
+    Gestor de sesiones HTTP con una sesión keep-alive por host.
+
+    Se usa como instancia única de proceso (``SessionPool.get_instance()``) para que
+    todas las subclases de BaseRetriever reutilicen las conexiones ya abiertas.
+    La configuración por host se toma de ``HTTP_POOL_CONFIG_BY_HOST`` y puede
+    modificarse en tiempo de ejecución con ``configure_host``.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._stats: Dict[str, PoolStats] = {}
+        self._host_config: Dict[str, Dict[str, Any]] = {
+            host: dict(config) for host, config in HTTP_POOL_CONFIG_BY_HOST.items()
+        }
+
+    @classmethod
+    def get_instance(cls) -> "SessionPool":
+        """
+        Devuelve la instancia compartida del pool, creándola si no existe.
+
+        Returns:
+            SessionPool: Pool de sesiones del proceso.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def get_host_config(self, host: str) -> Dict[str, Any]:
+        """
+        Devuelve la configuración efectiva de un host (valores por defecto + específicos).
+
+        Args:
+            host (str): Host del proveedor (por ejemplo "rest.uniprot.org").
+
+        Returns:
+            Dict[str, Any]: Configuración del pool para el host.
+        """
+        config = dict(HTTP_POOL_DEFAULTS)
+        config.update(self._host_config.get(host, {}))
+        return config
+
+    def configure_host(self, host: str, **options: Any) -> None:
+        """
+        Modifica la configuración del pool de un host. Si ya existía una sesión para
+        el host se cierra, y la siguiente petición abrirá una nueva con la configuración actualizada.
+
+        Args:
+            host (str): Host del proveedor.
+            **options: Claves de HTTP_POOL_DEFAULTS a sobrescribir
+                (pool_connections, pool_maxsize, pool_block, keep_alive, timeout).
+        """
+        unknown = set(options) - set(HTTP_POOL_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Opciones de pool desconocidas: {sorted(unknown)}")
+        host = host.lower()
+        with self._lock:
+            self._host_config.setdefault(host, {}).update(options)
+            session = self._sessions.pop(host, None)
+        if session:
+            session.close()
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Devuelve la sesión asociada al host de la URL, creándola si es necesario.
+
+        Args:
+            url (str): URL de la petición.
+
+        Returns:
+            requests.Session: Sesión con el pool de conexiones del host.
+        """
+        host = self._get_host(url)
+        session = self._sessions.get(host)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session(host)
+                self._sessions[host] = session
+        return session
+
+    def _create_session(self, host: str) -> requests.Session:
+        config = self.get_host_config(host)
+        stats = self._stats.setdefault(host, PoolStats())
+        adapter = _InstrumentedHTTPAdapter(
+            pool_stats=stats,
+            pool_connections=config["pool_connections"],
+            pool_maxsize=config["pool_maxsize"],
+            pool_block=config["pool_block"],
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not config["keep_alive"]:
+            session.headers["Connection"] = "close"
+        return session
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        """
+        Realiza una petición HTTP usando la sesión del host, dentro del límite de peticiones del host.
+        Si el proveedor responde 429 (o 503 con Retry-After), espera lo indicado y repite la petición
+        hasta RATE_LIMIT_MAX_RETRIES veces; la espera se aplica a todas las peticiones al host.
+
+        Args:
+            method (str): Método HTTP ("GET", "POST", ...).
+            url (str): URL a consultar.
+            timeout (float, optional): Timeout de la petición. Si no se indica se usa el del host.
+            **kwargs: Argumentos adicionales para ``requests.Session.request``.
+
+        Returns:
+            requests.Response: Respuesta HTTP (la del último intento si se agotan los reintentos).
+        """
+        host = self._get_host(url)
+        session = self.get_session(url)
+        if timeout is None:
+            timeout = self.get_host_config(host)["timeout"]
+        limiter = RateLimiter.get_instance().get_limiter(host)
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            with limiter.slot():
+                self._stats[host].record_request()
+                response = session.request(method, url, timeout=timeout, **kwargs)
+            if response.status_code not in RATE_LIMIT_RETRY_STATUS or attempt == RATE_LIMIT_MAX_RETRIES:
+                return response
+            delay = RateLimiter.parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                if response.status_code != 429:
+                    # 503 sin Retry-After: el proveedor no está disponible, no se reintenta
+                    return response
+                delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+            delay = min(delay, RATE_LIMIT_MAX_RETRY_AFTER)
+            print(f"\033[33m{host} ha respondido {response.status_code}: se reintenta en {delay:.1f} s\033[0m")
+            limiter.defer(delay)
+            response.close()
+        return response
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Devuelve las estadísticas del pool por host.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Por cada host: peticiones, aciertos (conexiones reutilizadas),
+                conexiones nuevas y tiempo de espera acumulado.
+        """
+        return {host: stats.to_dict() for host, stats in self._stats.items()}
+
+    def close(self) -> None:
+        """Cierra todas las sesiones abiertas. Las estadísticas se conservan."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
@@ -0,0 +1,76 @@
+"""
+SingleFlight.py
+
+Agrupación de llamadas idénticas simultáneas: si varias hebras piden a la vez el mismo recurso
+(misma clave), solo la primera ejecuta la llamada y el resto esperan y reciben su resultado.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Ejecuta como mucho una llamada en curso por clave.
+
+    Las llamadas que llegan mientras otra con la misma clave está en curso no se ejecutan: esperan
+    a la primera y reciben su mismo resultado o su misma excepción. En cuanto la llamada termina la
+    clave se libera, de modo que las llamadas posteriores se vuelven a ejecutar (el almacenamiento
+    de resultados corresponde a las cachés).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._stats = {"calls": 0, "shared": 0}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Ejecuta la función si no hay otra llamada en curso con la misma clave, o espera a la que hay.
+
+        Args:
+            key (Hashable): Clave que identifica el recurso pedido.
+            function (Callable[[], Any]): Llamada a ejecutar.
+
+        Returns:
+            Any: Resultado de la llamada (compartido entre todas las que esperaban).
+
+        Raises:
+            Exception: La excepción lanzada por la llamada.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._stats["shared"] += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self._stats["calls"] += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Devuelve el número de llamadas ejecutadas y de llamadas que han reutilizado una en curso.
+
+        Returns:
+            Dict[str, int]: Contadores "calls" y "shared".
+        """
+        with self._lock:
+            return dict(self._stats)
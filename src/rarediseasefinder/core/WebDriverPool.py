@@ -0,0 +1,367 @@
+"""
+WebDriverPool.py
+
+Pool de navegadores Chrome (Selenium) compartido por todos los scrapers del proceso.
+Limita el número de navegadores abiertos, reutiliza los que están en buen estado,
+los recicla tras un número máximo de páginas y descarta los que fallan.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from .errors import BaseError
+from .constants import (
+    WEBDRIVER_POOL_SIZE,
+    WEBDRIVER_MAX_PAGES,
+    WEBDRIVER_LEASE_TIMEOUT,
+    WEBDRIVER_RETRY_INTERVAL,
+    CHROMEDRIVER_CACHE_PATH,
+    CHROMEDRIVER_CHECK_TTL,
+)
+
+# Selenium y chromedriver_autoinstaller se importan al iniciar el primer navegador
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+
+def get_chrome_options() -> "Options":
+    """
+    Configura y devuelve las opciones para instanciar ChromeDriver con Selenium.
+
+    Returns:
+        Options: Configuración de opciones de ChromeDriver.
+    """
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-infobars")
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--ignore-certificate-errors")
+    options.add_argument("--incognito")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36")
+    options.add_argument("--headless")
+    options.add_argument("--verbose")
+
+    return options
+
+
+def install_chromedriver() -> None:
+    """
+    Instala, si hace falta, el chromedriver compatible con el Chrome del sistema y lo añade al PATH.
+
+    La comprobación de versión de chromedriver_autoinstaller puede requerir acceso a red, por lo que
+    la ruta del chromedriver instalado se guarda en disco (CHROMEDRIVER_CACHE_PATH) y no se vuelve
+    a comprobar hasta pasados CHROMEDRIVER_CHECK_TTL segundos.
+    """
+    try:
+        with open(CHROMEDRIVER_CACHE_PATH, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    path = cached.get("path")
+    if path and os.path.isfile(path) and time.time() - cached.get("checked_at", 0) < CHROMEDRIVER_CHECK_TTL:
+        directory = os.path.dirname(path)
+        if directory not in os.environ.get("PATH", "").split(os.pathsep):
+            os.environ["PATH"] = directory + os.pathsep + os.environ.get("PATH", "")
+        return
+
+    import chromedriver_autoinstaller
+
+    path = chromedriver_autoinstaller.install()
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE_PATH), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"path": str(path), "checked_at": time.time()}, f)
+    except OSError as e:
+        print(f"⚠️ No se ha podido guardar la ruta de chromedriver: {str(e)}")
+
+
+class PooledDriver:
+    """
+    Navegador gestionado por el pool.
+
+    Attributes:
+        driver (webdriver.Chrome): Instancia de Chrome.
+        pages (int): Número de préstamos (páginas) atendidos por el navegador.
+        discard (bool): Si es True el navegador se cierra al devolverlo al pool.
+    """
+
+    def __init__(self, driver: "webdriver.Chrome", tmpdir: tempfile.TemporaryDirectory):
+        self.driver = driver
+        self._tmpdir = tmpdir
+        self.pages = 0
+        self.discard = False
+
+    def is_healthy(self) -> bool:
+        """
+        Comprueba que el navegador sigue respondiendo.
+
+        Returns:
+            bool: True si el navegador responde, False en caso contrario.
+        """
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def quit(self) -> None:
+        """Cierra el navegador y elimina su directorio temporal."""
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        try:
+            self._tmpdir.cleanup()
+        except Exception:
+            pass
+
+
+class WebDriverPool:
+    """
+    Pool de navegadores Chrome con semántica de préstamo/devolución.
+
+    Se usa como instancia única de proceso (``WebDriverPool.get_instance()``). Los scrapers
+    piden un navegador con ``lease()`` solo durante cada búsqueda, de modo que varios
+    scrapers comparten un número acotado de navegadores ya iniciados.
+
+    Example:
+        with WebDriverPool.get_instance().lease() as driver:
+            driver.get(url)
+            html = driver.page_source
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, size: int = WEBDRIVER_POOL_SIZE, max_pages: int = WEBDRIVER_MAX_PAGES,
+                 lease_timeout: float = WEBDRIVER_LEASE_TIMEOUT):
+        """
+        Inicializa el pool. Los navegadores se crean bajo demanda.
+
+        Args:
+            size (int): Número máximo de navegadores abiertos a la vez.
+            max_pages (int): Número de préstamos tras los que un navegador se recicla.
+            lease_timeout (float): Segundos máximos de espera por un navegador libre.
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.lease_timeout = lease_timeout
+        self._lock = threading.Lock()
+        # Solo para la instalación de chromedriver, que puede tardar (red) y no debe bloquear el pool
+        self._install_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: List[PooledDriver] = []
+        self._leased = 0
+        self._driver_installed = False
+        self._available: Optional[bool] = None
+        self._failed_at = 0.0
+        self._stats = {"leases": 0, "created": 0, "recycled": 0, "discarded": 0, "errors": 0}
+
+    @classmethod
+    def get_instance(cls) -> "WebDriverPool":
+        """
+        Devuelve la instancia compartida del pool, creándola si no existe.
+
+        Returns:
+            WebDriverPool: Pool de navegadores del proceso.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    def _create_driver(self) -> PooledDriver:
+        """
+        Inicia un nuevo navegador Chrome con un directorio de usuario propio.
+
+        Returns:
+            PooledDriver: Navegador creado.
+
+        Raises:
+            BaseError: Si Chrome no puede iniciarse.
+        """
+        from selenium import webdriver
+
+        try:
+            if not self._driver_installed:
+                with self._install_lock:
+                    if not self._driver_installed:
+                        install_chromedriver()
+                        self._driver_installed = True
+        except Exception as e:
+            with self._lock:
+                self._stats["errors"] += 1
+                self._available = False
+                self._failed_at = time.monotonic()
+            raise BaseError(f"Error al instalar chromedriver: {e}") from e
+
+        tmpdir = tempfile.TemporaryDirectory()
+        options = get_chrome_options()
+        options.add_argument(f"--user-data-dir={tmpdir.name}")
+        try:
+            driver = webdriver.Chrome(options=options)
+        except Exception as e:
+            tmpdir.cleanup()
+            with self._lock:
+                self._stats["errors"] += 1
+                self._available = False
+                self._failed_at = time.monotonic()
+            raise BaseError(f"Error al inicializar Chrome: {e}") from e
+
+        with self._lock:
+            self._stats["created"] += 1
+            self._available = True
+        return PooledDriver(driver, tmpdir)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Presta un navegador del pool. Reutiliza uno libre si está sano o crea uno nuevo.
+
+        Args:
+            timeout (float, optional): Segundos máximos de espera. Por defecto lease_timeout.
+
+        Returns:
+            PooledDriver: Navegador prestado. Debe devolverse con ``release``.
+
+        Raises:
+            BaseError: Si no hay navegadores libres a tiempo o Chrome no puede iniciarse.
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise BaseError(f"No hay navegadores libres tras esperar {timeout} segundos")
+
+        try:
+            while True:
+                with self._lock:
+                    pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    pooled = self._create_driver()
+                    break
+                if pooled.is_healthy():
+                    break
+                pooled.quit()
+                with self._lock:
+                    self._stats["discarded"] += 1
+        except Exception:
+            self._slots.release()
+            raise
+
+        pooled.discard = False
+        with self._lock:
+            self._leased += 1
+            self._stats["leases"] += 1
+        return pooled
+
+    def release(self, pooled: PooledDriver, discard: bool = False) -> None:
+        """
+        Devuelve un navegador al pool. Se cierra si se pide descartarlo o si ha alcanzado
+        el número máximo de páginas.
+
+        Args:
+            pooled (PooledDriver): Navegador prestado.
+            discard (bool): Si es True el navegador se cierra en lugar de reutilizarse.
+        """
+        pooled.pages += 1
+        discard = discard or pooled.discard
+        recycle = not discard and pooled.pages >= self.max_pages
+        if discard or recycle:
+            pooled.quit()
+        with self._lock:
+            self._leased -= 1
+            if discard:
+                self._stats["discarded"] += 1
+            elif recycle:
+                self._stats["recycled"] += 1
+            else:
+                self._idle.append(pooled)
+        self._slots.release()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator["webdriver.Chrome"]:
+        """
+        Presta un navegador durante el bloque ``with``. Si el bloque lanza una excepción
+        el navegador se descarta, ya que puede haber quedado en un estado inconsistente.
+
+        Args:
+            timeout (float, optional): Segundos máximos de espera por un navegador libre.
+
+        Yields:
+            webdriver.Chrome: Navegador listo para usarse.
+        """
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled.driver
+        except BaseException:
+            pooled.discard = True
+            raise
+        finally:
+            self.release(pooled)
+
+    def ok(self) -> bool:
+        """
+        Indica si el pool puede proporcionar navegadores. La primera llamada inicia un
+        navegador y lo deja libre en el pool, de modo que la comprobación también lo precalienta.
+        Si Chrome no pudo iniciarse, se vuelve a intentar pasados WEBDRIVER_RETRY_INTERVAL
+        segundos desde el último fallo (un error de red al instalar chromedriver es transitorio).
+
+        Returns:
+            bool: True si Chrome puede iniciarse, False en caso contrario.
+        """
+        with self._lock:
+            check = self._available is None or (
+                not self._available and time.monotonic() - self._failed_at >= WEBDRIVER_RETRY_INTERVAL
+            )
+            if check and self._available is False:
+                # Solo una llamada reintenta; el resto sigue viendo el fallo hasta que termine
+                self._failed_at = time.monotonic()
+        if check:
+            try:
+                pooled = self.acquire()
+                pooled.pages -= 1  # El préstamo de comprobación no cuenta como página atendida
+                self.release(pooled)
+            except BaseError as e:
+                print(f"Error al inicializar Chrome: {e}")
+        return bool(self._available)
+
+    def discard_idle(self) -> None:
+        """Cierra los navegadores libres; los siguientes préstamos iniciarán navegadores nuevos."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._stats["discarded"] += len(idle)
+        for pooled in idle:
+            pooled.quit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Devuelve el estado y los contadores del pool.
+
+        Returns:
+            Dict[str, Any]: Tamaño, navegadores libres y prestados, préstamos, creados,
+                reciclados, descartados y errores de inicio.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({"size": self.size, "idle": len(self._idle), "leased": self._leased})
+        return stats
+
+    def close(self) -> None:
+        """Cierra todos los navegadores libres del pool."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            pooled.quit()
@@ -1,3 +1,5 @@
+import os
+
 # URLs base
 UNIPROT_BASE_URL = "https://rest.uniprot.org/uniprotkb"
 PHAROS_BASE_URL = "https://pharos-api.ncats.io/graphql"
@@ -5,6 +7,8 @@ SELLECKCHEM_BASE_URL = "https://www.selleckchem.com"
 DRUG_CENTRAL_BASE_URL = "https://drugcentral.org{}"
 STRINGDB_BASE_URL = "https://string-db.org/api/json/get_string_ids?identifiers={}&species=9606"
 STRINGDB_PING_URL = "https://string-db.org/api/json/version"
+STRINGDB_BATCH_URL = "https://string-db.org/api/json/get_string_ids"
+STRINGDB_BATCH_SIZE = 500  # Número máximo de identificadores por petición POST a get_string_ids
 
 # Plantillas de URL
 QUICKGO_URL_TEMPLATE = "https://www.ebi.ac.uk/QuickGO/term/{}"
@@ -37,6 +41,155 @@ DRUGCENTRAL_SEARCH_URL_TEMPLATE = "https://drugcentral.org/drugcard/{}"
 PANTHER_PATHWAY_URL_TEMPLATE = "https://pantherdb.org/pathway/pathwayDiagram.jsp?catAccession={}"
 UNIPROT_LOCATION_URL_TEMPLATE = "https://www.uniprot.org/locations/{}"
 
+# Configuración del pool de conexiones HTTP (ver SessionPool)
+# Valores por defecto para cualquier host que no tenga configuración propia.
+HTTP_POOL_DEFAULTS = {
+    "pool_connections": 1,   # Pools de urllib3 cacheados por sesión (una sesión por host)
+    "pool_maxsize": 10,      # Conexiones keep-alive reutilizables por host
+    "pool_block": False,     # Si True, espera a que quede una conexión libre en lugar de abrir otra
+    "keep_alive": True,      # Si False, envía "Connection: close" y no reutiliza conexiones
+    "timeout": 30,           # Timeout (segundos) por defecto de cada petición
+}
+
+# Configuración específica por proveedor, indexada por host.
+HTTP_POOL_CONFIG_BY_HOST = {
+    "rest.uniprot.org": {"pool_maxsize": 10},
+    "grch37.rest.ensembl.org": {"pool_maxsize": 10},
+    "pantherdb.org": {"pool_maxsize": 4, "timeout": 60},
+    "string-db.org": {"pool_maxsize": 10},
+    "api.pharmgkb.org": {"pool_maxsize": 4},
+    "www.guidetopharmacology.org": {"pool_maxsize": 4, "timeout": 60},
+    "pharos-api.ncats.io": {"pool_maxsize": 4, "timeout": 60},
+    "api.platform.opentargets.org": {"pool_maxsize": 4, "timeout": 60},
+    "www.ppiatlas.com": {"pool_maxsize": 4, "timeout": 120},
+    "drugcentral.org": {"pool_maxsize": 4},
+    "www.selleckchem.com": {"pool_maxsize": 4},
+}
+
+# Límite de peticiones por proveedor (ver RateLimiter). Se aplica a todas las peticiones de SessionPool.
+RATE_LIMIT_ENABLED = os.environ.get("RAREDISEASEFINDER_RATE_LIMITS", "1") != "0"
+# Valores por defecto para cualquier host que no tenga configuración propia.
+RATE_LIMIT_DEFAULTS = {
+    "rate": None,          # Peticiones por segundo (None: sin límite de ritmo)
+    "burst": 10,           # Peticiones que se pueden hacer seguidas sin esperar
+    "max_in_flight": 16,   # Peticiones en curso a la vez (None: sin límite)
+}
+# Configuración específica por proveedor, indexada por host.
+RATE_LIMIT_BY_HOST = {
+    "grch37.rest.ensembl.org": {"rate": 15, "burst": 15, "max_in_flight": 10},  # Límite publicado: 15 peticiones/s
+    "rest.uniprot.org": {"rate": 20, "burst": 20, "max_in_flight": 10},
+    "pantherdb.org": {"rate": 5, "burst": 5, "max_in_flight": 4},
+    "string-db.org": {"rate": 1, "burst": 1, "max_in_flight": 1},  # STRING pide esperar un segundo entre llamadas
+    "api.pharmgkb.org": {"rate": 2, "burst": 2, "max_in_flight": 2},  # Límite publicado: 2 peticiones/s
+    "www.guidetopharmacology.org": {"rate": 10, "burst": 10, "max_in_flight": 4},
+    "pharos-api.ncats.io": {"rate": 5, "burst": 5, "max_in_flight": 4},
+    "api.platform.opentargets.org": {"rate": 10, "burst": 10, "max_in_flight": 4},
+    "www.ppiatlas.com": {"max_in_flight": 4},
+    "drugcentral.org": {"rate": 5, "burst": 5, "max_in_flight": 4},
+}
+RATE_LIMIT_RETRY_STATUS = (429, 503)  # Códigos tras los que se espera (Retry-After) y se repite la petición
+RATE_LIMIT_MAX_RETRIES = 3            # Reintentos como máximo de una petición limitada
+RATE_LIMIT_BACKOFF = 1.0              # Espera (segundos) del primer reintento de un 429 sin Retry-After; se duplica en cada uno
+RATE_LIMIT_MAX_RETRY_AFTER = 60       # Espera máxima (segundos) aunque Retry-After indique más
+
+# Caché persistente de respuestas HTTP (ver ResponseCache)
+RESPONSE_CACHE_ENABLED = os.environ.get("RAREDISEASEFINDER_CACHE", "1") != "0"
+RESPONSE_CACHE_DIR = os.environ.get(
+    "RAREDISEASEFINDER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "rarediseasefinder")
+)
+RESPONSE_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Tamaño máximo de la caché; se expulsan las entradas menos usadas
+RESPONSE_CACHE_DEFAULT_TTL = 24 * 3600        # TTL (segundos) para hosts sin configuración propia
+RESPONSE_CACHE_ACCESS_FLUSH = 100             # Aciertos cuyo último acceso se guarda de una vez en la base de datos
+
+# TTL (segundos) por proveedor, indexado por host. Las respuestas de Pharos y OpenTargets, que publican
+# la versión de sus datos, se eliminan al cambiar la versión (ver HealthMonitor), por lo que su TTL es largo.
+RESPONSE_CACHE_TTL_BY_HOST = {
+    "rest.uniprot.org": 7 * 24 * 3600,
+    "grch37.rest.ensembl.org": 30 * 24 * 3600,
+    "pantherdb.org": 7 * 24 * 3600,
+    "string-db.org": 30 * 24 * 3600,
+    "api.pharmgkb.org": 7 * 24 * 3600,
+    "www.guidetopharmacology.org": 7 * 24 * 3600,
+    "pharos-api.ncats.io": 90 * 24 * 3600,
+    "api.platform.opentargets.org": 90 * 24 * 3600,
+    "www.ppiatlas.com": 7 * 24 * 3600,
+}
+
+# Pool de navegadores Chrome para los scrapers (ver WebDriverPool)
+WEBDRIVER_POOL_SIZE = int(os.environ.get("RAREDISEASEFINDER_WEBDRIVERS", "2"))  # Navegadores abiertos como máximo
+WEBDRIVER_MAX_PAGES = 50       # Préstamos tras los que se recicla un navegador
+WEBDRIVER_LEASE_TIMEOUT = 120  # Segundos máximos de espera por un navegador libre
+WEBDRIVER_RETRY_INTERVAL = 60  # Segundos tras un fallo al iniciar Chrome antes de volver a intentarlo
+CHROMEDRIVER_CACHE_PATH = os.path.join(RESPONSE_CACHE_DIR, "chromedriver.json")  # Ruta del chromedriver instalado
+CHROMEDRIVER_CHECK_TTL = 7 * 24 * 3600  # Segundos durante los que no se vuelve a comprobar la versión de chromedriver
+
+# Comprobación de disponibilidad de los proveedores (ver HealthMonitor)
+HEALTH_CHECK_ENABLED = os.environ.get("RAREDISEASEFINDER_HEALTH_CHECKS", "1") != "0"  # Si False no arranca el hilo
+HEALTH_CHECK_INTERVAL = int(os.environ.get("RAREDISEASEFINDER_HEALTH_INTERVAL", "300"))  # Segundos entre comprobaciones
+HEALTH_CHECK_TIMEOUT = 10     # Timeout (segundos) de la petición de comprobación
+HEALTH_CHECK_MAX_WORKERS = 8  # Proveedores comprobados a la vez
+HEALTH_PENDING_CODE = 1002    # Código devuelto mientras no ha terminado la primera comprobación
+
+# Consultas por lotes a Ensembl (ver EnsemblClient.fetch_batch)
+ENSEMBL_BATCH_SIZE = 1000  # Símbolos por petición POST lookup/symbol (máximo admitido por Ensembl)
+
+# Consultas por lotes a PantherDB (ver PantherClient.fetch_batch)
+PANTHER_BATCH_SIZE = 100  # Genes por petición geneinfo (el servicio admite hasta 1000; se limita el tamaño de la URL)
+
+# Paginación de OpenTargets (ver OpenTargetsClient)
+OPENTARGETS_PAGE_SIZE = 100  # Filas pedidas por página en los campos paginados
+# Número máximo de filas que se leen de cada campo paginado
+OPENTARGETS_MAX_ROWS = {
+    "known_drugs": 500,
+    "associated_diseases": 500,
+    "interactions": 500,
+}
+
+# Índice local de targets de Guide to Pharmacology (ver PharmacologyClient)
+GTOP_TARGET_INDEX_TTL = 7 * 24 * 3600  # Segundos tras los que se reconstruye el índice
+
+# Lectura en streaming de PPIAtlas (ver PPIAtlasClient). Se pueden ajustar en FILTROS_METODO_PARSER
+# de "ppi_table" con SCORE_MINIMO y MAX_INTERACCIONES.
+PPIATLAS_MIN_SCORE = 0.8           # Puntuación media de asociación mínima (requerimiento de las investigadoras)
+PPIATLAS_MAX_INTERACTIONS = 1000   # Interacciones de mayor puntuación que se conservan
+# Corte anticipado de la lectura: con True se deja de leer al primer registro por debajo del mínimo o con
+# el montículo lleno, y se desactiva solo si llega una puntuación mayor que la anterior. PPIAtlas no
+# documenta el orden de stream-scores y no se ha comprobado, por lo que por defecto se lee el stream completo;
+# activarlo solo tras verificar que el servidor devuelve los registros por puntuación descendente.
+PPIATLAS_STREAM_SORTED = False
+
+# Resolución de enlaces de Selleckchem (ver SelleckchemLinkResolver)
+SELLECKCHEM_LINKS_TTL = 30 * 24 * 3600     # TTL (segundos) de los enlaces encontrados
+SELLECKCHEM_NOT_FOUND_TTL = 7 * 24 * 3600  # TTL (segundos) de las búsquedas sin resultado o rechazadas
+SELLECKCHEM_MAX_WORKERS = WEBDRIVER_POOL_SIZE  # Búsquedas simultáneas (una por navegador del pool)
+SELLECKCHEM_RESULTS_TIMEOUT = 10            # Espera máxima (segundos) a la página de resultados de una búsqueda
+# Textos (en minúsculas) con los que Selleckchem indica que una búsqueda no tiene productos. Solo estas
+# páginas se cachean como búsquedas sin resultado; si no aparecen ni productos ni estos textos el error es transitorio.
+SELLECKCHEM_NO_RESULTS_MARKERS = ("no results", "no products", "did not match any", "0 results")
+
+# Orquestador
+STAGE_3_MAX_WORKERS = 6  # Número máximo de steps ejecutados en paralelo en el stage 3
+JOB_MAX_WORKERS = 4      # Número máximo de workflows ejecutados en segundo plano a la vez (JobManager)
+JOB_HISTORY_SIZE = 100   # Número de jobs terminados que se conservan para consultar su estado y resultado
+SESSION_STORE_PATH = os.environ.get(
+    "RAREDISEASEFINDER_SESSIONS",
+    os.path.join(RESPONSE_CACHE_DIR, "sessions.sqlite3")
+)  # Base de datos de sesiones de workflow, compartida por todos los procesos del servidor
+SESSION_TTL = 24 * 3600  # Segundos sin actividad tras los que se elimina una sesión
+BATCH_MAX_WORKERS = int(os.environ.get("RAREDISEASEFINDER_BATCH_WORKERS", "4"))  # Genes procesados a la vez en un lote (BatchRunner)
+BATCH_MAX_GENES = 1000   # Número máximo de genes de un lote
+# Segundos durante los que se reutiliza el informe de una búsqueda con el mismo workflow, término y filtros
+# (ver ReportCache). Con 0 no se guardan ni se reutilizan informes.
+REPORT_CACHE_TTL = int(os.environ.get("RAREDISEASEFINDER_REPORT_CACHE_TTL", str(6 * 3600)))
+
+# Tiempo de arranque (ver rarediseasefinder.importtime)
+IMPORT_TIME_BUDGETS_MS = {
+    "rarediseasefinder.orchestrator.server": 1500,        # Health check y endpoints del stage 1
+    "rarediseasefinder.orchestrator.Orchestrator": 1000,  # Uso como librería o desde la CLI
+}
+IMPORT_DEFERRED_MODULES = ("selenium", "chromedriver_autoinstaller", "bs4")  # Solo se cargan al usar el proveedor
+
 # Mensajes
 NOT_FOUND_MESSAGE = "⚠️ No se han encontrado datos."
 NO_DATA_MARKER = "NO DATA"
@@ -18,3 +18,7 @@ class IncorrectStageError(Exception):
         self.operation = operation
         message = f"Operación '{operation}' no permitida. Workflow está en stage '{current_stage}' pero se requiere stage '{required_stage}'"
         super().__init__(message)
+
+class WorkflowCancelledError(Exception):
+    """La ejecución del workflow se ha cancelado antes de completar todos los pasos"""
+    pass
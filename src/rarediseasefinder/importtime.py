@@ -0,0 +1,120 @@
+"""
+Informe del tiempo de importación en frío de los módulos de entrada del servidor y de la CLI.
+
+Ejecuta ``python -X importtime -c "import <módulo>"`` en un proceso nuevo, muestra los módulos
+más lentos y comprueba que el tiempo total no supera el presupuesto de IMPORT_TIME_BUDGETS_MS y
+que no se ha cargado ninguno de los módulos diferidos (IMPORT_DEFERRED_MODULES).
+
+Uso:
+    python -m rarediseasefinder.importtime
+    python -m rarediseasefinder.importtime --module rarediseasefinder.orchestrator.server --budget 1500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Optional, Tuple
+
+from .core.constants import IMPORT_TIME_BUDGETS_MS, IMPORT_DEFERRED_MODULES
+
+
+def measure_import(module: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """
+    Importa un módulo en un intérprete nuevo con ``-X importtime``.
+
+    Args:
+        module (str): Nombre completo del módulo a importar.
+
+    Returns:
+        Tuple[float, List[Tuple[str, int, int]]]: Tiempo total de la importación en milisegundos y,
+            para cada importación, módulo, tiempo propio y tiempo acumulado (microsegundos).
+
+    Raises:
+        RuntimeError: Si la importación falla.
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print('IMPORT_TOTAL_MS', (time.perf_counter() - start) * 1000)"
+    )
+    # Sin el hilo del HealthMonitor, que importaría módulos en paralelo durante la medición
+    env = dict(os.environ, RAREDISEASEFINDER_HEALTH_CHECKS="0")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Error al importar {module}:\n{result.stderr[-2000:]}")
+
+    total_ms = 0.0
+    for line in result.stdout.splitlines():
+        if line.startswith("IMPORT_TOTAL_MS"):
+            total_ms = float(line.split()[1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return total_ms, entries
+
+
+def check_module(module: str, budget_ms: Optional[float], top: int = 15, repeat: int = 3) -> bool:
+    """
+    Mide la importación de un módulo, muestra el informe y comprueba el presupuesto.
+
+    Args:
+        module (str): Módulo a medir.
+        budget_ms (float, optional): Tiempo máximo de importación en milisegundos (None para no comprobarlo).
+        top (int): Número de módulos más lentos a mostrar.
+        repeat (int): Número de mediciones; se usa la más rápida para reducir el ruido.
+
+    Returns:
+        bool: True si se cumple el presupuesto y no se ha cargado ningún módulo diferido.
+    """
+    total_ms, entries = min((measure_import(module) for _ in range(max(repeat, 1))), key=lambda run: run[0])
+
+    print(f"\033[94m{module}: {total_ms:.1f} ms\033[0m")
+    for name, self_us, cum_us in sorted(entries, key=lambda entry: entry[2], reverse=True)[:top]:
+        print(f"  {cum_us / 1000:9.1f} ms  {self_us / 1000:8.1f} ms  {name}")
+
+    ok = True
+    loaded = sorted({
+        name for name, _, _ in entries
+        if any(name == deferred or name.startswith(deferred + ".") for deferred in IMPORT_DEFERRED_MODULES)
+    })
+    if loaded:
+        ok = False
+        print(f"\033[31m  Módulos diferidos importados al arrancar: {', '.join(loaded)}\033[0m")
+    if budget_ms is not None and total_ms > budget_ms:
+        ok = False
+        print(f"\033[31m  Supera el presupuesto de {budget_ms:.0f} ms\033[0m")
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Informe del tiempo de importación en frío")
+    parser.add_argument("--module", action="append",
+                        help="Módulo a medir (puede repetirse). Por defecto los de IMPORT_TIME_BUDGETS_MS")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Presupuesto en ms para los módulos indicados con --module")
+    parser.add_argument("--top", type=int, default=15, help="Número de módulos más lentos a mostrar")
+    parser.add_argument("--repeat", type=int, default=3, help="Mediciones por módulo (se usa la más rápida)")
+    args = parser.parse_args(argv)
+
+    if args.module:
+        targets = {module: args.budget if args.budget is not None else IMPORT_TIME_BUDGETS_MS.get(module)
+                   for module in args.module}
+    else:
+        targets = dict(IMPORT_TIME_BUDGETS_MS)
+
+    ok = True
+    for module, budget_ms in targets.items():
+        ok = check_module(module, budget_ms, top=args.top, repeat=args.repeat) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
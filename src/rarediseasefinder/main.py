@@ -27,9 +27,10 @@ def process_data_source(processor_name, processor_class, filters_json):
     """
     print(f"\033[91m{processor_name}\033[0m")
     processor = processor_class()
-    print(f"Status code {processor.get_status_code()}")
+    status_code = processor.get_status_code(wait=True)
+    print(f"Status code {status_code}")
     
-    if processor.get_status_code() == 200:
+    if status_code == 200:
         results = processor.fetch(filters_json)
         if hasattr(results, "keys"):
             for key in results.keys():
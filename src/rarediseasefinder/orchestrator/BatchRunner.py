@@ -0,0 +1,212 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .IWorkflow import IWorkflow
+from .ReportCache import ReportCache
+from .Workflows.JSONFactory import JSONFactory
+from ..core.BaseClient import BaseClient
+from ..core.constants import BATCH_MAX_WORKERS, BATCH_MAX_GENES
+from ..core.errors import WorkflowCancelledError
+
+
+class BatchRunner:
+    """
+    Runs a workflow for a list of genes and writes one report per gene plus a run summary.
+
+    Every gene runs on its own copy of the workflow (see IWorkflow.clone) with the filters of the
+    workflow it was created from, and up to ``max_workers`` genes run at the same time. Work shared
+    by several genes is done once:
+
+    - Providers with a batch endpoint (processors with a ``prefetch`` method, such as Ensembl and
+      PantherDB) are queried for all the genes first, and their per-gene answers are served from
+      the response cache.
+    - Identical requests in flight at the same time share a single call (BaseClient), the STRING
+      annotations of shared interactors and the Selleckchem links of shared drugs are resolved
+      once, and the Guide to Pharmacology target list is a process-wide index.
+    - Genes with a fresh report in the report cache (ReportCache) are not run again.
+    """
+
+    SUMMARY_FILE = "summary.json"
+
+    def __init__(self, workflow: IWorkflow, max_workers: int = BATCH_MAX_WORKERS,
+                 report_cache: Optional[ReportCache] = None, use_report_cache: bool = True):
+        """
+        Initialize the runner.
+
+        Args:
+            workflow (IWorkflow): Workflow whose configuration (filters of every step) is used for all the genes.
+            max_workers (int): Maximum number of genes processed at the same time.
+            report_cache (ReportCache, optional): Cache of finished reports. A new one by default.
+            use_report_cache (bool): If False every gene runs even if there is a stored report.
+        """
+        self.workflow = workflow
+        self.max_workers = max(max_workers, 1)
+        self.report_cache = report_cache or ReportCache()
+        self.use_report_cache = use_report_cache
+        self._state = workflow.export_session_state()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_genes(genes: Iterable[str]) -> List[str]:
+        """
+        Remove blanks and duplicates (case-insensitive) from a gene list, keeping the first spelling.
+
+        Args:
+            genes (Iterable[str]): Gene symbols.
+
+        Returns:
+            List[str]: Unique gene symbols in input order.
+
+        Raises:
+            ValueError: If the list is empty or longer than BATCH_MAX_GENES.
+        """
+        unique = {}
+        for gene in genes:
+            gene = (gene or "").strip()
+            if gene:
+                unique.setdefault(gene.upper(), gene)
+        if not unique:
+            raise ValueError("The gene list is empty")
+        if len(unique) > BATCH_MAX_GENES:
+            raise ValueError(f"The gene list has {len(unique)} genes; the maximum is {BATCH_MAX_GENES}")
+        return list(unique.values())
+
+    def _get_step_filters(self, step_name: str) -> list:
+        return self._state.get("filters", {}).get(step_name) or []
+
+    def prefetch(self, genes: List[str]) -> Dict[str, str]:
+        """
+        Query the providers that have a batch endpoint for all the genes at once.
+
+        Args:
+            genes (List[str]): Gene symbols.
+
+        Returns:
+            Dict[str, str]: "completed" or "failed" for every prefetched step. A failed prefetch
+                is not an error: the genes are then queried one by one.
+        """
+        statuses = {}
+        for step in self.workflow.listOfSteps:
+            for step_name, step_instance in step.items():
+                processor = step_instance.processor
+                if not hasattr(processor, "prefetch"):
+                    continue
+                try:
+                    processor.prefetch(genes, self._get_step_filters(step_name))
+                    statuses[step_name] = "completed"
+                except Exception as e:
+                    print(f"\033[33mBatch prefetch of {step_name} failed, genes will be queried one by one: {e}\033[0m")
+                    statuses[step_name] = "failed"
+        return statuses
+
+    def _create_workflow(self, gene: str, output_dir: str, cancel_event) -> IWorkflow:
+        """Copy of the workflow in stage_3 for one gene, with the configured filters."""
+        workflow = self.workflow.clone()
+        workflow.apply_session_state(self._state)
+        workflow.search_param = gene
+        workflow.workflow_state = "stage_3"
+        if hasattr(workflow, "json_factory"):
+            workflow.json_factory = JSONFactory(output_dir=output_dir)
+        workflow.set_execution_context(None, cancel_event)
+        return workflow
+
+    def _run_gene(self, gene: str, output_dir: str, progress_callback, cancel_event) -> Dict[str, Any]:
+        """Run the workflow for one gene and return its entry of the summary."""
+        entry: Dict[str, Any] = {"status": "cancelled", "elapsed": None, "report": None, "error": None}
+        if cancel_event is not None and cancel_event.is_set():
+            self._notify(progress_callback, gene, entry["status"], None)
+            return entry
+
+        self._notify(progress_callback, gene, "running", None)
+        start = time.monotonic()
+        try:
+            workflow = self._create_workflow(gene, output_dir, cancel_event)
+            report = self.report_cache.run(workflow, use_cache=self.use_report_cache)
+            json_factory = getattr(workflow, "json_factory", None)
+            if json_factory is not None and json_factory.saved_path is None:
+                # Stored report: the workflow did not run, so the report is written here
+                json_factory.json_structure = report
+                json_factory.save_to_file()
+            entry["status"] = "completed"
+            entry["report"] = getattr(json_factory, "saved_path", None)
+        except WorkflowCancelledError:
+            entry["status"] = "cancelled"
+        except Exception as e:
+            entry["status"] = "failed"
+            entry["error"] = str(e)
+            print(f"\033[31mBatch gene {gene} failed: {e}\033[0m")
+        entry["elapsed"] = round(time.monotonic() - start, 3)
+        self._notify(progress_callback, gene, entry["status"], entry["elapsed"])
+        return entry
+
+    def _notify(self, progress_callback, gene: str, status: str, elapsed: Optional[float]) -> None:
+        if progress_callback is not None:
+            with self._lock:
+                progress_callback(gene, status, elapsed)
+
+    def run(self, genes: Iterable[str], output_dir: Optional[str] = None,
+            progress_callback: Optional[Callable[[str, str, Optional[float]], None]] = None,
+            cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Run the workflow for every gene.
+
+        Args:
+            genes (Iterable[str]): Gene symbols.
+            output_dir (str, optional): Folder for the reports and the summary. Defaults to a new
+                batch_<workflow>_<date> folder inside JSONFactory.get_default_dir().
+            progress_callback (Callable[[str, str, Optional[float]], None], optional): Called with the
+                gene, its status and its elapsed time whenever a gene changes status.
+            cancel_event (threading.Event, optional): Event that cancels the pending genes when set.
+
+        Returns:
+            Dict[str, Any]: Run summary, also written to summary.json in the output folder.
+
+        Raises:
+            ValueError: If the gene list is empty or too long.
+        """
+        genes = self.normalize_genes(genes)
+        if output_dir is None:
+            date = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+            output_dir = os.path.join(JSONFactory.get_default_dir(), f"batch_{self.workflow.name}_{date}")
+        os.makedirs(output_dir, exist_ok=True)
+
+        started_at = time.time()
+        for gene in genes:
+            self._notify(progress_callback, gene, "queued", None)
+        flights_before = BaseClient._request_flights.get_stats()
+        prefetch = self.prefetch(genes)
+
+        genes_summary: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch-gene") as pool:
+            futures = {
+                pool.submit(self._run_gene, gene, output_dir, progress_callback, cancel_event): gene
+                for gene in genes
+            }
+            for future in as_completed(futures):
+                genes_summary[futures[future]] = future.result()
+
+        flights_after = BaseClient._request_flights.get_stats()
+        statuses = [genes_summary[gene]["status"] for gene in genes]
+        summary = {
+            "workflow_name": self.workflow.name,
+            "output_dir": output_dir,
+            "started_at": started_at,
+            "elapsed": round(time.time() - started_at, 3),
+            "total": len(genes),
+            "completed": statuses.count("completed"),
+            "failed": statuses.count("failed"),
+            "cancelled": statuses.count("cancelled"),
+            "prefetch": prefetch,
+            "coalesced_requests": flights_after["shared"] - flights_before["shared"],
+            "genes": {gene: genes_summary[gene] for gene in genes},
+        }
+        with open(os.path.join(output_dir, self.SUMMARY_FILE), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        print(f"\033[92mBatch {self.workflow.name}: {summary['completed']}/{summary['total']} genes "
+              f"in {summary['elapsed']} s, summary saved in {output_dir}\033[0m")
+        return summary
@@ -0,0 +1,200 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.errors import WorkflowCancelledError
+
+
+class DagNode:
+    """
+    A unit of work inside a DagExecutor.
+
+    Attributes:
+        name (str): Unique name of the node (usually the workflow step name).
+        func (Callable[[Dict[str, Any]], Any]): Function executed for the node. It receives a
+            dictionary with the results of the nodes it depends on, keyed by node name.
+        depends_on (List[str]): Names of the nodes whose results are needed as inputs.
+    """
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Any], depends_on: Optional[List[str]] = None):
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on or [])
+
+
+class DagExecutor:
+    """
+    Executes a dependency graph of workflow steps on a bounded thread pool.
+
+    Each node declares the nodes it depends on. A node is submitted as soon as all of
+    its dependencies have finished, so independent steps run concurrently and the total
+    time approaches the slowest dependency chain instead of the sum of all steps.
+
+    Example:
+        executor = DagExecutor(max_workers=4)
+        executor.add_node("Ensembl", lambda inputs: ensembl_step.process())
+        executor.add_node("Opentargets", run_opentargets, depends_on=["Ensembl"])
+        results = executor.run()
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, max_workers: int = 4,
+                 progress_callback: Optional[Callable[[str, str, Optional[float]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers (int): Maximum number of nodes executed at the same time.
+            progress_callback (Callable[[str, str, Optional[float]], None], optional): Called with
+                the node name, its new status and its elapsed time (None until it finishes)
+                every time a node changes status.
+            cancel_event (threading.Event, optional): When set, no new nodes are submitted and
+                the run finishes with WorkflowCancelledError once the running nodes return.
+        """
+        self.max_workers = max_workers
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self.nodes: Dict[str, DagNode] = {}
+        self.timings: Dict[str, float] = {}
+        self.status: Dict[str, str] = {}
+
+    def add_node(self, name: str, func: Callable[[Dict[str, Any]], Any], depends_on: Optional[List[str]] = None) -> None:
+        """
+        Register a node in the graph.
+
+        Args:
+            name (str): Unique node name.
+            func (Callable[[Dict[str, Any]], Any]): Function receiving the results of its dependencies.
+            depends_on (List[str], optional): Names of the nodes this node needs as inputs.
+
+        Returns:
+            None
+        """
+        if name in self.nodes:
+            raise ValueError(f"Node '{name}' is already registered in the graph")
+        self.nodes[name] = DagNode(name, func, depends_on)
+
+    def _validate(self) -> None:
+        """
+        Check that every dependency exists and that the graph has no cycles.
+
+        Raises:
+            ValueError: If a dependency is unknown or a cycle is found.
+        """
+        for node in self.nodes.values():
+            for dependency in node.depends_on:
+                if dependency not in self.nodes:
+                    raise ValueError(f"Node '{node.name}' depends on unknown node '{dependency}'")
+
+        visited = set()
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at node '{name}'")
+            visiting.add(name)
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for node_name in self.nodes:
+            visit(node_name)
+
+    def _set_status(self, name: str, status: str) -> None:
+        self.status[name] = status
+        if self.progress_callback:
+            self.progress_callback(name, status, self.timings.get(name))
+
+    def _run_node(self, node: DagNode, inputs: Dict[str, Any]) -> Any:
+        self._set_status(node.name, self.RUNNING)
+        start = time.perf_counter()
+        try:
+            return node.func(inputs)
+        finally:
+            self.timings[node.name] = time.perf_counter() - start
+
+    def format_timings(self) -> str:
+        """
+        Format the elapsed time of every finished node, slowest first.
+
+        Returns:
+            str: Text such as "Pharos 3.21 s, Uniprot 1.02 s".
+        """
+        timings = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+        return ", ".join(f"{name} {elapsed:.2f} s" for name, elapsed in timings)
+
+    def log_timings(self, title: str) -> None:
+        """
+        Print the elapsed time of every finished node in a single line.
+
+        Args:
+            title (str): Text shown before the timings (e.g. the workflow and the search term).
+        """
+        print(f"\033[94m{title} step timings: {self.format_timings()}\033[0m")
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Execute every node respecting its dependencies.
+
+        If a node raises an exception no new nodes are submitted, the nodes already running
+        are awaited and the first exception is raised again. Cancellation works the same way:
+        running nodes are not interrupted, but nothing else is started.
+
+        Returns:
+            Dict[str, Any]: Result of every node keyed by node name.
+
+        Raises:
+            WorkflowCancelledError: If the cancel event is set before every node has run.
+        """
+        self._validate()
+        for name in self.nodes:
+            self._set_status(name, self.PENDING)
+        results: Dict[str, Any] = {}
+        pending = dict(self.nodes)
+        running = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                if error is None and self.cancel_event is not None and self.cancel_event.is_set():
+                    error = WorkflowCancelledError("Workflow execution cancelled")
+                if error is None:
+                    ready = [node for node in pending.values()
+                             if all(dependency in results for dependency in node.depends_on)]
+                    for node in ready:
+                        inputs = {dependency: results[dependency] for dependency in node.depends_on}
+                        running[pool.submit(self._run_node, node, inputs)] = node.name
+                        del pending[node.name]
+
+                if not running:
+                    # Stopped by an error or a cancellation and every running node has finished
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                        self._set_status(name, self.DONE)
+                    except Exception as exc:
+                        print(f"\033[31mStep '{name}' failed: {exc}\033[0m")
+                        self._set_status(name, self.FAILED)
+                        if error is None:
+                            error = exc
+
+        for name in pending:
+            self._set_status(name, self.CANCELLED)
+
+        if error is not None:
+            raise error
+        return results
@@ -1,7 +1,15 @@
+import copy
 from abc import abstractmethod, ABC
 from typing import Any
 
+from .DagExecutor import DagExecutor
 from .WorkflowSteps.BaseWorkflowStep import BaseWorkflowStep
+from .Workflows.DataframesUtils import DataframesUtils
+from .Workflows.SelleckchemLinkResolver import SelleckchemLinkResolver
+from .Workflows.JSONFactory import JSONFactory
+from ..core.BaseFilter import BaseFilter
+from ..core.HealthMonitor import HealthMonitor
+from ..core.constants import STAGE_3_MAX_WORKERS
 
 
 class IWorkflow(ABC):
@@ -79,6 +87,90 @@ class IWorkflow(ABC):
     def steps_execution(self)-> list[dict]:
         pass
 
+    def set_execution_context(self, progress_callback=None, cancel_event=None) -> None:
+        """
+        Sets the progress callback and cancel event used by the next stage 3 execution.
+
+        Args:
+            progress_callback (Callable[[str, str, Optional[float]], None], optional): Called with the
+                step name, its status and its elapsed time whenever a step changes status.
+            cancel_event (threading.Event, optional): Event that cancels the execution when set.
+
+        Returns:
+            None
+        """
+        self._progress_callback = progress_callback
+        self._cancel_event = cancel_event
+
+    def create_executor(self) -> DagExecutor:
+        """
+        Creates the DagExecutor for the stage 3 pipeline, wired to the current execution context.
+
+        Returns:
+            DagExecutor: Executor with STAGE_3_MAX_WORKERS workers.
+        """
+        return DagExecutor(max_workers=STAGE_3_MAX_WORKERS,
+                           progress_callback=getattr(self, "_progress_callback", None),
+                           cancel_event=getattr(self, "_cancel_event", None))
+
+    def clone(self) -> "IWorkflow":
+        """
+        Creates a lightweight copy of the workflow for a session.
+
+        The copy shares the step processors (clients, scrapers and parsers) with this workflow,
+        but has its own stage, search parameter, step filters and JSON report, so several
+        sessions can configure and run the same workflow at the same time.
+
+        Returns:
+            IWorkflow: Copy of the workflow in stage_1 with the default filters.
+        """
+        workflow = copy.copy(self)
+        workflow.listOfSteps = [
+            {step_name: copy.copy(step_instance) for step_name, step_instance in step.items()}
+            for step in self.listOfSteps
+        ]
+        if hasattr(self, "json_factory"):
+            workflow.json_factory = JSONFactory()
+        workflow.set_execution_context()
+        workflow.search_param = ""
+        workflow.stage_1_pipeline()
+        return workflow
+
+    def export_session_state(self) -> dict:
+        """
+        Returns the mutable state of the workflow as a JSON serializable dictionary.
+
+        Returns:
+            dict: Stage, search parameter and JSON filters of every step.
+        """
+        return {
+            "workflow_state": self.workflow_state,
+            "search_param": self.search_param,
+            "filters": {
+                step_name: step_instance.get_filters().json_filter
+                for step in self.listOfSteps
+                for step_name, step_instance in step.items()
+                if step_instance.get_filters() is not None
+            },
+        }
+
+    def apply_session_state(self, state: dict) -> None:
+        """
+        Restores the mutable state exported with export_session_state.
+
+        Args:
+            state (dict): Stage, search parameter and JSON filters of every step.
+
+        Returns:
+            None
+        """
+        self.workflow_state = state["workflow_state"]
+        self.search_param = state["search_param"]
+        for step_name, json_filter in state.get("filters", {}).items():
+            step_instance = self.get_step(step_name)
+            if step_instance is not None:
+                step_instance.set_filters(BaseFilter.from_json(json_filter))
+
     def instantiate_steps(self) -> None:
         """
         Instantiates step objects within self.listOfSteps if they are stored as types (classes).
@@ -121,17 +213,31 @@ class IWorkflow(ABC):
                       Example: ["Pharos_Step", "UniProt_Step", "NCBI_Step"]
         """
 
+        self.register_health_checks()
         step_names = []
         for step in self.listOfSteps:
             step_name = next(iter(step.keys()))
             step_object = next(iter(step.values()))
             step_names.append({"step_name":step_name+"_Step",
-                               "status": step_object.get_status_code()})
+                               "status": step_object.get_status_code(wait=True)})
         return step_names
 
+    def register_health_checks(self) -> None:
+        """
+        Registers the provider of every step in the HealthMonitor, so that all of them are
+        checked in parallel in the background. Processors are not built.
+        """
+        monitor = HealthMonitor.get_instance()
+        for step in self.listOfSteps:
+            for step_instance in step.values():
+                monitor.register(step_instance.get_retriever_class())
+
     def check_if_all_steps_available(self) -> bool:
         """
         Checks if all instantiated steps in self.listOfSteps have a status code of 200.
+        Status codes are served from the HealthMonitor cache; only a provider that has not
+        been checked yet (right after startup) is waited for, so no step counts as down
+        just because its first check is still pending.
 
         Assumes self.listOfSteps is a list of dictionaries, where each dictionary
         contains step instances that have a get_status_code() method.
@@ -139,9 +245,10 @@ class IWorkflow(ABC):
         Returns:
             bool: True if all steps are available (status code 200), False otherwise.
         """
+        self.register_health_checks()
         for step in self.listOfSteps:
             for step_instance in step.values():
-                if step_instance.get_status_code() != 200:
+                if step_instance.get_status_code(wait=True) != 200:
                     return False
         return True
 
@@ -310,3 +417,73 @@ class IWorkflow(ABC):
             if list(step.keys())[0] == workflow_step_name:
                 step[workflow_step_name].get_filters().add_parser_method(selected_optional_method, {})  #Filtros vacios porque se añade primero el método opcional y luego se seleccionan filtros para este.
 
+    def process_step(self, step_name: str, search_id: str | list) -> dict:
+        """
+        Sets the search parameter on the filters of a step and executes it.
+
+        Args:
+            step_name (str): Name of the step to execute (e.g. "Uniprot").
+            search_id (str | list): Identifier (or list of identifiers for batch clients)
+                passed to the step client as search_id.
+
+        Returns:
+            dict: Results of the step processor keyed by parser method.
+        """
+        step = self.get_step(step_name)
+        step.get_filters().add_client_search_params(search_id)
+        return step.process()
+
+    def add_selleckchem_links(self, *drug_tables) -> list:
+        """
+        Searches the drugs of one or more DataFrames in Selleckchem and keeps only the rows with
+        results, adding a "Link Selleckchem" column (one row per link).
+
+        The names of all the tables are normalized and deduplicated, so every drug is searched
+        only once per run (and reused from the persistent cache in later runs).
+
+        Args:
+            *drug_tables (Tuple[pd.DataFrame, str]): Pairs of DataFrame with the drugs to search
+                and the column containing the drug name.
+
+        Returns:
+            list: One DataFrame per input table with the rows with Selleckchem results and their links.
+        """
+        resolver = SelleckchemLinkResolver(self.get_step("Selleckchem"))
+        names = [name for drugs_df, name_column in drug_tables
+                 if name_column in drugs_df.columns
+                 for name in drugs_df[name_column]]
+        links_by_name = resolver.resolve(names)
+
+        enriched_tables = []
+        for drugs_df, name_column in drug_tables:
+            enriched_rows = []
+            for row_dict in drugs_df.to_dict(orient="records"):
+                links = links_by_name.get(resolver.normalize(row_dict.get(name_column)))
+                if links:
+                    row_dict["Link Selleckchem"] = links
+                    enriched_rows.append(row_dict)
+
+            enriched_df = DataframesUtils.create_dataframe(enriched_rows)
+            enriched_tables.append(DataframesUtils.expand_comma_separated_column(enriched_df, "Link Selleckchem"))
+        return enriched_tables
+
+    def add_stringdb_annotations(self, interactions_df):
+        """
+        Annotates every interacting protein of an OpenTargets interactions DataFrame with StringDB.
+        All the interactors are resolved in a single batch request (chunked by the client).
+
+        Args:
+            interactions_df (pd.DataFrame): OpenTargets interactions with the columns
+                "Proteína interactuante" and "Puntuación".
+
+        Returns:
+            pd.DataFrame: StringDB annotations of the interactors with their score.
+        """
+        proteins = list(interactions_df["Proteína interactuante"])
+        if not proteins:
+            return DataframesUtils.create_dataframe([])
+
+        results = self.process_step("Stringdb", proteins)
+        stringdb_results = results["get_annotation"].reset_index(drop=True)
+        stringdb_results["Puntuación"] = list(interactions_df["Puntuación"])
+        return stringdb_results
@@ -0,0 +1,293 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .BatchRunner import BatchRunner
+from .Orchestrator import Orchestrator
+from ..core.constants import JOB_MAX_WORKERS, JOB_HISTORY_SIZE
+from ..core.errors import IncorrectStageError, WorkflowCancelledError
+
+
+class Job:
+    """
+    Background execution of a workflow.
+
+    Attributes:
+        job_id (str): Unique identifier returned to the client.
+        workflow_name (str): Name of the executed workflow.
+        session_token (str): Session the workflow belongs to, or None for the shared workflow.
+        genes (List[str]): Genes of a batch job, or None for a single workflow execution.
+        use_report_cache (bool): If False the workflow runs even if there is a stored report.
+        status (str): "queued", "running", "completed", "failed" or "cancelled".
+        steps (Dict[str, Dict[str, Any]]): Status and elapsed time of every step (of every gene
+            for batch jobs).
+        result (Any): JSON report (run summary for batch jobs) once the job is completed.
+        error (str): Error message if the job failed.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+    def __init__(self, workflow_name: str, session_token: Optional[str] = None, genes: Optional[List[str]] = None,
+                 use_report_cache: bool = True):
+        self.job_id = uuid.uuid4().hex
+        self.workflow_name = workflow_name
+        self.session_token = session_token
+        self.genes = genes
+        self.use_report_cache = use_report_cache
+        self.status = self.QUEUED
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+        self.future = None
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in self.FINISHED_STATUSES
+
+    def update_step(self, step_name: str, status: str, elapsed: Optional[float]) -> None:
+        """
+        Records the new status of a step. Used as DagExecutor progress callback.
+
+        Args:
+            step_name (str): Name of the step.
+            status (str): New status of the step.
+            elapsed (float, optional): Seconds spent by the step, once finished.
+        """
+        with self._lock:
+            self.steps[step_name] = {
+                "status": status,
+                "elapsed": round(elapsed, 3) if elapsed is not None else None,
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the job status without the result.
+
+        Returns:
+            Dict[str, Any]: Job id, workflow, status, steps, timestamps and error.
+        """
+        with self._lock:
+            steps = {name: dict(step) for name, step in self.steps.items()}
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.time()) - self.started_at, 3)
+        return {
+            "job_id": self.job_id,
+            "workflow_name": self.workflow_name,
+            "genes": self.genes,
+            "status": self.status,
+            "steps": steps,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed": elapsed,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    Runs workflows on a background thread pool so that API requests return immediately.
+
+    A job is submitted for a workflow in stage_3; the workflow is reset to stage_1 when the job
+    finishes, as the synchronous /stage3/start_workflow endpoint does. The status of every step
+    is collected through the DagExecutor progress callback, and jobs can be cancelled between steps.
+    """
+
+    def __init__(self, orchestrator: Orchestrator, max_workers: int = JOB_MAX_WORKERS,
+                 history_size: int = JOB_HISTORY_SIZE):
+        """
+        Initialize the job manager.
+
+        Args:
+            orchestrator (Orchestrator): Orchestrator used to execute the workflows.
+            max_workers (int): Maximum number of workflows executed at the same time.
+            history_size (int): Number of finished jobs kept for status and result queries.
+        """
+        self.orchestrator = orchestrator
+        self.history_size = history_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow-job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, workflow_name: str, session_token: Optional[str] = None, use_report_cache: bool = True) -> Job:
+        """
+        Queues the execution of a workflow.
+
+        Args:
+            workflow_name (str): Name of the workflow to execute. It must be in stage_3.
+            session_token (str, optional): Session whose copy of the workflow is executed.
+            use_report_cache (bool): If False the workflow runs even if there is a stored report.
+
+        Returns:
+            Job: The queued job.
+
+        Raises:
+            KeyError: If the workflow or the session does not exist.
+            IncorrectStageError: If the workflow is not in stage_3.
+            RuntimeError: If the workflow already has an active job in the same session.
+        """
+        workflow_state = self.orchestrator.get_workflow_state(workflow_name, session_token)
+        if workflow_state is None:
+            raise KeyError(f"Workflow '{workflow_name}' not found")
+        if workflow_state != "stage_3":
+            raise IncorrectStageError(workflow_state, "stage_3", "submit job")
+
+        with self._lock:
+            for job in self._jobs.values():
+                if (job.workflow_name == workflow_name and job.session_token == session_token
+                        and job.genes is None and not job.finished):
+                    raise RuntimeError(f"Workflow '{workflow_name}' already has an active job: {job.job_id}")
+            job = Job(workflow_name, session_token, use_report_cache=use_report_cache)
+            self._jobs[job.job_id] = job
+            self._prune()
+        job.future = self._executor.submit(self._run, job)
+        return job
+
+    def submit_batch(self, workflow_name: str, genes: List[str], session_token: Optional[str] = None,
+                     use_report_cache: bool = True) -> Job:
+        """
+        Queues the execution of a workflow for a list of genes (see Orchestrator.run_batch).
+
+        The workflow can be in any stage and is not reset when the job finishes; the status of
+        every gene is reported as a step of the job and the result is the run summary.
+
+        Args:
+            workflow_name (str): Name of the workflow whose configuration is used.
+            genes (List[str]): Gene symbols to search.
+            session_token (str, optional): Session whose configuration of the workflow is used.
+            use_report_cache (bool): If False every gene runs even if there is a stored report.
+
+        Returns:
+            Job: The queued job.
+
+        Raises:
+            KeyError: If the workflow or the session does not exist.
+            ValueError: If the gene list is empty or too long.
+        """
+        if self.orchestrator.get_workflow_state(workflow_name, session_token) is None:
+            raise KeyError(f"Workflow '{workflow_name}' not found")
+        genes = BatchRunner.normalize_genes(genes)
+
+        with self._lock:
+            job = Job(workflow_name, session_token, genes, use_report_cache)
+            self._jobs[job.job_id] = job
+            self._prune()
+        job.future = self._executor.submit(self._run, job)
+        return job
+
+    def _run(self, job: Job) -> None:
+        if job.cancel_event.is_set():
+            job.status = Job.CANCELLED
+            job.finished_at = time.time()
+            self._reset_workflow(job)
+            return
+
+        job.status = Job.RUNNING
+        job.started_at = time.time()
+        try:
+            if job.genes is not None:
+                job.result = self.orchestrator.run_batch(job.workflow_name, job.genes,
+                                                         progress_callback=job.update_step,
+                                                         cancel_event=job.cancel_event,
+                                                         session_token=job.session_token,
+                                                         use_report_cache=job.use_report_cache)
+            else:
+                job.result = self.orchestrator.start_workflow(job.workflow_name,
+                                                              progress_callback=job.update_step,
+                                                              cancel_event=job.cancel_event,
+                                                              session_token=job.session_token,
+                                                              use_report_cache=job.use_report_cache)
+            job.status = Job.COMPLETED
+        except WorkflowCancelledError:
+            job.status = Job.CANCELLED
+        except Exception as e:
+            job.error = str(e)
+            job.status = Job.FAILED
+            print(f"\033[31mJob {job.job_id} ({job.workflow_name}) failed: {e}\033[0m")
+        finally:
+            job.finished_at = time.time()
+            self._reset_workflow(job)
+
+    def _reset_workflow(self, job: Job) -> None:
+        if job.genes is not None:
+            # Batch jobs run on copies of the workflow and do not change its stage
+            return
+        try:
+            self.orchestrator.set_stage_1(job.workflow_name, job.session_token)
+        except (IncorrectStageError, KeyError) as e:
+            print(f"Workflow '{job.workflow_name}' could not be reset to stage_1: {e}")
+
+    def _prune(self) -> None:
+        """Removes the oldest finished jobs beyond the history size."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(len(finished) - self.history_size, 0)]:
+            del self._jobs[job_id]
+
+    def get_job(self, job_id: str) -> Job:
+        """
+        Returns a job by id.
+
+        Args:
+            job_id (str): Job identifier.
+
+        Returns:
+            Job: The job.
+
+        Raises:
+            KeyError: If the job does not exist.
+        """
+        with self._lock:
+            if job_id not in self._jobs:
+                raise KeyError(f"Job '{job_id}' not found")
+            return self._jobs[job_id]
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Returns the status of a job and of each of its steps.
+
+        Args:
+            job_id (str): Job identifier.
+
+        Returns:
+            Dict[str, Any]: Job status (see Job.to_dict).
+        """
+        return self.get_job(job_id).to_dict()
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """
+        Requests the cancellation of a job. Queued jobs are not started; running jobs stop
+        after the steps currently running finish.
+
+        Args:
+            job_id (str): Job identifier.
+
+        Returns:
+            Dict[str, Any]: Job status after the request.
+        """
+        job = self.get_job(job_id)
+        if not job.finished:
+            job.cancel_event.set()
+        return job.to_dict()
+
+    def shutdown(self) -> None:
+        """Cancels every active job and waits for the background threads."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel_event.set()
+        self._executor.shutdown(wait=True)
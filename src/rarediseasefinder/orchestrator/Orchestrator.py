@@ -1,9 +1,12 @@
 from typing import Any
 
+from .BatchRunner import BatchRunner
 from .IWorkflow import IWorkflow
+from .ReportCache import ReportCache
 from .WorkflowSteps.BaseWorkflowStep import BaseWorkflowStep
 from .Workflows.FullWorkflow import FullWorkflow
 from .Workflows.NoPharosWorkflow import NoPharosWorkflow
+from .SessionStore import SessionStore
 from ..core.errors import IncorrectStageError
 
 class Orchestrator:
@@ -28,7 +31,93 @@ class Orchestrator:
             workflow.workflow_state = "stage_1"
             print(f"El estado del workflow {workflow.name} se ha incializado en {workflow.workflow_state}")
 
+            # Registramos los proveedores en el HealthMonitor (sin crear los procesadores) para que
+            # se comprueben en segundo plano desde el arranque
+            workflow.register_health_checks()
+
         self.workflows_list = lista
+        self._session_store = None
+        self.report_cache = ReportCache()
+
+    ########################Session methods#######################
+
+    @property
+    def session_store(self) -> SessionStore:
+        """Session store, created the first time a session is used."""
+        if self._session_store is None:
+            self._session_store = SessionStore()
+        return self._session_store
+
+    def create_session(self, workflow_name: str) -> str | None:
+        """
+        Create a session to configure and run a workflow independently of other users.
+
+        The session holds its own stage, search parameter and step filters, while the step
+        processors are shared with the registered workflow instance.
+
+        Args:
+            workflow_name (str): The name of the workflow.
+
+        Returns:
+            str | None: The session token, or None if the workflow does not exist.
+        """
+        for workflow in self.workflows_list:
+            if workflow_name == workflow.name:
+                return self.session_store.create(workflow_name, workflow.clone().export_session_state())
+        return None
+
+    def close_session(self, session_token: str) -> None:
+        """
+        Remove a session.
+
+        Args:
+            session_token (str): The session token.
+
+        Returns:
+            None
+        """
+        self.session_store.delete(session_token)
+
+    def _get_workflow(self, workflow_name: str, session_token: str | None = None) -> IWorkflow | None:
+        """
+        Get the workflow to operate on: the shared instance when no session token is given,
+        or a copy of it with the state of the session otherwise.
+
+        Args:
+            workflow_name (str): The name of the workflow.
+            session_token (str | None): The session token, if any.
+
+        Returns:
+            IWorkflow | None: The workflow, or None if not found.
+
+        Raises:
+            KeyError: If the session does not exist or has expired.
+        """
+        for workflow in self.workflows_list:
+            if workflow_name == workflow.name:
+                if session_token is None:
+                    return workflow
+                state = self.session_store.load(session_token, workflow_name)
+                if state is None:
+                    raise KeyError(f"Session not found or expired for workflow '{workflow_name}'")
+                session_workflow = workflow.clone()
+                session_workflow.apply_session_state(state)
+                return session_workflow
+        return None
+
+    def _save_workflow(self, workflow: IWorkflow, session_token: str | None = None) -> None:
+        """
+        Persist the state of a session workflow. Does nothing for the shared instances.
+
+        Args:
+            workflow (IWorkflow): The workflow returned by _get_workflow.
+            session_token (str | None): The session token, if any.
+
+        Returns:
+            None
+        """
+        if session_token is not None:
+            self.session_store.save(session_token, workflow.name, workflow.export_session_state())
 
     ########################Stage 1 methods#######################
 
@@ -49,30 +138,33 @@ class Orchestrator:
             )
         return list_of_workflows
 
-    def get_if_all_steps_available(self, workflow_name: str) -> bool:
+    def get_if_all_steps_available(self, workflow_name: str, session_token: str | None = None) -> bool:
         """
         Check if all steps in the specified workflow are available.
 
         Args:
             workflow_name (str): The name of the workflow to check.
+            session_token (str | None): The session token, if any.
 
         Returns:
             bool: True if all steps are available, False otherwise.
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_1":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_if_all_steps_available para workflow '{workflow_name}'")
-                return workflow.check_if_all_steps_available()
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_1":
+                raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_if_all_steps_available para workflow '{workflow_name}'")
+            return workflow.check_if_all_steps_available()
         return False
 
-    def get_minium_methods_for_step_from_workflow(self, step_name: str, workflow_name: str) -> dict | None :
+    def get_minium_methods_for_step_from_workflow(self, step_name: str, workflow_name: str,
+                                                  session_token: str | None = None) -> dict | None :
         """
         Get the JSON of minimum methods for a given step in a workflow.
 
         Args:
             step_name (str): The step key to query.
             workflow_name (str): The workflow containing the step.
+            session_token (str | None): The session token, if any.
 
         Returns:
             dict | None: The minimum methods configuration, or None if not found.
@@ -81,20 +173,22 @@ class Orchestrator:
             Returns for a workflow step the JSON of minimum methods, e.g.:
             {'step_name': 'Pharos', 'processor': 'PharosProcessor', 'methods': [{'METHOD_ID': 'Metodo prueba', 'METHOD_PARSER_FILTERS': {}}]}
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_1":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_workflows")
-                return workflow.minium_methods_by_step[step_name]
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_1":
+                raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_workflows")
+            return workflow.minium_methods_by_step[step_name]
         return None
 
-    def get_optional_methods_from_workflow(self, step_name: str, workflow_name: str) -> dict | None:
+    def get_optional_methods_from_workflow(self, step_name: str, workflow_name: str,
+                                           session_token: str | None = None) -> dict | None:
         """
         Get the JSON of optional methods for a given step in a workflow.
 
         Args:
             step_name (str): The step key to query.
             workflow_name (str): The workflow containing the step.
+            session_token (str | None): The session token, if any.
 
         Returns:
             dict | None: The optional methods configuration, or None if not found.
@@ -103,32 +197,34 @@ class Orchestrator:
             Returns for a workflow step the JSON of optional methods, e.g.:
             {'step_name': 'Pharos', 'processor': 'PharosProcessor', 'methods': [{'METHOD_ID': 'Metodo prueba', 'METHOD_PARSER_FILTERS': {}}]}
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_1":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_optional_methods_from_workflow")
-                return workflow.optional_methods_by_step[step_name]
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_1":
+                raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_optional_methods_from_workflow")
+            return workflow.optional_methods_by_step[step_name]
         return None
 
-    def get_list_of_steps_names(self, workflow_name: str) -> list[dict] | dict[Any, Any]:
+    def get_list_of_steps_names(self, workflow_name: str, session_token: str | None = None) -> list[dict] | dict[Any, Any]:
         """
         Retrieve all steps from a specific workflow.
         
         Args:
             workflow_name (str): The name of the workflow.
+            session_token (str | None): The session token, if any.
             
         Returns:
             dict: Dictionary of steps with step names as keys and IWorkflowStep instances as values.
                  Example: {"Pharos": PharosWorkflowStep, "UniProt": UniProtWorkflowStep}
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_1":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_list_of_steps_names")
-                return workflow.get_list_of_steps_names()
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_1":
+                raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_list_of_steps_names")
+            return workflow.get_list_of_steps_names()
         return {}
 
-    def get_method_filters(self, method_name: str, step_name: str, workflow_name: str) -> dict:
+    def get_method_filters(self, method_name: str, step_name: str, workflow_name: str,
+                           session_token: str | None = None) -> dict:
         """
         Retrieve filters for a specific method in a workflow step.
         
@@ -136,28 +232,30 @@ class Orchestrator:
             method_name (str): The name of the method to get filters from.
             step_name (str): The name of the workflow step.
             workflow_name (str): The name of the workflow.
+            session_token (str | None): The session token, if any.
             
         Returns:
             dict: The filters for the specified method, or empty dict if not found.
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_1":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_method_filters")
-                return workflow.get_filters_from_method(step_name, method_name)
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_1":
+                raise IncorrectStageError(workflow.workflow_state, "stage_1", f"get_method_filters")
+            return workflow.get_filters_from_method(step_name, method_name)
         return {}
 
-    def set_stage_2(self,workflow_name) -> None :
-         for workflow in self.workflows_list:
-             if workflow_name == workflow.name:
-                 if workflow.workflow_state != "stage_1":
-                     raise IncorrectStageError(workflow.workflow_state, "stage_1", f"set_stage_2 para workflow '{workflow_name}'")
-                 workflow.workflow_state = "stage_2"
+    def set_stage_2(self, workflow_name, session_token: str | None = None) -> None :
+         workflow = self._get_workflow(workflow_name, session_token)
+         if workflow is not None:
+             if workflow.workflow_state != "stage_1":
+                 raise IncorrectStageError(workflow.workflow_state, "stage_1", f"set_stage_2 para workflow '{workflow_name}'")
+             workflow.workflow_state = "stage_2"
+             self._save_workflow(workflow, session_token)
 
     ########################Stage 2 methods#######################
 
     def set_selected_optional_method(self, selected_optional_method: str, workflow_step_name: str,
-                                     workflow_name: str) -> None :
+                                     workflow_name: str, session_token: str | None = None) -> None :
         """
         Apply a selected optional parser method to a workflow step.
 
@@ -165,6 +263,7 @@ class Orchestrator:
             selected_optional_method (str): The method ID to apply.
             workflow_step_name (str): The step where to apply the method.
             workflow_name (str): The name of the workflow.
+            session_token (str | None): The session token, if any.
 
         Returns:
             None
@@ -172,14 +271,15 @@ class Orchestrator:
         Note:
             Adds the selected optional method to a step of the workflow.
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_2":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_selected_optional_method")
-                workflow.set_selected_optional_methods(selected_optional_method, workflow_step_name)
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_2":
+                raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_selected_optional_method")
+            workflow.set_selected_optional_methods(selected_optional_method, workflow_step_name)
+            self._save_workflow(workflow, session_token)
 
     def set_filter_to_method(self, filters: dict, method_name: str, workflow_step_name: str,
-                             workflow_name: str) -> None :
+                             workflow_name: str, session_token: str | None = None) -> None :
         """
         Apply filter configuration to a specific method in a workflow step.
 
@@ -188,6 +288,7 @@ class Orchestrator:
             method_name (str): The method to filter.
             workflow_step_name (str): The step containing the method.
             workflow_name (str): The name of the workflow.
+            session_token (str | None): The session token, if any.
 
         Returns:
             None
@@ -195,19 +296,22 @@ class Orchestrator:
         Note:
             Adds the selected filter to a method of a workflow step.
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_2":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_filter_to_method")
-                workflow.set_filter_to_method(workflow_step_name, method_name, filters)
-
-    def set_workflow_search_param(self, search_term: str, workflow_name: str) -> None :
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_2":
+                raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_filter_to_method")
+            workflow.set_filter_to_method(workflow_step_name, method_name, filters)
+            self._save_workflow(workflow, session_token)
+
+    def set_workflow_search_param(self, search_term: str, workflow_name: str,
+                                  session_token: str | None = None) -> None :
         """
         Set the search parameter for a specific workflow.
 
         Args:
             search_term (str): The term to set.
             workflow_name (str): The workflow in which to set the term.
+            session_token (str | None): The session token, if any.
 
         Returns:
             None
@@ -215,54 +319,121 @@ class Orchestrator:
         Note:
             Adds the search term entered on the search box to the workflow.
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_2":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_workflow_search_param")
-                workflow.search_param = search_term
-
-    def set_stage_3(self,workflow_name):
-         for workflow in self.workflows_list:
-             if workflow.name == workflow_name:
-                 if workflow.workflow_state != "stage_2":
-                     raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_stage_3 para workflow '{workflow_name}'")
-                 workflow.workflow_state = "stage_3"
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_2":
+                raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_workflow_search_param")
+            workflow.search_param = search_term
+            self._save_workflow(workflow, session_token)
+
+    def set_stage_3(self, workflow_name, session_token: str | None = None):
+         workflow = self._get_workflow(workflow_name, session_token)
+         if workflow is not None:
+             if workflow.workflow_state != "stage_2":
+                 raise IncorrectStageError(workflow.workflow_state, "stage_2", f"set_stage_3 para workflow '{workflow_name}'")
+             workflow.workflow_state = "stage_3"
+             self._save_workflow(workflow, session_token)
 
     ########################Stage 3 methods#######################
 
-    def start_workflow(self, workflow_name: str):
+    def start_workflow(self, workflow_name: str, progress_callback=None, cancel_event=None,
+                       session_token: str | None = None, use_report_cache: bool = True):
         """
         Execute the workflow matching the given name.
 
+        If the same workflow was run for the same search term and filters less than
+        REPORT_CACHE_TTL seconds ago, its stored report is returned instead (see ReportCache).
+
         Args:
             workflow_name (str): The name of the workflow to start.
+            progress_callback (Callable[[str, str, Optional[float]], None], optional): Called with the
+                step name, its status and its elapsed time whenever a step changes status.
+            cancel_event (threading.Event, optional): Event that cancels the execution when set.
+            session_token (str | None): The session token, if any. Sessions run on their own copy
+                of the workflow, so several sessions can execute the same workflow at the same time.
+            use_report_cache (bool): If False the workflow runs even if there is a stored report.
 
         Returns:
             list[dict]
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                if workflow.workflow_state != "stage_3":
-                    raise IncorrectStageError(workflow.workflow_state, "stage_3", f"start_workflow")
-                return  workflow.steps_execution()
-
-    def set_stage_1(self,workflow_name):
-         for workflow in self.workflows_list:
-             if workflow_name == workflow.name:
-                 print(f"Workflow '{workflow_name}' está actualmente en stage: {workflow.workflow_state}")
-                 print(f"Intentando cambiar workflow '{workflow_name}' a stage_1")
-                 if workflow.workflow_state != "stage_3":
-                     raise IncorrectStageError(workflow.workflow_state, "stage_3", f"set_stage_1 para workflow '{workflow_name}'")
-                 workflow.workflow_state = "stage_1"
-                 print(f"Workflow '{workflow_name}' cambiado exitosamente a stage_1")
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            if workflow.workflow_state != "stage_3":
+                raise IncorrectStageError(workflow.workflow_state, "stage_3", f"start_workflow")
+            workflow.set_execution_context(progress_callback, cancel_event)
+            try:
+                return self.report_cache.run(workflow, use_cache=use_report_cache)
+            finally:
+                workflow.set_execution_context()
+
+    def run_batch(self, workflow_name: str, genes: list[str], output_dir: str | None = None,
+                  progress_callback=None, cancel_event=None, session_token: str | None = None,
+                  use_report_cache: bool = True) -> dict:
+        """
+        Execute the workflow for a list of genes with its current configuration.
+
+        The workflow does not need to be in stage_3 and its stage is not changed: every gene runs
+        on its own copy of the workflow (see BatchRunner).
+
+        Args:
+            workflow_name (str): The name of the workflow.
+            genes (list[str]): Gene symbols to search.
+            output_dir (str | None): Folder for the reports and the run summary.
+            progress_callback (Callable[[str, str, Optional[float]], None], optional): Called with the
+                gene, its status and its elapsed time whenever a gene changes status.
+            cancel_event (threading.Event, optional): Event that cancels the pending genes when set.
+            session_token (str | None): The session token, if any, whose configuration is used.
+            use_report_cache (bool): If False every gene runs even if there is a stored report.
+
+        Returns:
+            dict: Run summary with the status and report path of every gene.
+
+        Raises:
+            KeyError: If the workflow or the session does not exist.
+            ValueError: If the gene list is empty or too long.
+        """
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is None:
+            raise KeyError(f"Workflow '{workflow_name}' not found")
+        runner = BatchRunner(workflow, report_cache=self.report_cache, use_report_cache=use_report_cache)
+        return runner.run(genes, output_dir=output_dir,
+                          progress_callback=progress_callback, cancel_event=cancel_event)
+
+    def set_stage_1(self, workflow_name, session_token: str | None = None):
+         workflow = self._get_workflow(workflow_name, session_token)
+         if workflow is not None:
+             print(f"Workflow '{workflow_name}' está actualmente en stage: {workflow.workflow_state}")
+             print(f"Intentando cambiar workflow '{workflow_name}' a stage_1")
+             if workflow.workflow_state != "stage_3":
+                 raise IncorrectStageError(workflow.workflow_state, "stage_3", f"set_stage_1 para workflow '{workflow_name}'")
+             workflow.workflow_state = "stage_1"
+             self._save_workflow(workflow, session_token)
+             print(f"Workflow '{workflow_name}' cambiado exitosamente a stage_1")
 
     ########################Debugin methods#######################
-    def get_search_param(self, workflow_name: str) -> str | None :
+    def get_workflow_state(self, workflow_name: str, session_token: str | None = None) -> str | None:
+        """
+        Retrieve the current stage of the specified workflow.
+
+        Args:
+            workflow_name (str): The name of the workflow.
+            session_token (str | None): The session token, if any.
+
+        Returns:
+            str | None: The workflow stage ("stage_1", "stage_2" or "stage_3"), or None if not found.
+        """
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            return workflow.workflow_state
+        return None
+
+    def get_search_param(self, workflow_name: str, session_token: str | None = None) -> str | None :
         """
         Retrieve the search parameter for the specified workflow.
 
         Args:
             workflow_name (str): The name of the workflow.
+            session_token (str | None): The session token, if any.
 
         Returns:
             str | None: The current search parameter, or None if not set.
@@ -270,18 +441,19 @@ class Orchestrator:
         Note:
             Returns the term entered the search box for the workflow.
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                return workflow.search_param
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            return workflow.search_param
         return None
 
-    def get_step(self, step_name: str, workflow_name: str) -> BaseWorkflowStep | None:
+    def get_step(self, step_name: str, workflow_name: str, session_token: str | None = None) -> BaseWorkflowStep | None:
         """
         Retrieve the BaseWorkflowStep instance for debugging purposes.
 
         Args:
             step_name (str): The name of the step to retrieve.
             workflow_name (str): The workflow in which to search.
+            session_token (str | None): The session token, if any.
 
         Returns:
             BaseWorkflowStep | None: The step instance, or None if not found.
@@ -289,9 +461,9 @@ class Orchestrator:
         Note:
             This method returns the BaseWorkflowStep object for backend debugging.
         """
-        for workflow in self.workflows_list:
-            if workflow_name == workflow.name:
-                return workflow.get_step(step_name)
+        workflow = self._get_workflow(workflow_name, session_token)
+        if workflow is not None:
+            return workflow.get_step(step_name)
         return None
 
 
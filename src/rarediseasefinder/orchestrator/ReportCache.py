@@ -0,0 +1,125 @@
+import json
+import time
+from typing import Any, Dict, Optional
+
+from .IWorkflow import IWorkflow
+from ..core.ResponseCache import ResponseCache
+from ..core.constants import REPORT_CACHE_TTL
+
+
+class ReportCache:
+    """
+    Stores finished stage 3 reports so that repeated searches are answered without running the workflow.
+
+    A report is keyed by the workflow name, the normalized search term, a hash of the JSON
+    filters of every step (without their CLIENT_SEARCH_PARAMS, which are derived from the search
+    term) and the data versions of the providers that publish them, so a new data release of
+    any provider makes the stored reports unreachable. Reports live in the persistent response
+    cache (ResponseCache) and are served for REPORT_CACHE_TTL seconds; a TTL of 0 disables the cache.
+    """
+
+    CACHE_NAMESPACE = "reports"
+
+    def __init__(self, ttl: int = REPORT_CACHE_TTL):
+        """
+        Initialize the report cache.
+
+        Args:
+            ttl (int): Seconds during which a stored report is served.
+        """
+        self.ttl = ttl
+        self.cache = ResponseCache.get_instance()
+
+    @staticmethod
+    def normalize_term(search_term: str) -> str:
+        """Search term as used in the key: without surrounding blanks and in upper case."""
+        return (search_term or "").strip().upper()
+
+    @staticmethod
+    def get_filters_fingerprint(workflow: IWorkflow) -> str:
+        """
+        Hash of the JSON filters of every step of the workflow.
+
+        Args:
+            workflow (IWorkflow): Configured workflow.
+
+        Returns:
+            str: Hexadecimal hash, independent of the key order of the filters.
+        """
+        filters = {}
+        for step_name, json_filter in workflow.export_session_state()["filters"].items():
+            filters[step_name] = [
+                {key: value for key, value in processor.items() if key != "CLIENT_SEARCH_PARAMS"}
+                for processor in json_filter or []
+            ]
+        return ResponseCache.make_key(filters)
+
+    def get_key(self, workflow: IWorkflow) -> str:
+        """
+        Key of the report of the workflow for its current search term, filters and provider data versions.
+
+        Args:
+            workflow (IWorkflow): Configured workflow.
+
+        Returns:
+            str: Cache key.
+        """
+        return ResponseCache.make_key(workflow.name, self.normalize_term(workflow.search_param),
+                                      self.get_filters_fingerprint(workflow), self.cache.get_data_versions())
+
+    def get(self, workflow: IWorkflow, key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored report of the workflow, if there is a fresh one.
+
+        Args:
+            workflow (IWorkflow): Configured workflow.
+            key (str, optional): Key computed with get_key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The report, or None if there is none or it is too old.
+        """
+        if self.ttl <= 0:
+            return None
+        entry = self.cache.get(self.CACHE_NAMESPACE, key or self.get_key(workflow), ttl=self.ttl)
+        if entry is None:
+            return None
+        payload, meta = entry
+        print(f"\033[92mReport of {workflow.search_param} ({workflow.name}) served from the report cache, "
+              f"stored {round(time.time() - meta.get('stored_at', 0))} s ago\033[0m")
+        return json.loads(payload)
+
+    def put(self, workflow: IWorkflow, report: Dict[str, Any], key: Optional[str] = None) -> None:
+        """
+        Stores the report of the workflow.
+
+        Args:
+            workflow (IWorkflow): Workflow that produced the report.
+            report (Dict[str, Any]): Report returned by steps_execution.
+            key (str, optional): Key computed with get_key before running the workflow.
+        """
+        if self.ttl <= 0 or not report:
+            return
+        payload = json.dumps(report, ensure_ascii=False, default=str).encode("utf-8")
+        self.cache.put(self.CACHE_NAMESPACE, key or self.get_key(workflow), payload,
+                       {"workflow_name": workflow.name, "search_term": workflow.search_param,
+                        "stored_at": time.time()})
+
+    def run(self, workflow: IWorkflow, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Returns the stored report of the workflow or runs it and stores the new report.
+
+        Args:
+            workflow (IWorkflow): Workflow in stage_3.
+            use_cache (bool): If False the workflow always runs; its report still replaces the stored one.
+
+        Returns:
+            Dict[str, Any]: The report.
+        """
+        key = self.get_key(workflow)
+        if use_cache:
+            report = self.get(workflow, key)
+            if report is not None:
+                return report
+        report = workflow.steps_execution()
+        self.put(workflow, report, key)
+        return report
@@ -0,0 +1,113 @@
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from ..core.constants import SESSION_STORE_PATH, SESSION_TTL
+
+
+class SessionStore:
+    """
+    Persists the state of workflow sessions in SQLite, keyed by an opaque token.
+
+    Only the mutable state of a workflow (stage, search parameter and step filters) is stored,
+    so every server process can rebuild a session on top of its own shared workflow instances.
+    Sessions not used for SESSION_TTL seconds are removed.
+    """
+
+    def __init__(self, path: str = SESSION_STORE_PATH, ttl: int = SESSION_TTL):
+        """
+        Initialize the store and create the database if needed.
+
+        Args:
+            path (str): Path of the SQLite database.
+            ttl (int): Seconds of inactivity after which a session expires.
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                token TEXT PRIMARY KEY,
+                workflow_name TEXT NOT NULL,
+                state TEXT NOT NULL,
+                updated REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def create(self, workflow_name: str, state: dict) -> str:
+        """
+        Creates a new session.
+
+        Args:
+            workflow_name (str): Name of the workflow configured by the session.
+            state (dict): Initial state of the workflow.
+
+        Returns:
+            str: Token of the new session.
+        """
+        token = secrets.token_urlsafe(24)
+        self.save(token, workflow_name, state)
+        return token
+
+    def load(self, token: str, workflow_name: str) -> Optional[dict]:
+        """
+        Loads the state of a session.
+
+        Args:
+            token (str): Session token.
+            workflow_name (str): Workflow the session must belong to.
+
+        Returns:
+            Optional[dict]: Workflow state, or None if the session does not exist, has expired
+                or belongs to another workflow.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT workflow_name, state, updated FROM sessions WHERE token = ?", (token,)
+            ).fetchone()
+        if row is None:
+            return None
+        session_workflow, state, updated = row
+        if time.time() - updated > self.ttl:
+            self.delete(token)
+            return None
+        if session_workflow != workflow_name:
+            return None
+        return json.loads(state)
+
+    def save(self, token: str, workflow_name: str, state: dict) -> None:
+        """
+        Stores the state of a session and refreshes its expiration.
+
+        Args:
+            token (str): Session token.
+            workflow_name (str): Name of the workflow configured by the session.
+            state (dict): State of the workflow.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (token, workflow_name, state, updated) VALUES (?, ?, ?, ?)",
+                (token, workflow_name, json.dumps(state, ensure_ascii=False), time.time()),
+            )
+            self._conn.execute("DELETE FROM sessions WHERE updated < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+
+    def delete(self, token: str) -> None:
+        """
+        Removes a session.
+
+        Args:
+            token (str): Session token.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
+            self._conn.commit()
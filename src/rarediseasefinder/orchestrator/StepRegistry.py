@@ -0,0 +1,72 @@
+import threading
+from typing import Dict, List, Type
+
+from ..core.BaseProcessor import BaseProcessor
+from ..core.HealthMonitor import HealthMonitor
+
+
+class StepRegistry:
+    """
+    Process-wide registry of the processors used by the workflow steps.
+
+    Workflow steps only hold their name, description and filters; the processor (client,
+    scraper and parser) is requested from this registry the first time it is used and is
+    shared by every step of every workflow that references the same processor class.
+    Processors keep no per-search state, so the shared instances can be used concurrently.
+    The provider of a processor is registered in the HealthMonitor when the processor is built,
+    so only the providers that are actually used are checked in the background.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processors: Dict[Type[BaseProcessor], BaseProcessor] = {}
+
+    @classmethod
+    def get_instance(cls) -> "StepRegistry":
+        """
+        Returns the shared registry, creating it if needed.
+
+        Returns:
+            StepRegistry: The registry of the process.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def get_processor(self, processor_class: Type[BaseProcessor]) -> BaseProcessor:
+        """
+        Returns the shared instance of a processor class, building it (and registering its
+        provider in the HealthMonitor) on first use.
+
+        Args:
+            processor_class (Type[BaseProcessor]): The processor class.
+
+        Returns:
+            BaseProcessor: The shared processor.
+        """
+        processor = self._processors.get(processor_class)
+        if processor is not None:
+            return processor
+        with self._lock:
+            processor = self._processors.get(processor_class)
+            if processor is None:
+                processor = processor_class()
+                self._processors[processor_class] = processor
+                print(f"processor: {processor_class.__name__} instanciado.")
+                HealthMonitor.get_instance().register(processor.retriever)
+        return processor
+
+    def get_built_processors(self) -> List[str]:
+        """
+        Returns the names of the processors built so far.
+
+        Returns:
+            List[str]: Names of the processor classes already instantiated.
+        """
+        with self._lock:
+            return [processor_class.__name__ for processor_class in self._processors]
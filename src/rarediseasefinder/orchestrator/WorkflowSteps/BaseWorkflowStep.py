@@ -1,10 +1,13 @@
 import json
 from abc import ABC
 from platform import processor
-from typing import Dict, Any
+from typing import Dict, Any, Type
 from ..IWorkflowStep import IWorkflowStep
+from ..StepRegistry import StepRegistry
 from ...core.BaseFilter import BaseFilter
 from ...core.BaseProcessor import BaseProcessor
+from ...core.BaseRetriever import BaseRetriever
+from ...core.HealthMonitor import HealthMonitor
 
 class BaseWorkflowStep(IWorkflowStep, ABC):
     """
@@ -12,29 +15,62 @@ class BaseWorkflowStep(IWorkflowStep, ABC):
     Implementa la funcionalidad común compartida por todos los pasos.
     """
     
-    def __init__(self, name: str, description: str, processor: BaseProcessor, filters:BaseFilter = None):
+    def __init__(self, name: str, description: str, processor: Type[BaseProcessor] | BaseProcessor,
+                 filters:BaseFilter = None):
         """
         Inicializa el paso de workflow con sus atributos básicos.
         
         Args:
             name (str): Nombre identificativo del paso
             description (str): Descripción de la funcionalidad del paso
-            processor (BaseProcessor): Procesador específico para este paso
+            processor (Type[BaseProcessor] | BaseProcessor): Clase del procesador de este paso, que se
+                obtiene del StepRegistry al usarse por primera vez, o una instancia ya creada
         """
         self.name = name
         self.description = description
         self.processor = processor
         self.filters = filters
-        self.status_code = self.processor.get_status_code()
 
-    def get_status_code(self) -> int:
+    @property
+    def processor(self) -> BaseProcessor:
         """
-        Obtiene el código de estado del procesador.
+        Procesador del paso. Se comparte con los pasos de otros workflows que usan la misma clase.
+        """
+        if self._processor is None:
+            self._processor = StepRegistry.get_instance().get_processor(self._processor_class)
+        return self._processor
+
+    @processor.setter
+    def processor(self, value: Type[BaseProcessor] | BaseProcessor) -> None:
+        if isinstance(value, type):
+            self._processor_class = value
+            self._processor = None
+        else:
+            self._processor_class = type(value)
+            self._processor = value
+
+    def get_retriever_class(self) -> Type[BaseRetriever]:
+        """
+        Obtiene la clase del cliente o scraper del procesador, sin crear el procesador.
+
+        Returns:
+            Type[BaseRetriever]: Clase del recuperador del proveedor.
+        """
+        return self._processor_class.RETRIEVER_CLASS
+
+    def get_status_code(self, wait: bool = False) -> int:
+        """
+        Obtiene el código de estado del proveedor, cacheado por el HealthMonitor. No crea el
+        procesador ni realiza peticiones: mientras el proveedor no se ha comprobado devuelve
+        HEALTH_PENDING_CODE, salvo que se espere a la primera comprobación.
+
+        Args:
+            wait (bool): Si es True y el proveedor aún no se ha comprobado, espera a la comprobación.
         
         Returns:
             int: Código de estado HTTP o código de error
         """
-        return self.status_code
+        return HealthMonitor.get_instance().get_status_code(self.get_retriever_class(), wait=wait)
 
     def process(self) -> dict:
         """
@@ -71,9 +107,11 @@ class BaseWorkflowStep(IWorkflowStep, ABC):
 
     def get_method_map(self):
         """
-        Obtiene el mapa de métodos disponibles del procesador.
+        Obtiene el mapa de métodos disponibles del procesador, sin crearlo si aún no se ha usado.
         
         Returns:
             dict: Diccionario con el mapeo de métodos disponibles en el procesador
         """
+        if self._processor is None:
+            return self._processor_class.get_method_map()
         return self.processor.method_map
\ No newline at end of file
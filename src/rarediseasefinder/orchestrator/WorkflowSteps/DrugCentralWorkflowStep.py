@@ -13,5 +13,5 @@ class DrugCentralWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="DrugCentral step",
             description="Fetches drug information data from DrugCentral database",
-            processor=DrugCentralProcessor()
+            processor=DrugCentralProcessor
         )
\ No newline at end of file
@@ -13,5 +13,5 @@ class EnsemblWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="Ensembl step",
             description="Fetches data from Ensembl API",
-            processor=EnsemblProcessor()
+            processor=EnsemblProcessor
             )
\ No newline at end of file
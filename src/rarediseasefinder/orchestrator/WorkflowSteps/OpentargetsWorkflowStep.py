@@ -13,5 +13,5 @@ class OpentargetsWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="OpenTargets step",
             description="Fetches biological data from OpenTargets API",
-            processor=OpenTargetsProcessor()
+            processor=OpenTargetsProcessor
         )
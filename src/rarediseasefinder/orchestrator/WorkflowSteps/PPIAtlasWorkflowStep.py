@@ -12,5 +12,5 @@ class PPIAtlasWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="PPIAtlas step",
             description="Fetches protein-protein interaction data from PPIAtlas API",
-            processor=PPIAtlasProcessor()
+            processor=PPIAtlasProcessor
         )
\ No newline at end of file
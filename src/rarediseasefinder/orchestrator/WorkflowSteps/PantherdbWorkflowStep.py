@@ -13,5 +13,5 @@ class PantherdbWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="Panther step",
             description="Fetches x data from Panther API",
-            processor=PantherProcessor()
+            processor=PantherProcessor
         )
\ No newline at end of file
@@ -13,5 +13,5 @@ class PharmGKBWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="PharmGKB step",
             description="Fetches biological data from PharmGKB API",
-            processor=PharmGKBProcessor()
+            processor=PharmGKBProcessor
         )
@@ -13,5 +13,5 @@ class PharmacologyWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="Pharmacology step",
             description="Fetches biological data from Pharmacology API",
-            processor=PharmacologyProcessor()
+            processor=PharmacologyProcessor
         )
\ No newline at end of file
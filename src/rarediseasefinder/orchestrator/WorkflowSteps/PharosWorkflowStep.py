@@ -13,5 +13,5 @@ class PharosWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="Pharos step",
             description="Fetches biological data from Pharos API",
-            processor=PharosProcessor()
+            processor=PharosProcessor
         )
\ No newline at end of file
@@ -13,5 +13,5 @@ class SelleckchemWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="Selleckchem step",
             description="Gets links from selleckchem for any drug term",
-            processor=SelleckchemProcessor()
+            processor=SelleckchemProcessor
         )
\ No newline at end of file
@@ -13,5 +13,5 @@ class StringdbWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="Stringdb step",
             description="Fetches protein-protein interaction data from Stringdb API",
-            processor=StringDbProcessor()
+            processor=StringDbProcessor
         )
\ No newline at end of file
@@ -13,5 +13,5 @@ class UniprotWorkflowStep(BaseWorkflowStep):
         super().__init__(
             name="Uniprot step",
             description="Fetches protein data from Uniprot API",
-            processor=UniprotProcessor()
+            processor=UniprotProcessor
         )
\ No newline at end of file
@@ -13,7 +13,7 @@ from ..WorkflowSteps.StringdbWorkflowStep import StringdbWorkflowStep
 from ..WorkflowSteps.UniprotWorkflowStep import UniprotWorkflowStep
 
 from ...core.BaseFilter import BaseFilter
-from ...core.constants import get_standard_external_links, NO_DATA_MARKER
+from ...core.constants import get_standard_external_links
 
 from..Workflows.DataframesUtils import DataframesUtils
 from ..Workflows.JSONFactory import JSONFactory
@@ -388,188 +388,88 @@ class FullWorkflow(IWorkflow):
         #Ejecución del pipeline.
         self.workflow_state = "stage_3"
 
-        # Coger step de la lista de pasos
-        uniprot_step = self.get_step("Uniprot")
-        ensembl_step = self.get_step("Ensembl")
-        pantherdb_step = self.get_step("Panther")
-        drugcentral_step = self.get_step("DrugCentral")
-        pharos_step = self.get_step("Pharos")
+        # Grafo de dependencias entre steps: los steps independientes se ejecutan en paralelo.
+        # Opentargets necesita el ensembl_id del step Ensembl, StringDB las interacciones de Opentargets
+        # y Selleckchem los fármacos de DrugCentral y Pharos.
+        executor = self.create_executor()
+        executor.add_node("Uniprot", lambda inputs: self.process_step("Uniprot", self._search_param))
+        executor.add_node("Ensembl", lambda inputs: self.process_step("Ensembl", self._search_param))
+        executor.add_node("Panther", lambda inputs: self.process_step("Panther", self._search_param))
+        executor.add_node("DrugCentral", lambda inputs: self.process_step("DrugCentral", self._search_param))
+        executor.add_node("Pharos", lambda inputs: self.process_step("Pharos", self._search_param))
+        executor.add_node("Pharmacology", lambda inputs: self.process_step("Pharmacology", self._search_param))
+        executor.add_node("Pharmgkb", lambda inputs: self.process_step("Pharmgkb", self._search_param))
+        executor.add_node("PPIAtlas", lambda inputs: self.process_step("PPIAtlas", self._search_param))
+        executor.add_node("Opentargets", self._run_opentargets, depends_on=["Ensembl"])
+        executor.add_node("Stringdb", self._run_stringdb, depends_on=["Opentargets"])
+        executor.add_node("Selleckchem", self._run_selleckchem, depends_on=["DrugCentral", "Pharos"])
+
+        results = executor.run()
+        executor.log_timings(f"{self.name} ({self._search_param})")
+
+        opentargets_result = results["Opentargets"]
+        drugcentral_result = results["DrugCentral"]
+        pharos_result = results["Pharos"]
+
+        opentargets_result["interactions"] = results["Stringdb"]
+        drugcentral_result["drug_results"] = results["Selleckchem"]["drug_results"]
+        pharos_result["ligands"] = results["Selleckchem"]["ligands"]
+        pharos_result["drugs"] = results["Selleckchem"]["drugs"]
+
+        result = self._create_json(self._search_param, 
+                                   results["Uniprot"], 
+                                   results["PPIAtlas"], 
+                                   opentargets_result, 
+                                   results["Panther"], 
+                                   pharos_result, 
+                                   results["Pharmgkb"], 
+                                   results["Pharmacology"], 
+                                   drugcentral_result,
+                                   results["Ensembl"])
+        self.json_factory.save_to_file()
+
+        return result
 
-        #Coger los filtros
-        uniprot_filters =  uniprot_step.get_filters()
-        ensembl_filters =  ensembl_step.get_filters()
-        pantherdb_filters =  pantherdb_step.get_filters()
-        drugcentral_filters = drugcentral_step.get_filters() 
-        pharos_filters = pharos_step.get_filters()   
-
-        #Añadir parametro de búsqueda
-        uniprot_filters.add_client_search_params(self._search_param)
-        ensembl_filters.add_client_search_params(self._search_param)
-        pantherdb_filters.add_client_search_params(self._search_param)
-        drugcentral_filters.add_client_search_params(self._search_param)
-        pharos_filters.add_client_search_params(self._search_param)
-
-        #Ejecutar cada step
-        uniprot_result = uniprot_step.process()
-        ensembl_result = ensembl_step.process()
-        panther_result = pantherdb_step.process()
-        drugcentral_result = drugcentral_step.process()
-        pharos_result = pharos_step.process()
-
-        print(uniprot_result.keys())
-        print(ensembl_result.keys())
-        print(panther_result.keys())
+    def _run_opentargets(self, inputs: dict) -> dict:
+        ensembl_result = inputs["Ensembl"]
         print("ensembl_id: " + ensembl_result["ensembl_id"].iloc[0][0])
-        opentargets_step = self.get_step("Opentargets")
-        opentargets_filters = opentargets_step.get_filters()
         #Accedemos al ensembl_id que se necesita como entrada en opentargets.
-        opentargets_filters.add_client_search_params(ensembl_result["ensembl_id"].iloc[0][0])
-        opentargets_result = opentargets_step.process()
-
+        opentargets_result = self.process_step("Opentargets", ensembl_result["ensembl_id"].iloc[0][0])
         print(opentargets_result.keys())
+        return opentargets_result
 
+    def _run_stringdb(self, inputs: dict):
         # Procesar los resultados de OpenTargets para StringDB
-        # Aquí asumimos que opentargets_result["interactions"]["Proteína interactuante"] contiene los nombres de las proteínas
-        # y opentargets_result["interactions"]["Puntuación"] contiene las puntuaciones
-        stringdb_results = []
-        for prot, puntuacion in zip(opentargets_result["interactions"]["Proteína interactuante"], opentargets_result["interactions"]["Puntuación"]):
-            stringdb_step = self.get_step("Stringdb")
-            stringdb_filters = stringdb_step.get_filters()
-            stringdb_filters.add_client_search_params(prot)
-            results = stringdb_step.process()
-            results["get_annotation"]["Puntuación"] = puntuacion
-            stringdb_results.append(results["get_annotation"])
-
-        stringdb_results = DataframesUtils.create_dataframe(stringdb_results)
-        opentargets_result["interactions"] = stringdb_results
-        print(opentargets_result["interactions"].keys())
-        #print(stringdb_results)
-
-        # Procesar los resultados de OpenTargets para Selleckchem
-        # Aquí asumimos que opentargets_result["known_drugs"]["Nombre"] contiene los nombres de los fármacos
-        # y que queremos obtener el enlace de Selleckchem para cada uno.
-        # Inicializar una lista para almacenar los resultados de Selleckchem
-        # Coger step de la lista de pasos Selleckchem
-        # Iterar sobre los nombres de los fármacos y buscar en Selleckchem
-        # Excluir datos que no devuelvan resultado
-        selleckchem_and_drugcentral_results = []
+        stringdb_results = self.add_stringdb_annotations(inputs["Opentargets"]["interactions"])
+        print(stringdb_results.keys())
+        return stringdb_results
+
+    def _run_selleckchem(self, inputs: dict) -> dict:
+        # Buscar en Selleckchem los fármacos de DrugCentral y los ligandos y fármacos de Pharos.
+        # Se excluyen los fármacos que no devuelven resultado.
+        drugcentral_result = inputs["DrugCentral"]
+        pharos_result = inputs["Pharos"]
         print("DrugCentral: " + str(drugcentral_result["drug_results"].shape[0]) + " resultados")
-        for row_dict in drugcentral_result["drug_results"].to_dict(orient="records"):
-            if "DrugName" in row_dict:
-                drug = row_dict["DrugName"]
-                print("Buscando en Selleckchem: " + drug)
-
-                selleckchem_step = self.get_step("Selleckchem")
-                selleckchem_filters = selleckchem_step.get_filters()
-                selleckchem_filters.add_client_search_params(drug)
-                results_s = selleckchem_step.process()
-
-                if results_s and not NO_DATA_MARKER in results_s["obtener_links_selleckchem"]:
-                    row_dict["Link Selleckchem"] = results_s["obtener_links_selleckchem"].iloc[0, 0]
-                    selleckchem_and_drugcentral_results.append(row_dict)
-
-        selleckchem_and_drugcentral_results = DataframesUtils.create_dataframe(selleckchem_and_drugcentral_results)
-        selleckchem_and_drugcentral_results = DataframesUtils.expand_comma_separated_column(
-            selleckchem_and_drugcentral_results, 
-            "Link Selleckchem"
-        )
-        print(selleckchem_and_drugcentral_results)
-
-        drugcentral_result["drug_results"] = selleckchem_and_drugcentral_results
-
-        # Procesar los ligandos de Pharos y unirlos a selleckchem
-        selleckchem_and_pharos_results = []
-        for row_dict in pharos_result["ligands"].to_dict(orient="records"):
-            if "nombre" in row_dict:
-                drug = row_dict["nombre"]
-                print("Buscando en Selleckchem: " + drug)
-
-                selleckchem_step = self.get_step("Selleckchem")
-                selleckchem_filters = selleckchem_step.get_filters()
-                selleckchem_filters.add_client_search_params(drug)
-                results_s = selleckchem_step.process()
-
-                if results_s and not NO_DATA_MARKER in results_s["obtener_links_selleckchem"]:
-                    row_dict["Link Selleckchem"] = results_s["obtener_links_selleckchem"].iloc[0, 0]
-                    selleckchem_and_pharos_results.append(row_dict)
 
-        selleckchem_and_pharos_results = DataframesUtils.create_dataframe(selleckchem_and_pharos_results)
-        selleckchem_and_pharos_results = DataframesUtils.expand_comma_separated_column(
-            selleckchem_and_pharos_results,
-            "Link Selleckchem"
+        # Los nombres de las tres tablas se resuelven juntos para no buscar dos veces el mismo fármaco
+        (selleckchem_and_drugcentral_results,
+         selleckchem_and_pharos_ligands,
+         selleckchem_and_pharos_drugs) = self.add_selleckchem_links(
+            (drugcentral_result["drug_results"], "DrugName"),
+            (pharos_result["ligands"], "nombre"),
+            (pharos_result["drugs"], "nombre"),
         )
+        print(selleckchem_and_drugcentral_results)
         print("Ligandos Pharos+Selleckchem:")
-        print(selleckchem_and_pharos_results)
-
-        pharos_result["ligands"] = selleckchem_and_pharos_results
-
-        # Procesar los fármacos de Pharos y unirlos a selleckchem
-        selleckchem_and_pharos_results = []
-        for row_dict in pharos_result["drugs"].to_dict(orient="records"):
-            if "nombre" in row_dict:
-                drug = row_dict["nombre"]
-                print("Buscando en Selleckchem: " + drug)
-
-                selleckchem_step = self.get_step("Selleckchem")
-                selleckchem_filters = selleckchem_step.get_filters()
-                selleckchem_filters.add_client_search_params(drug)
-                results_s = selleckchem_step.process()
-
-                if results_s and not NO_DATA_MARKER in results_s["obtener_links_selleckchem"]:
-                    row_dict["Link Selleckchem"] = results_s["obtener_links_selleckchem"].iloc[0, 0]
-                    selleckchem_and_pharos_results.append(row_dict)
-
-        selleckchem_and_pharos_results = DataframesUtils.create_dataframe(selleckchem_and_pharos_results)
-        selleckchem_and_pharos_results = DataframesUtils.expand_comma_separated_column(
-            selleckchem_and_pharos_results,
-            "Link Selleckchem"
-        )
+        print(selleckchem_and_pharos_ligands)
         print("Fármacos Pharos+Selleckchem:")
-        print(selleckchem_and_pharos_results)
-
-        pharos_result["drugs"] = selleckchem_and_pharos_results
-
-        # Coger step de la lista de pasos
-        pharmacology_step = self.get_step("Pharmacology")
-        # Coger los filtros
-        pharmacology_filters = pharmacology_step.get_filters()
-        # Añadir parámetro de búsqueda
-        pharmacology_filters.add_client_search_params(self._search_param)
-        pharmacology_result = pharmacology_step.process()
+        print(selleckchem_and_pharos_drugs)
 
-        print(pharmacology_result.keys())
-
-        # Coger step de la lista de pasos
-        pharmgkb_step = self.get_step("Pharmgkb")
-        # Coger los filtros
-        pharmgkb_filters = pharmgkb_step.get_filters()
-        # Añadir parámetro de búsqueda
-        pharmgkb_filters.add_client_search_params(self._search_param)
-        pharmgkb_result = pharmgkb_step.process()
-        print(pharmgkb_result.keys())
-
-        # Coger step de la lista de pasos
-        ppiatlas_step = self.get_step("PPIAtlas")
-        # Coger los filtros
-        ppiatlas_filters = ppiatlas_step.get_filters()
-        # Añadir parámetro de búsqueda
-        ppiatlas_filters.add_client_search_params(self._search_param)
-        ppiatlas_result = ppiatlas_step.process()
-        print(ppiatlas_result.keys())
-
-        result = self._create_json(self._search_param, 
-                                   uniprot_result, 
-                                   ppiatlas_result, 
-                                   opentargets_result, 
-                                   panther_result, 
-                                   pharos_result, 
-                                   pharmgkb_result, 
-                                   pharmacology_result, 
-                                   drugcentral_result,
-                                   ensembl_result)
-        self.json_factory.save_to_file()
-
-        return result
+        return {
+            "drug_results": selleckchem_and_drugcentral_results,
+            "ligands": selleckchem_and_pharos_ligands,
+            "drugs": selleckchem_and_pharos_drugs
+        }
 
 
     def steps_execution(self)-> dict:
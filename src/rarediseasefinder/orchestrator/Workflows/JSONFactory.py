@@ -10,10 +10,16 @@ class JSONFactory:
     search_term: str
     date: str
 
-    def __init__(self,search_term: str = ""):
+    def __init__(self,search_term: str = "", output_dir: str = None):
         """
         Inicializa la estructura básica del JSON con las categorías predefinidas.
+
+        Args:
+            search_term (str): Término de búsqueda del informe.
+            output_dir (str, optional): Carpeta donde guardar los informes (por defecto get_default_dir()).
         """
+        self.output_dir = output_dir
+        self.saved_path = None
         # Definir las secciones principales del documento
         self.sections = [
             "DESCRIPCIÓN",
@@ -100,9 +106,22 @@ class JSONFactory:
         """
         return json.dumps(self.json_structure, indent=indent)
     
+    @staticmethod
+    def get_default_dir() -> str:
+        """
+        Devuelve la carpeta por defecto de los informes: tests/ en la raíz del proyecto (detectada automáticamente).
+
+        Returns:
+            str: Ruta de la carpeta.
+        """
+        import os
+        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
+        return os.path.join(base_dir, 'tests')
+
     def save_to_file(self, filepath: str = None) -> bool:
         """
-        Guarda el JSON en un archivo. Si no se especifica filepath, usa searchterm_fecha_hora.json en la raíz del proyecto (detectada automáticamente).
+        Guarda el JSON en un archivo. Si no se especifica filepath, usa searchterm_fecha_hora.json en output_dir
+        o, si no se ha indicado, en get_default_dir(). La ruta usada queda en saved_path.
         Sobrescribe el archivo si ya existe.
         Args:
             filepath (str): Ruta del archivo donde guardar el JSON
@@ -115,14 +134,12 @@ class JSONFactory:
             if not filepath:
                 searchterm = self.json_structure.get('search_term', 'resultado')
                 fecha = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-                # Detectar la raíz del proyecto automáticamente
-                base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
-                tests_dir = os.path.join(base_dir, 'tests')
                 filename = f"{searchterm}_{fecha}.json"
-                filepath = os.path.join(tests_dir, filename)
+                filepath = os.path.join(self.output_dir or self.get_default_dir(), filename)
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(self.json_structure, f, indent=2, ensure_ascii=False, default=str)
                 self.delete_json()  # Reiniciar la estructura después de guardar
+            self.saved_path = filepath
             print(f"\033[92mResultado guardado en: {filepath}\033[0m")
             return True
         except Exception as e:
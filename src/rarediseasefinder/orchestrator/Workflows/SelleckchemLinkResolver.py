@@ -0,0 +1,165 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from rarediseasefinder.core.ResponseCache import ResponseCache
+from rarediseasefinder.core.SingleFlight import SingleFlight
+from rarediseasefinder.core.constants import (
+    NO_DATA_MARKER,
+    SELLECKCHEM_LINKS_TTL,
+    SELLECKCHEM_NOT_FOUND_TTL,
+    SELLECKCHEM_MAX_WORKERS,
+)
+from ..IWorkflowStep import IWorkflowStep
+
+
+class SelleckchemLinkResolver:
+    """
+    Resuelve los enlaces de Selleckchem de un conjunto de nombres de fármacos.
+
+    Los nombres se normalizan y se deduplican, de modo que cada fármaco se busca una sola vez
+    aunque aparezca en varias tablas (DrugCentral, ligandos y fármacos de Pharos). Los resultados
+    se guardan en la caché persistente (ResponseCache), incluidas las búsquedas sin resultado y los
+    nombres IUPAC rechazados, y las búsquedas pendientes se lanzan en paralelo. Si otro resolvedor
+    (por ejemplo, el de otro gen del mismo lote) ya está buscando un fármaco, se espera a su resultado.
+    """
+
+    CACHE_NAMESPACE = "selleckchem-links"
+    LINKS_METHOD = "obtener_links_selleckchem"
+
+    # Búsquedas en curso en todo el proceso, por nombre normalizado
+    _searches = SingleFlight()
+
+    def __init__(self, selleckchem_step: IWorkflowStep, max_workers: int = SELLECKCHEM_MAX_WORKERS):
+        """
+        Inicializa el resolvedor.
+
+        Args:
+            selleckchem_step (IWorkflowStep): Paso de Selleckchem con sus filtros configurados.
+            max_workers (int): Número máximo de búsquedas simultáneas.
+        """
+        self.step = selleckchem_step
+        self.max_workers = max_workers
+        self.cache = ResponseCache.get_instance()
+
+    @staticmethod
+    def normalize(name) -> str:
+        """
+        Normaliza un nombre de fármaco para comparar y cachear (sin espacios extra, en minúsculas).
+
+        Args:
+            name: Nombre del fármaco.
+
+        Returns:
+            str: Nombre normalizado, o cadena vacía si no es un nombre válido.
+        """
+        if not isinstance(name, str):
+            return ""
+        return " ".join(name.split()).casefold()
+
+    def _get_cached(self, name: str) -> Optional[dict]:
+        entry = self.cache.get(self.CACHE_NAMESPACE, self.cache.make_key(name), ttl=SELLECKCHEM_LINKS_TTL)
+        if entry is None:
+            return None
+        payload, meta = entry
+        links = json.loads(payload)
+        # Las búsquedas sin resultado caducan antes que los enlaces encontrados
+        if not links and time.time() - meta.get("stored_at", 0) > SELLECKCHEM_NOT_FOUND_TTL:
+            return None
+        return {"links": links}
+
+    def _store(self, name: str, links: List[str]) -> None:
+        self.cache.put(self.CACHE_NAMESPACE, self.cache.make_key(name),
+                       json.dumps(links).encode("utf-8"), {"stored_at": time.time()})
+
+    def _search(self, name: str) -> Optional[List[str]]:
+        """
+        Busca un fármaco en Selleckchem con una copia de los filtros del paso.
+
+        Args:
+            name (str): Nombre del fármaco tal y como aparece en la tabla.
+
+        Returns:
+            Optional[List[str]]: Enlaces encontrados (lista vacía si no hay resultados) o None si
+                la búsqueda ha fallado por un error transitorio y no debe cachearse.
+        """
+        print("Buscando en Selleckchem: " + name)
+        processor = self.step.processor
+        filters = json.loads(self.step.get_filters().get_json_str())
+        filters[0]["CLIENT_SEARCH_PARAMS"] = [{"search_id": name}]
+
+        try:
+            data = processor.retrieve(name, filters)
+            if "error" in data and not data.get("not_found"):
+                return None
+            results = processor.parse_filters(data, filters).get(self.LINKS_METHOD)
+        except Exception as e:
+            print(f"❌ Error al buscar {name} en Selleckchem: {str(e)}")
+            return None
+
+        if results is None or NO_DATA_MARKER in results:
+            return []
+        links = results.iloc[0, 0]
+        if isinstance(links, str):
+            links = [link.strip() for link in links.split(",")]
+        return [link for link in links if link]
+
+    def _resolve_one(self, normalized: str, original: str) -> Optional[List[str]]:
+        """
+        Busca un fármaco y guarda el resultado, salvo que otra búsqueda lo haya guardado mientras tanto.
+
+        Args:
+            normalized (str): Nombre normalizado.
+            original (str): Nombre tal y como aparece en la tabla.
+
+        Returns:
+            Optional[List[str]]: Enlaces encontrados o None si la búsqueda ha fallado.
+        """
+        cached = self._get_cached(normalized)
+        if cached is not None:
+            return cached["links"]
+        links = self._search(original)
+        if links is not None:
+            self._store(normalized, links)
+        return links
+
+    def resolve(self, names: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Obtiene los enlaces de Selleckchem de una lista de nombres.
+
+        Args:
+            names (Iterable[str]): Nombres de fármacos (pueden repetirse).
+
+        Returns:
+            Dict[str, List[str]]: Enlaces por nombre normalizado. Los nombres sin resultado
+                tienen una lista vacía.
+        """
+        # Primer nombre original de cada nombre normalizado, para lanzar la búsqueda
+        originals = {}
+        for name in names:
+            normalized = self.normalize(name)
+            if normalized:
+                originals.setdefault(normalized, name.strip())
+
+        resolved: Dict[str, List[str]] = {}
+        pending = []
+        for normalized, original in originals.items():
+            cached = self._get_cached(normalized)
+            if cached is not None:
+                resolved[normalized] = cached["links"]
+            else:
+                pending.append(normalized)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                searches = pool.map(
+                    lambda normalized: self._searches.do(
+                        normalized, lambda: self._resolve_one(normalized, originals[normalized])
+                    ),
+                    pending,
+                )
+                for normalized, links in zip(pending, searches):
+                    resolved[normalized] = links or []
+
+        return resolved
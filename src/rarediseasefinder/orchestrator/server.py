@@ -1,15 +1,18 @@
 import json
 import logging
 
-from flask import Flask, abort, Response
+from flask import Flask, abort, Response, request
 from flask.views import MethodView
 from flask_smorest import Api, Blueprint
 from marshmallow import fields, Schema
 
 from .Orchestrator import Orchestrator
+from .JobManager import JobManager
 from .Workflows.FullWorkflow import FullWorkflow
 from .Workflows.NoPharosWorkflow import NoPharosWorkflow
 from .Workflows.NoPantherWorkflow import NoPantherWorkflow
+from ..core.HealthMonitor import HealthMonitor
+from ..core.RateLimiter import RateLimiter
 
 server = Flask(__name__)
 
@@ -27,6 +30,18 @@ class WorkflowListSchema(Schema):
         description = "Lista de workflows disponibles"
     workflows = fields.List(fields.Nested(WorkflowSchema), required=True)
 
+class ProviderHealthSchema(Schema):
+    status_code = fields.Int(required=True)
+    checked_at = fields.Float(allow_none=True)
+    elapsed = fields.Float(allow_none=True)
+    data_version = fields.Str(allow_none=True)
+
+class HealthSchema(Schema):
+    class Meta:
+        description = "Estado de los proveedores comprobado en segundo plano"
+    providers = fields.Dict(keys=fields.Str(), values=fields.Nested(ProviderHealthSchema))
+    rate_limits = fields.Dict(keys=fields.Str(), values=fields.Dict())
+
 class StepsAvailableSchema(Schema):
     are_steps_avaliable = fields.Bool(required=True)
 
@@ -88,6 +103,10 @@ class SetStage1Schema(Schema):
 # Schemas para parámetros de entrada
 class WorkflowNameQuerySchema(Schema):
     workflow_name = fields.Str(required=True)
+    session_token = fields.Str(load_default=None)
+
+class RunWorkflowQuerySchema(WorkflowNameQuerySchema):
+    refresh = fields.Bool(load_default=False)
 
 class WorkflowStepNameQuerySchema(Schema):
     workflow_step_name= fields.Str(required=True)
@@ -105,6 +124,42 @@ class FilterRequestSchema(Schema):
 class SearchParamRequestSchema(Schema):
     search_id = fields.Str(required=True)
 
+# Schemas para sesiones
+class SessionTokenQuerySchema(Schema):
+    session_token = fields.Str(load_default=None)
+
+class SessionSchema(Schema):
+    class Meta:
+        description = "Token de la sesión creada para configurar y ejecutar un workflow"
+    session_token = fields.Str(required=True)
+    workflow_name = fields.Str()
+
+# Schemas para jobs
+class JobIdQuerySchema(Schema):
+    job_id = fields.Str(required=True)
+
+class JobStepSchema(Schema):
+    status = fields.Str(required=True)
+    elapsed = fields.Float(allow_none=True)
+
+class JobStatusSchema(Schema):
+    class Meta:
+        description = "Estado de un job y de cada uno de sus steps (de cada gen en los lotes)"
+    job_id = fields.Str(required=True)
+    workflow_name = fields.Str(required=True)
+    genes = fields.List(fields.Str(), allow_none=True)
+    status = fields.Str(required=True)
+    steps = fields.Dict(keys=fields.Str(), values=fields.Nested(JobStepSchema))
+    created_at = fields.Float()
+    started_at = fields.Float(allow_none=True)
+    finished_at = fields.Float(allow_none=True)
+    elapsed = fields.Float(allow_none=True)
+    error = fields.Str(allow_none=True)
+
+# Schemas para lotes de genes
+class BatchRequestSchema(Schema):
+    genes = fields.List(fields.Str(), required=True)
+
 
 class APIConfig:
     API_TITLE = "RareDiseaseFinder_API"
@@ -120,8 +175,43 @@ api = Api(server)
 stage_1 = Blueprint("stage1", "__name__", url_prefix="/stage1",description="Get workflows info API")
 stage_2 = Blueprint("stage2", "__name__", url_prefix="/stage2",description="Set workflows params API")
 stage_3 = Blueprint("stage3", "__name__", url_prefix="/stage3",description="Process workflow API")
+jobs = Blueprint("jobs", "__name__", url_prefix="/jobs",description="Background workflow execution API")
+session = Blueprint("session", "__name__", url_prefix="/session",description="Workflow sessions API")
+batch = Blueprint("batch", "__name__", url_prefix="/batch",description="Multi-gene batch execution API")
 
 
+def get_session_token(query_args: dict) -> str | None:
+    """Token de sesión del parámetro session_token o de la cabecera X-Session-Token (None sin sesión)"""
+    return query_args.get("session_token") or request.headers.get("X-Session-Token")
+
+
+# Session endpoints
+@session.route("/create")
+class CreateSessionCollection(MethodView):
+    @session.arguments(WorkflowNameQuerySchema, location="query")
+    @session.response(status_code=201, schema=SessionSchema)
+    def post(self, workflow_args):
+        """Crea una sesión para configurar y ejecutar el workflow sin interferir con otros usuarios"""
+        workflow_name = workflow_args["workflow_name"]
+        logger.info(f"POST /session/create - Creando sesión para workflow {workflow_name}")
+        session_token = orchestrator.create_session(workflow_name)
+        if session_token is None:
+            logger.error(f"POST /session/create - Workflow {workflow_name} no encontrado")
+            abort(404, description=f"Workflow '{workflow_name}' not found")
+        return {"session_token": session_token, "workflow_name": workflow_name}
+
+@session.route("/close")
+class CloseSessionCollection(MethodView):
+    @session.arguments(SessionTokenQuerySchema, location="query")
+    def post(self, session_args):
+        """Elimina una sesión"""
+        session_token = get_session_token(session_args)
+        if not session_token:
+            abort(400, description="session_token is required")
+        orchestrator.close_session(session_token)
+        logger.info("POST /session/close - Sesión eliminada")
+        return {"message": "Session closed"}
+
 @stage_1.route("/get_workflows")
 class TodoCollection(MethodView):
     @stage_1.response(status_code=200, schema=WorkflowListSchema)
@@ -136,6 +226,15 @@ class TodoCollection(MethodView):
             logger.error(f"GET /stage1/get_workflows - Error: {str(e)}")
             abort(500, description=str(e))
 
+@stage_1.route("/health")
+class HealthCollection(MethodView):
+    @stage_1.response(status_code=200, schema=HealthSchema)
+    def get(self):
+        """Obtiene el último estado comprobado de cada proveedor, con la fecha de la comprobación"""
+        logger.info("GET /stage1/health - Solicitando estado de los proveedores")
+        return {"providers": HealthMonitor.get_instance().get_stats(),
+                "rate_limits": RateLimiter.get_instance().get_stats()}
+
 @stage_1.route("/steps_available")
 class StepsAvailableCollection(MethodView):
     @stage_1.arguments(WorkflowNameQuerySchema, location="query")
@@ -145,7 +244,7 @@ class StepsAvailableCollection(MethodView):
         workflow_name = query_args["workflow_name"]
         logger.info(f"GET /stage1/steps_available - Verificando disponibilidad de steps para workflow: {workflow_name}")
         try:
-            workflows_data = orchestrator.get_if_all_steps_available(workflow_name)
+            workflows_data = orchestrator.get_if_all_steps_available(workflow_name, get_session_token(query_args))
             logger.info(f"GET /stage1/steps_available - Workflow {workflow_name} - Steps disponibles: {workflows_data}")
             return {"are_steps_avaliable": workflows_data}
         except Exception as e:
@@ -161,7 +260,7 @@ class ListOfStepsCollection(MethodView):
         workflow_name = query_args["workflow_name"]
         logger.info(f"GET /stage1/list_steps - Solicitando lista de steps para workflow: {workflow_name}")
         try:
-            workflows_data = orchestrator.get_list_of_steps_names(workflow_name)
+            workflows_data = orchestrator.get_list_of_steps_names(workflow_name, get_session_token(query_args))
             logger.info(f"GET /stage1/list_steps - Workflow {workflow_name} tiene {len(workflows_data) if isinstance(workflows_data, list) else 'N/A'} steps")
             return {"steps": workflows_data}
         except Exception as e:
@@ -179,7 +278,7 @@ class MinimumMethodsCollection(MethodView):
         workflow_step = step_args["workflow_step_name"]
         logger.info(f"GET /stage1/minimum_methods - Solicitando métodos mínimos para step: {workflow_step} en workflow: {workflow_name}")
         try:
-            methods_data = orchestrator.get_minium_methods_for_step_from_workflow(workflow_step,workflow_name)
+            methods_data = orchestrator.get_minium_methods_for_step_from_workflow(workflow_step,workflow_name, get_session_token(workflow_args))
             logger.info(f"GET /stage1/minimum_methods - Encontrados métodos mínimos para {workflow_step}: {methods_data}")
             print(methods_data)
             return {"minimum_methods":[methods_data]}
@@ -198,7 +297,7 @@ class OptionalMethodsCollection(MethodView):
         workflow_step = step_args["workflow_step_name"]
         logger.info(f"GET /stage1/optional_methods - Solicitando métodos opcionales para step: {workflow_step} en workflow: {workflow_name}")
         try:
-            methods_data = orchestrator.get_optional_methods_from_workflow(workflow_step,workflow_name)
+            methods_data = orchestrator.get_optional_methods_from_workflow(workflow_step,workflow_name, get_session_token(workflow_args))
             logger.info(f"GET /stage1/optional_methods - Encontrados métodos opcionales para {workflow_step}: {methods_data}")
             print(methods_data)
             return {"optional_methods": [methods_data]}
@@ -221,7 +320,7 @@ class MethodsFiltersCollection(MethodView):
         try:
             workflow_step_method_name = workflow_step_method_name["workflow_step_method_name"]
             print(workflow_step_method_name,workflow_step,workflow_name)
-            filters_data = orchestrator.get_method_filters(workflow_step_method_name,workflow_step,workflow_name)
+            filters_data = orchestrator.get_method_filters(workflow_step_method_name,workflow_step,workflow_name, get_session_token(workflow_args))
             logger.info(f"GET /stage1/methods_filters - Filtros encontrados para {method_name}: {len(filters_data) if filters_data else 0} filtros")
             print(filters_data.values())
             return {"filters": filters_data}
@@ -238,7 +337,7 @@ class SetStage2(MethodView):
         workflow_name = workflow_args["workflow_name"]
         logger.info(f"GET /stage1/set_stage_2 - Cambiando workflow {workflow_name} a stage 2")
         try:
-            orchestrator.set_stage_2(workflow_name)
+            orchestrator.set_stage_2(workflow_name, get_session_token(workflow_args))
             logger.info(f"GET /stage1/set_stage_2 - Workflow {workflow_name} cambiado exitosamente a stage 2")
             return {f"{workflow_name} set to stage_2"}
         except Exception as e:
@@ -259,7 +358,7 @@ class SetOptionalMethodCollection(MethodView):
         selected_method = json_data["selected_optional_method"]
         logger.info(f"POST /stage2/set_optional_method - Estableciendo método opcional {selected_method} para step {workflow_step} en workflow {workflow_name}")
         try:
-            orchestrator.set_selected_optional_method(selected_method, workflow_step, workflow_name)
+            orchestrator.set_selected_optional_method(selected_method, workflow_step, workflow_name, get_session_token(workflow_args))
             logger.info(f"POST /stage2/set_optional_method - Método opcional {selected_method} establecido exitosamente")
             return {"message": f"Optional method {selected_method} set for step {workflow_step}"}
         except Exception as e:
@@ -281,7 +380,7 @@ class SetFilterCollection(MethodView):
         filters = json_data["filters"]
         logger.info(f"POST /stage2/set_filter - Aplicando filtros al método {method_name} en step {workflow_step} workflow {workflow_name}")
         try:
-            orchestrator.set_filter_to_method(filters, method_name, workflow_step, workflow_name)
+            orchestrator.set_filter_to_method(filters, method_name, workflow_step, workflow_name, get_session_token(workflow_args))
             logger.info(f"POST /stage2/set_filter - Filtros aplicados exitosamente al método {method_name}")
             return {"message": f"Filter applied to method {method_name} in step {workflow_step}"}
         except Exception as e:
@@ -300,7 +399,7 @@ class SetSearchParamCollection(MethodView):
         logger.info(f"POST /stage2/set_search_param - Estableciendo parámetro de búsqueda '{search_term}' para workflow {workflow_name}")
         try:
             search_term = search_term.upper()
-            orchestrator.set_workflow_search_param(search_term, workflow_name)
+            orchestrator.set_workflow_search_param(search_term, workflow_name, get_session_token(workflow_args))
             logger.info(f"POST /stage2/set_search_param - Parámetro de búsqueda establecido exitosamente para {workflow_name}")
             return {"message": f"Search parameter '{search_term}' set for workflow {workflow_name}"}
         except Exception as e:
@@ -316,7 +415,7 @@ class SetStage3Collection(MethodView):
         workflow_name = workflow_args["workflow_name"]
         logger.info(f"POST /stage2/set_stage_3 - Cambiando workflow {workflow_name} a stage 3")
         try:
-            orchestrator.set_stage_3(workflow_name)
+            orchestrator.set_stage_3(workflow_name, get_session_token(workflow_args))
             logger.info(f"POST /stage2/set_stage_3 - Workflow {workflow_name} cambiado exitosamente a stage 3")
             return {"message": f"Workflow {workflow_name} set to stage 3"}
         except Exception as e:
@@ -326,14 +425,16 @@ class SetStage3Collection(MethodView):
 # Stage 3 endpoints
 @stage_3.route("/start_workflow")
 class StartWorkflowCollection(MethodView):
-    @stage_3.arguments(WorkflowNameQuerySchema, location="query")
+    @stage_3.arguments(RunWorkflowQuerySchema, location="query")
     def post(self, workflow_args):
-        """Inicia la ejecución del workflow y devuelve el resultado JSON sin schema predefinido CAMBIA A STAGE_1 AUTOMÁTICAMENTE"""
+        """Inicia la ejecución del workflow y devuelve el resultado JSON sin schema predefinido (o el informe guardado de la misma búsqueda si es reciente y no se pide refresh) CAMBIA A STAGE_1 AUTOMÁTICAMENTE"""
         workflow_name = workflow_args["workflow_name"]
+        session_token = get_session_token(workflow_args)
         logger.info(f"POST /stage3/start_workflow - Iniciando ejecución del workflow {workflow_name}")
         try:
-            results = orchestrator.start_workflow(workflow_name)
-            orchestrator.set_stage_1(workflow_name)
+            results = orchestrator.start_workflow(workflow_name, session_token=session_token,
+                                                  use_report_cache=not workflow_args["refresh"])
+            orchestrator.set_stage_1(workflow_name, session_token)
             logger.info(f"POST /stage3/start_workflow - Workflow {workflow_name} iniciado exitosamente")
             
             response_data = {
@@ -354,7 +455,7 @@ class StartWorkflowCollection(MethodView):
         except Exception as e:
             logger.error(f"POST /stage3/start_workflow - Error al iniciar workflow {workflow_name}: {str(e)}")
             logger.error(f"Reseteando workflow {workflow_name} a stage 1 debido al error")
-            orchestrator.set_stage_1(workflow_name)
+            orchestrator.set_stage_1(workflow_name, session_token)
             return {
                 "error_message" : "Search_ID inválido, no se han encontrado resultados."
             }, 500
@@ -368,17 +469,121 @@ class ResetToStage1Collection(MethodView):
         workflow_name = workflow_args["workflow_name"]
         logger.info(f"POST /stage3/set_stage_1 - Reseteando workflow {workflow_name} a stage 1")
         try:
-            orchestrator.set_stage_1(workflow_name)
+            orchestrator.set_stage_1(workflow_name, get_session_token(workflow_args))
             logger.info(f"POST /stage3/set_stage_1 - Workflow {workflow_name} reseteado exitosamente a stage 1")
             return {"message": f"Workflow {workflow_name} reset to stage 1"}
         except Exception as e:
             logger.error(f"POST /stage3/set_stage_1 - Error al resetear workflow {workflow_name}: {str(e)}")
             abort(500, description=str(e))
 
+# Jobs endpoints
+@jobs.route("/submit")
+class SubmitJobCollection(MethodView):
+    @jobs.arguments(RunWorkflowQuerySchema, location="query")
+    @jobs.response(status_code=202, schema=JobStatusSchema)
+    def post(self, workflow_args):
+        """Encola la ejecución del workflow (en stage 3) y devuelve el id del job inmediatamente. CAMBIA A STAGE_1 AL TERMINAR"""
+        workflow_name = workflow_args["workflow_name"]
+        logger.info(f"POST /jobs/submit - Encolando ejecución del workflow {workflow_name}")
+        try:
+            job = job_manager.submit(workflow_name, get_session_token(workflow_args),
+                                     use_report_cache=not workflow_args["refresh"])
+            logger.info(f"POST /jobs/submit - Workflow {workflow_name} encolado con job_id {job.job_id}")
+            return job.to_dict()
+        except KeyError as e:
+            logger.error(f"POST /jobs/submit - Workflow {workflow_name} no encontrado: {str(e)}")
+            abort(404, description=str(e))
+        except Exception as e:
+            logger.error(f"POST /jobs/submit - Error al encolar workflow {workflow_name}: {str(e)}")
+            abort(409, description=str(e))
+
+@jobs.route("/status")
+class JobStatusCollection(MethodView):
+    @jobs.arguments(JobIdQuerySchema, location="query")
+    @jobs.response(status_code=200, schema=JobStatusSchema)
+    def get(self, job_args):
+        """Obtiene el estado del job y de cada step (pendiente, en ejecución, terminado o fallido) con sus tiempos"""
+        job_id = job_args["job_id"]
+        try:
+            return job_manager.status(job_id)
+        except KeyError as e:
+            logger.error(f"GET /jobs/status - Job {job_id} no encontrado")
+            abort(404, description=str(e))
+
+@jobs.route("/result")
+class JobResultCollection(MethodView):
+    @jobs.arguments(JobIdQuerySchema, location="query")
+    def get(self, job_args):
+        """Obtiene el informe JSON de un job terminado"""
+        job_id = job_args["job_id"]
+        logger.info(f"GET /jobs/result - Solicitando resultado del job {job_id}")
+        try:
+            job = job_manager.get_job(job_id)
+        except KeyError as e:
+            logger.error(f"GET /jobs/result - Job {job_id} no encontrado")
+            abort(404, description=str(e))
+
+        if job.status != "completed":
+            return {
+                "job_id": job_id,
+                "status": job.status,
+                "error_message": job.error or f"El job {job_id} no ha terminado correctamente ({job.status})",
+            }, 409
+
+        response_data = {
+            "workflow_name": job.workflow_name,
+            "job_id": job_id,
+            "status": "completed",
+            "results": job.result,
+        }
+        json_response = json.dumps(response_data, sort_keys=False, ensure_ascii=False)
+        return Response(json_response, status=200, mimetype='application/json')
+
+@jobs.route("/cancel")
+class CancelJobCollection(MethodView):
+    @jobs.arguments(JobIdQuerySchema, location="query")
+    @jobs.response(status_code=200, schema=JobStatusSchema)
+    def post(self, job_args):
+        """Cancela un job. Los steps en ejecución terminan, pero no se inicia ninguno más"""
+        job_id = job_args["job_id"]
+        logger.info(f"POST /jobs/cancel - Cancelando job {job_id}")
+        try:
+            return job_manager.cancel(job_id)
+        except KeyError as e:
+            logger.error(f"POST /jobs/cancel - Job {job_id} no encontrado")
+            abort(404, description=str(e))
+
+# Batch endpoints
+@batch.route("/submit")
+class SubmitBatchCollection(MethodView):
+    @batch.arguments(RunWorkflowQuerySchema, location="query")
+    @batch.arguments(BatchRequestSchema)
+    @batch.response(status_code=202, schema=JobStatusSchema)
+    def post(self, workflow_args, json_data):
+        """Encola la ejecución del workflow para una lista de genes con su configuración actual. Cada gen se consulta en /jobs/status como un step y /jobs/result devuelve el resumen con la ruta del informe de cada gen"""
+        workflow_name = workflow_args["workflow_name"]
+        genes = json_data["genes"]
+        logger.info(f"POST /batch/submit - Encolando lote de {len(genes)} genes para workflow {workflow_name}")
+        try:
+            job = job_manager.submit_batch(workflow_name, genes, get_session_token(workflow_args),
+                                           use_report_cache=not workflow_args["refresh"])
+            logger.info(f"POST /batch/submit - Lote encolado con job_id {job.job_id}")
+            return job.to_dict()
+        except KeyError as e:
+            logger.error(f"POST /batch/submit - Workflow {workflow_name} no encontrado: {str(e)}")
+            abort(404, description=str(e))
+        except ValueError as e:
+            logger.error(f"POST /batch/submit - Lista de genes no válida: {str(e)}")
+            abort(400, description=str(e))
+
 #Debajo del proyecto
 api.register_blueprint(stage_1)
 api.register_blueprint(stage_2)
 api.register_blueprint(stage_3)
+api.register_blueprint(jobs)
+api.register_blueprint(session)
+api.register_blueprint(batch)
 
 workflows_instances = [FullWorkflow(), NoPharosWorkflow(), NoPantherWorkflow()]
 orchestrator = Orchestrator(workflows_instances)
+job_manager = JobManager(orchestrator)